@@ -82,6 +82,10 @@ ARGS_HYPEROPT = [
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
     "early_stop",
+    "hyperopt_cache",
+    "hyperopt_resume",
+    "hyperopt_worker_max_epochs",
+    "hyperopt_worker_max_rss",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -166,6 +170,7 @@ ARGS_DOWNLOAD_DATA = [
     "new_pairs_days",
     "include_inactive",
     "no_parallel_download",
+    "download_workers",
     "timerange",
     "download_trades",
     "convert_trades",
@@ -305,6 +305,35 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "hyperopt_cache": Arg(
+        "--hyperopt-cache",
+        help="Cache epoch results on disk and reuse them for repeated parameter combinations "
+        "(also across hyperopt runs with identical strategy, configuration and data).",
+        action="store_true",
+        default=False,
+    ),
+    "hyperopt_worker_max_epochs": Arg(
+        "--worker-max-epochs",
+        help="Restart hyperopt worker processes once a worker evaluated this many epochs. "
+        "Releases memory accumulated by long running workers.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "hyperopt_worker_max_rss": Arg(
+        "--worker-max-memory",
+        help="Restart hyperopt worker processes once a worker uses more than this amount "
+        "of memory (RSS, in MB).",
+        type=check_int_positive,
+        metavar="MB",
+    ),
+    "hyperopt_resume": Arg(
+        "--resume",
+        help="Continue a previous hyperopt run from the given result file "
+        "(filename only, located in `user_data/hyperopt_results`). "
+        "Requires the same strategy and spaces. New epochs are appended to this file. "
+        "Example: `--resume=strategy_MyStrategy_2024-01-01_10-00-00.fthypt`",
+        metavar="FILENAME",
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
@@ -467,6 +496,13 @@ AVAILABLE_CLI_OPTIONS = {
         help="Disable parallel startup download. Only use this if you experience issues.",
         action="store_true",
     ),
+    "download_workers": Arg(
+        "--download-workers",
+        help="Download this many pairs and timeframes concurrently, resuming interrupted "
+        "downloads. By default, pairs are downloaded one after the other.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "new_pairs_days": Arg(
         "--new-pairs-days",
         help="Download data of new pairs for given number of days. Default: `%(default)s`.",
@@ -83,6 +83,7 @@ def start_convert_trades(args: dict[str, Any]) -> None:
         data_format_ohlcv=config["dataformat_ohlcv"],
         data_format_trades=config["dataformat_trades"],
         candle_type=config.get("candle_type_def", CandleType.SPOT),
+        workers=config.get("dataload_workers"),
     )
 
 
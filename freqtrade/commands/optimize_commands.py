@@ -142,9 +142,11 @@ def start_lookahead_analysis(args: dict[str, Any]) -> None:
     :return: None
     """
     from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.data.history.history_cache import pair_history_cache
     from freqtrade.optimize.analysis.lookahead_helpers import LookaheadAnalysisSubFunctions
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+    pair_history_cache.configure(config)
     LookaheadAnalysisSubFunctions.start(config)
 
 
@@ -155,7 +157,9 @@ def start_recursive_analysis(args: dict[str, Any]) -> None:
     :return: None
     """
     from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.data.history.history_cache import pair_history_cache
     from freqtrade.optimize.analysis.recursive_helpers import RecursiveAnalysisSubFunctions
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+    pair_history_cache.configure(config)
     RecursiveAnalysisSubFunctions.start(config)
@@ -8,9 +8,11 @@ def start_webserver(args: dict[str, Any]) -> None:
     Main entry point for webserver mode
     """
     from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.data.history.history_cache import pair_history_cache
     from freqtrade.rpc.api_server import ApiServer
 
     # Initialize configuration
 
     config = setup_utils_configuration(args, RunMode.WEBSERVER)
+    pair_history_cache.configure(config)
     ApiServer(config, standalone=True)
@@ -105,6 +105,21 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "incremental_lookback": {
+            "description": (
+                "Number of candles indicators look back - analyze only new candles plus this "
+                f"many candles. {__IN_STRATEGY}"
+            ),
+            "type": "integer",
+            "minimum": 0,
+        },
+        "incremental_validation_interval": {
+            "description": (
+                f"Compare every nth incremental analysis with a full analysis. {__IN_STRATEGY}"
+            ),
+            "type": "integer",
+            "minimum": 0,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -738,6 +753,20 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "candle_close_wakeup": {
+                    "description": "Start the next iteration once new candles arrived via "
+                    "websocket.",
+                    "type": "boolean",
+                },
+                "pipelined_analysis": {
+                    "description": "Analyze pairs while candles of other pairs are refreshed.",
+                    "type": "boolean",
+                },
+                "analysis_workers": {
+                    "description": "Number of threads to analyze pairs concurrently.",
+                    "type": "integer",
+                    "minimum": 1,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -752,6 +781,40 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "download_workers": {
+            "description": (
+                "Number of pairs and timeframes `download-data` downloads concurrently. "
+                "Interrupted downloads are resumed. Downloads sequentially if not set."
+            ),
+            "type": "integer",
+            "minimum": 1,
+        },
+        "dataload_workers": {
+            "description": (
+                "Number of pairs to load in parallel when loading historic data "
+                "(backtesting, hyperopt, plotting, FreqAI) or converting trades to OHLCV. "
+                "Defaults to the number of CPUs (max. 8)."
+            ),
+            "type": "integer",
+            "minimum": 1,
+        },
+        "dataload_cache_size": {
+            "description": (
+                "Memory (in MB) used to cache loaded pair histories in the webserver, "
+                "lookahead-analysis and recursive-analysis. 0 disables the cache."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 1024,
+        },
+        "dataload_resample": {
+            "description": (
+                "Build timeframes without data on disk from a smaller timeframe "
+                "when loading historic data."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "position_adjustment_enable": {
             "description": f"Enable position adjustment. {__IN_STRATEGY}",
             "type": "boolean",
@@ -899,6 +962,14 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": False,
                 },
+                "bulk_order_polling": {
+                    "description": (
+                        "Fetch open orders in bulk once per iteration, "
+                        "instead of one request per open order."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
                 "enable_ws": {
                     "description": "Enable WebSocket connections to the exchange.",
                     "type": "boolean",
@@ -918,6 +989,15 @@ CONF_SCHEMA = {
                     "type": "integer",
                     "default": 60,
                 },
+                "archive_cache": {
+                    "description": (
+                        "Keep archives downloaded from data.binance.vision in the "
+                        "`.archive_cache` directory within the data directory, "
+                        "so they're not downloaded again."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
                 "ccxt_config": {"description": "CCXT configuration settings.", "type": "object"},
                 "ccxt_async_config": {
                     "description": (
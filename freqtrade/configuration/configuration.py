@@ -343,6 +343,13 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_cache", "Parameter --hyperopt-cache detected."),
+            ("hyperopt_resume", "Parameter --resume detected, resuming from {} ..."),
+            (
+                "hyperopt_worker_max_epochs",
+                "Parameter --worker-max-epochs detected: {}",
+            ),
+            ("hyperopt_worker_max_rss", "Parameter --worker-max-memory detected: {} MB"),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
@@ -403,6 +410,7 @@ class Configuration:
             ("days", "Detected --days: {}"),
             ("include_inactive", "Detected --include-inactive-pairs: {}"),
             ("no_parallel_download", "Detected --no-parallel-download: {}"),
+            ("download_workers", "Detected --download-workers: {}"),
             ("download_trades", "Detected --dl-trades: {}"),
             ("convert_trades", "Detected --convert: {} - Converting Trade data to OHCV {}"),
             ("dataformat_ohlcv", 'Using "{}" to store OHLCV data.'),
@@ -2,6 +2,7 @@ from freqtrade.data.converter.converter import (
     clean_ohlcv_dataframe,
     convert_ohlcv_format,
     ohlcv_fill_up_missing_data,
+    ohlcv_resample,
     ohlcv_to_dataframe,
     order_book_to_dataframe,
     reduce_dataframe_footprint,
@@ -13,10 +14,13 @@ from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
     trades_convert_types,
+    trades_df_merge,
+    trades_df_new_trades,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_list_to_df,
     trades_to_ohlcv,
+    trades_to_ohlcv_chunked,
 )
 
 
@@ -24,6 +28,7 @@ __all__ = [
     "clean_ohlcv_dataframe",
     "convert_ohlcv_format",
     "ohlcv_fill_up_missing_data",
+    "ohlcv_resample",
     "ohlcv_to_dataframe",
     "order_book_to_dataframe",
     "reduce_dataframe_footprint",
@@ -33,8 +38,11 @@ __all__ = [
     "convert_trades_to_ohlcv",
     "populate_dataframe_with_trades",
     "trades_convert_types",
+    "trades_df_merge",
+    "trades_df_new_trades",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
     "trades_list_to_df",
     "trades_to_ohlcv",
+    "trades_to_ohlcv_chunked",
 ]
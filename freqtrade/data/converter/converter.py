@@ -7,6 +7,7 @@ import logging
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, to_datetime
+from pandas.tseries.frequencies import to_offset
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, Config
 from freqtrade.enums import CandleType, TradingMode
@@ -134,6 +135,44 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     return df
 
 
+def ohlcv_resample(dataframe: DataFrame, base_timeframe: str, timeframe: str) -> DataFrame:
+    """
+    Resample candle (OHLCV) data to a higher timeframe.
+    Candles at the start and end of the data which are only partially covered by
+    base_timeframe candles are removed.
+    :param dataframe: Dataframe with ohlcv data in base_timeframe
+    :param base_timeframe: Timeframe of dataframe (e.g. "1m")
+    :param timeframe: Timeframe to resample to (e.g. "1h") - a multiple of base_timeframe
+    :return: Dataframe with ohlcv data in timeframe
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    if dataframe.empty:
+        return dataframe.loc[:, DEFAULT_DATAFRAME_COLUMNS].copy()
+
+    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    resample_interval = timeframe_to_resample_freq(timeframe)
+    df = (
+        dataframe.resample(
+            resample_interval, on="date", closed="left", label="left", origin="epoch"
+        )
+        .agg(ohlcv_dict)
+        .dropna(subset=["open"])
+        .reset_index()
+    )
+    if df.empty:
+        return df
+
+    base_td = pd.Timedelta(seconds=timeframe_to_seconds(base_timeframe))
+    if dataframe["date"].iloc[0] > df["date"].iloc[0]:
+        df = df.iloc[1:]
+    if not df.empty and dataframe["date"].iloc[-1] + base_td < df["date"].iloc[-1] + to_offset(
+        resample_interval
+    ):
+        df = df.iloc[:-1]
+    return df.reset_index(drop=True)
+
+
 def trim_dataframe(
     df: DataFrame, timerange, *, df_date_col: str = "date", startup_candles: int = 0
 ) -> DataFrame:
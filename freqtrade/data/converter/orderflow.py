@@ -4,7 +4,6 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -110,71 +109,42 @@ def populate_dataframe_with_trades(
         trades.reset_index(inplace=True, drop=True)
 
         # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        group_codes, candle_starts = pd.factorize(trades["candle_start"], sort=True)
+        # there can only be one row with the same date
+        rows = _first_positions(dataframe["date"], candle_starts)
+        cache_rows = (
+            _first_positions(cached_grouped_trades["date"], candle_starts)
+            if cached_grouped_trades is not None
+            else np.full(len(candle_starts), -1)
+        )
+        columns = {
+            col: dataframe[col].to_numpy(
+                dtype=object if dataframe[col].dtype == object else "float64", copy=True
+            )
+            for col in ORDERFLOW_ADDED_COLUMNS
+        }
+
+        # Candles which are already in the cache
+        from_cache = (rows >= 0) & (cache_rows >= 0)
+        if from_cache.any() and cached_grouped_trades is not None:
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                cached_values = cached_grouped_trades[col].to_numpy()
+                for row, cache_row in zip(rows[from_cache], cache_rows[from_cache], strict=True):
+                    columns[col][row] = cached_values[cache_row]
+
+        to_calculate = (rows >= 0) & (cache_rows < 0)
+        if to_calculate.any():
+            _populate_orderflow_columns(
+                columns,
+                trades,
+                group_codes,
+                rows[to_calculate],
+                np.flatnonzero(to_calculate),
+                config_orderflow,
+            )
+
+        for col, values in columns.items():
+            dataframe[col] = values
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
@@ -188,6 +158,156 @@ def populate_dataframe_with_trades(
     return dataframe, cached_grouped_trades
 
 
+def _first_positions(dates: pd.Series, keys: pd.Index) -> np.ndarray:
+    """
+    Position of the first occurrence of each key in dates, -1 if the key is missing.
+    """
+    date_index = pd.Index(dates)
+    first = ~date_index.duplicated()
+    positions = date_index[first].get_indexer(keys)
+    return np.where(positions >= 0, np.flatnonzero(first)[positions], -1)
+
+
+def _populate_orderflow_columns(
+    columns: dict[str, np.ndarray],
+    trades: pd.DataFrame,
+    group_codes: np.ndarray,
+    rows: np.ndarray,
+    groups: np.ndarray,
+    config_orderflow: dict,
+) -> None:
+    """
+    Calculate orderflow columns for all candles at once.
+    Trades are sorted by candle, so every candle is a contiguous slice of the sorted arrays.
+    The results are identical to calculating each candle on its own, using
+    trades_to_volumeprofile_with_total_delta_bid_ask, trades_orderflow_to_imbalances and
+    stacked_imbalance.
+    :param columns: Values of ORDERFLOW_ADDED_COLUMNS for each dataframe row - updated in place
+    :param trades: Trades, including the "candle_start" and "candle_end" columns
+    :param group_codes: Candle (group) of each trade
+    :param rows: Dataframe row of each group to calculate
+    :param groups: Groups to calculate
+    """
+    # Candle of each trade, counting only candles to calculate (-1 for all other trades)
+    candle_of_group = np.full(group_codes.max() + 1, -1)
+    candle_of_group[groups] = np.arange(len(groups))
+    candle = candle_of_group[group_codes]
+    # stable sort keeps the order of trades within each candle
+    order = np.argsort(candle, kind="stable")[np.count_nonzero(candle < 0) :]
+    trades = trades.iloc[order].reset_index(drop=True)
+    candle = candle[order]
+    starts = np.flatnonzero(np.diff(candle, prepend=-1))
+    ends = np.append(starts[1:], len(candle))
+
+    records = trades.drop(columns=["candle_start", "candle_end"]).to_dict(orient="records")
+    for row, start, end in zip(rows, starts, ends, strict=True):
+        columns["trades"][row] = records[start:end]
+
+    is_sell = trades["side"].str.contains("sell").to_numpy()
+    is_buy = trades["side"].str.contains("buy").to_numpy()
+    amount = trades["amount"]
+    bid = np.where(is_sell, amount, 0)
+    ask = np.where(is_buy, amount, 0)
+    deltas_per_trade = ask - bid
+    for row, start, end in zip(rows, starts, ends, strict=True):
+        # Plain (uncompensated) sums, to match the results of per-candle calculation
+        cumulative_delta = deltas_per_trade[start:end].cumsum()
+        columns["max_delta"][row] = cumulative_delta.max()
+        columns["min_delta"][row] = cumulative_delta.min()
+        columns["bid"][row] = bid[start:end].sum()
+        columns["ask"][row] = ask[start:end].sum()
+    columns["delta"][rows] = columns["ask"][rows] - columns["bid"][rows]
+    columns["total_trades"][rows] = ends - starts
+
+    # Volume profile of all candles - indexed by (candle, level)
+    scale = config_orderflow["scale"]
+    bid_count = np.where(is_sell, 1, 0)
+    ask_count = np.where(is_buy, 1, 0)
+    orderflow = (
+        pd.DataFrame(
+            {
+                "candle": candle,
+                "level": ((trades["price"] / scale).round() * scale).astype("float64").to_numpy(),
+                "bid": bid_count,
+                "ask": ask_count,
+                "delta": deltas_per_trade,
+                "bid_amount": bid,
+                "ask_amount": ask,
+                "total_volume": ask + bid,
+                "total_trades": ask_count + bid_count,
+            }
+        )
+        .groupby(["candle", "level"])
+        .sum()
+    )
+    level_candle = orderflow.index.get_level_values("candle").to_numpy()
+    levels = orderflow.index.get_level_values("level").to_numpy()
+    level_starts = np.flatnonzero(np.diff(level_candle, prepend=-1))
+    level_ends = np.append(level_starts[1:], len(levels))
+
+    # Imbalances - comparing bid and ask diagonally within each candle
+    next_ask = orderflow["ask"].groupby(level="candle").shift(-1)
+    low_volume = orderflow["total_volume"] < config_orderflow["imbalance_volume"]
+    imbalance_ratio = config_orderflow["imbalance_ratio"]
+    bid_imbalance = np.where(low_volume, False, (orderflow["bid"] / next_ask) > imbalance_ratio)
+    ask_imbalance = np.where(low_volume, False, (next_ask / orderflow["bid"]) > imbalance_ratio)
+
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    stacked = {
+        label: _stacked_imbalance_positions(
+            imbalance, level_candle, len(rows), stacked_imbalance_range
+        )
+        for label, imbalance in (("bid", bid_imbalance), ("ask", ask_imbalance))
+    }
+
+    orderflow_columns = orderflow.columns.tolist()
+    level_list = levels.tolist()
+    orderflow_values = list(
+        zip(*(orderflow[col].tolist() for col in orderflow_columns), strict=True)
+    )
+    imbalance_values = list(zip(bid_imbalance.tolist(), ask_imbalance.tolist(), strict=True))
+    for idx, (row, start, end) in enumerate(zip(rows, level_starts, level_ends, strict=True)):
+        columns["orderflow"][row] = {
+            level: dict(zip(orderflow_columns, values, strict=True))
+            for level, values in zip(
+                level_list[start:end], orderflow_values[start:end], strict=True
+            )
+        }
+        columns["imbalances"][row] = {
+            level: {"bid_imbalance": bid_imb, "ask_imbalance": ask_imb}
+            for level, (bid_imb, ask_imb) in zip(
+                level_list[start:end], imbalance_values[start:end], strict=True
+            )
+        }
+        for label in ("bid", "ask"):
+            columns[f"stacked_imbalances_{label}"][row] = [
+                levels[pos - (stacked_imbalance_range - 1)] for pos in stacked[label][idx]
+            ]
+
+
+def _stacked_imbalance_positions(
+    imbalance: np.ndarray, candle: np.ndarray, candle_count: int, stacked_imbalance_range: int
+) -> list[list[int]]:
+    """
+    Vectorized version of stacked_imbalance for multiple candles.
+    :param imbalance: Imbalance flag per level, levels sorted by candle and price
+    :param candle: Candle of each level
+    :param candle_count: Number of candles
+    :return: Per candle, the positions of levels ending a stack of at least
+             stacked_imbalance_range imbalances.
+    """
+    # Count consecutive imbalances - restarting at every change and for every candle
+    new_run = np.diff(imbalance.astype(np.int8), prepend=-1) != 0
+    new_run |= np.diff(candle, prepend=-1) != 0
+    run_start = np.maximum.accumulate(np.where(new_run, np.arange(len(imbalance)), 0))
+    counts = np.where(imbalance, np.arange(len(imbalance)) - run_start + 1, 0)
+
+    positions: list[list[int]] = [[] for _ in range(candle_count)]
+    for pos in np.flatnonzero(counts >= stacked_imbalance_range).tolist():
+        positions[candle[pos]].append(pos)
+    return positions
+
+
 def trades_to_volumeprofile_with_total_delta_bid_ask(
     trades: pd.DataFrame, scale: float
 ) -> pd.DataFrame:
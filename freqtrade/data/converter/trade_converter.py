@@ -3,10 +3,13 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import (
@@ -27,10 +30,67 @@ def trades_df_remove_duplicates(trades: pd.DataFrame) -> pd.DataFrame:
     """
     Removes duplicates from the trades DataFrame.
     Uses pandas.DataFrame.drop_duplicates to remove duplicates based on the 'timestamp' column.
+    Trades sorted by timestamp only compare trades sharing their timestamp with a neighbour.
     :param trades: DataFrame with the columns constants.DEFAULT_TRADES_COLUMNS
     :return: DataFrame with duplicates removed based on the 'timestamp' column
     """
-    return trades.drop_duplicates(subset=["timestamp", "id"])
+    if len(trades) < 2 or not trades["timestamp"].is_monotonic_increasing:
+        return trades.drop_duplicates(subset=["timestamp", "id"])
+    timestamps = trades["timestamp"].to_numpy()
+    same_ts = timestamps[1:] == timestamps[:-1]
+    candidates = np.zeros(len(trades), dtype=bool)
+    candidates[1:] |= same_ts
+    candidates[:-1] |= same_ts
+    duplicated = trades.loc[candidates].duplicated(subset=["timestamp", "id"]).to_numpy()
+    keep = np.ones(len(trades), dtype=bool)
+    keep[np.flatnonzero(candidates)[duplicated]] = False
+    return trades.loc[keep]
+
+
+def trades_df_new_trades(trades: DataFrame, new_trades: DataFrame) -> DataFrame:
+    """
+    Return the trades of new_trades which are not contained in trades yet.
+    Only the seam of trades - trades at or after the first new trade - is compared against,
+    instead of the whole history.
+    :param trades: Trades, sorted by timestamp
+    :param new_trades: New trades
+    :return: New trades, without duplicates
+    """
+    new_trades = trades_df_remove_duplicates(new_trades)
+    if trades.empty or new_trades.empty:
+        return new_trades
+    seam_start = np.searchsorted(
+        trades["timestamp"].to_numpy(), new_trades["timestamp"].min(), side="left"
+    )
+    seam = trades.iloc[seam_start:]
+    if seam.empty:
+        return new_trades
+    stored = pd.MultiIndex.from_frame(seam[["timestamp", "id"]])
+    return new_trades.loc[~pd.MultiIndex.from_frame(new_trades[["timestamp", "id"]]).isin(stored)]
+
+
+def trades_df_merge(trades: DataFrame, new_trades: DataFrame) -> DataFrame:
+    """
+    Merge new trades into trades, removing duplicates.
+    Trades are expected to be sorted by timestamp - so only the seam (trades at or after
+    the first new trade) is deduplicated and sorted, instead of the whole history.
+    :param trades: Trades, sorted by timestamp
+    :param new_trades: New trades
+    :return: Merged trades, sorted by timestamp
+    """
+    new_trades = trades_df_new_trades(trades, new_trades)
+    if new_trades.empty:
+        return trades
+    if trades.empty:
+        return new_trades.reset_index(drop=True)
+    # Trades after this position may be interleaved with new trades.
+    seam_start = np.searchsorted(
+        trades["timestamp"].to_numpy(), new_trades["timestamp"].min(), side="right"
+    )
+    seam = concat([trades.iloc[seam_start:], new_trades])
+    if not seam["timestamp"].is_monotonic_increasing:
+        seam = seam.sort_values("timestamp", kind="stable")
+    return concat([trades.iloc[:seam_start], seam], ignore_index=True)
 
 
 def trades_dict_to_list(trades: list[dict]) -> TradeList:
@@ -89,6 +149,103 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def _trades_to_partial_ohlcv(trades: DataFrame, resample_interval: str) -> DataFrame:
+    """
+    Candles of a chunk of trades - including the timestamps of their first and last trade,
+    to combine candles spanning multiple chunks.
+    """
+    resampler = trades.resample(resample_interval, on="date", origin="epoch")
+    df = resampler["price"].ohlc()
+    df["volume"] = resampler["amount"].sum()
+    df["first"] = resampler["timestamp"].min()
+    df["last"] = resampler["timestamp"].max()
+    # Drop 0 volume rows
+    return df.dropna(subset=["open"]).reset_index()
+
+
+def _merge_partial_ohlcv(candles: DataFrame) -> DataFrame:
+    """
+    Combine partial candles with identical dates.
+    """
+    candles = candles.sort_values(["date", "first"], kind="stable")
+    grouped = candles.groupby("date")
+    merged = grouped["open"].first().to_frame()
+    merged["high"] = grouped["high"].max()
+    merged["low"] = grouped["low"].min()
+    merged["close"] = (
+        candles.sort_values(["date", "last"], kind="stable").groupby("date")["close"].last()
+    )
+    merged["volume"] = grouped["volume"].sum()
+    merged["first"] = grouped["first"].min()
+    merged["last"] = grouped["last"].max()
+    return merged.reset_index()
+
+
+def _combine_candles(previous: DataFrame, candle: DataFrame) -> DataFrame:
+    """
+    Combine the last (partial) candle of a chunk with the first candle of the next chunk.
+    """
+    prev, cur = previous.iloc[0], candle.iloc[0]
+    if prev["first"] > cur["first"]:
+        prev, cur = cur, prev
+    return DataFrame(
+        {
+            "date": [cur["date"]],
+            "open": [prev["open"]],
+            "high": [max(prev["high"], cur["high"])],
+            "low": [min(prev["low"], cur["low"])],
+            "close": [cur["close"] if cur["last"] >= prev["last"] else prev["close"]],
+            "volume": [prev["volume"] + cur["volume"]],
+            "first": [prev["first"]],
+            "last": [max(prev["last"], cur["last"])],
+        }
+    )
+
+
+def trades_to_ohlcv_chunked(
+    chunks: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts trades to OHLCV for multiple timeframes in one pass over the trades.
+    Trades are processed chunk by chunk - so only one chunk of trades (and the resulting
+    candles) is held in memory. The last candle of each chunk is carried over
+    and combined with the first candle of the next chunk.
+    :param chunks: Trades dataframes, ordered by time (e.g. from trades_load_chunks()).
+    :param timeframes: Timeframes to convert to
+    :return: Dict of timeframe: OHLCV Dataframe - timeframes without trades are missing.
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq
+
+    intervals = {timeframe: timeframe_to_resample_freq(timeframe) for timeframe in timeframes}
+    candles: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    carry: dict[str, DataFrame] = {}
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        for timeframe, resample_interval in intervals.items():
+            partial = _trades_to_partial_ohlcv(chunk, resample_interval)
+            if timeframe in carry:
+                if carry[timeframe]["date"].iloc[0] == partial["date"].iloc[0]:
+                    # Candle continues in this chunk
+                    partial = concat(
+                        [_combine_candles(carry[timeframe], partial.iloc[:1]), partial.iloc[1:]],
+                        ignore_index=True,
+                    )
+                else:
+                    candles[timeframe].append(carry[timeframe])
+            candles[timeframe].append(partial.iloc[:-1])
+            carry[timeframe] = partial.iloc[-1:]
+
+    result = {}
+    for timeframe, last_candle in carry.items():
+        ohlcv = concat([*candles[timeframe], last_candle], ignore_index=True)
+        if not (ohlcv["date"].is_monotonic_increasing and ohlcv["date"].is_unique):
+            # Chunks weren't ordered by time
+            ohlcv = _merge_partial_ohlcv(ohlcv)
+        result[timeframe] = ohlcv.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+    return result
+
+
 def convert_trades_to_ohlcv(
     pairs: list[str],
     timeframes: list[str],
@@ -98,11 +255,17 @@ def convert_trades_to_ohlcv(
     data_format_ohlcv: str,
     data_format_trades: str,
     candle_type: CandleType,
+    workers: int | None = None,
 ) -> None:
     """
-    Convert stored trades data to ohlcv data
+    Convert stored trades data to ohlcv data.
+    Trades are streamed in chunks, converting to all timeframes in one pass.
+    Pairs are converted in parallel, using a thread pool.
+    :param workers: Number of pairs to convert in parallel.
+                    Defaults to the number of CPUs (max. 8).
     """
     from freqtrade.data.history import get_datahandler
+    from freqtrade.data.history.history_utils import dataload_workers
 
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
     data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
@@ -112,18 +275,32 @@ def convert_trades_to_ohlcv(
         f"intervals: '{', '.join(timeframes)}' to {datadir}"
     )
     trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
+
+    def convert_pair(pair: str) -> None:
+        try:
+            ohlcvs = trades_to_ohlcv_chunked(
+                data_handler_trades.trades_load_chunks(pair, trading_mode), timeframes
+            )
+        except Exception:
+            # Don't store candles built from partially loaded trades
+            logger.exception(f"Error loading trades for {pair}, skipping conversion.")
+            return
         for timeframe in timeframes:
             if erase:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
+            if timeframe not in ohlcvs:
                 logger.warning(f"Could not convert {pair} to OHLCV.")
+                continue
+            # Store ohlcv
+            data_handler_ohlcv.ohlcv_store(
+                pair, timeframe, data=ohlcvs[timeframe], candle_type=candle_type
+            )
+
+    workers = dataload_workers(workers, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume results to raise exceptions
+        list(executor.map(convert_pair, pairs))
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
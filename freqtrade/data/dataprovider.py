@@ -7,6 +7,7 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -328,6 +329,7 @@ class DataProvider:
                 timerange=timerange,
                 data_format=self._config["dataformat_ohlcv"],
                 candle_type=_candle_type,
+                resample=self._config.get("dataload_resample", False),
             )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
@@ -439,15 +441,22 @@ class DataProvider:
         self,
         pairlist: ListPairsWithTimeframes,
         helping_pairs: ListPairsWithTimeframes | None = None,
+        on_refreshed: Callable[[ListPairsWithTimeframes], None] | None = None,
     ) -> None:
         """
         Refresh data, called with each cycle
+        :param on_refreshed: Called with refreshed pairs as soon as they are refreshed.
+            helping_pairs are refreshed before pairlist in this case.
         """
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
-        final_pairs = (pairlist + helping_pairs) if helping_pairs else pairlist
         # refresh latest ohlcv data
-        self._exchange.refresh_latest_ohlcv(final_pairs)
+        if on_refreshed:
+            final_pairs = (helping_pairs + pairlist) if helping_pairs else pairlist
+            self._exchange.refresh_latest_ohlcv(final_pairs, on_batch=on_refreshed)
+        else:
+            final_pairs = (pairlist + helping_pairs) if helping_pairs else pairlist
+            self._exchange.refresh_latest_ohlcv(final_pairs)
         # refresh latest trades data
         self.refresh_latest_trades(pairlist)
 
@@ -0,0 +1,84 @@
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import feather
+
+from freqtrade.configuration import TimeRange
+from freqtrade.exchange import timeframe_to_seconds
+
+from .featherdatahandler import FeatherDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArrowDataHandler(FeatherDataHandler):
+    """
+    Uncompressed Arrow IPC files, loaded by memory-mapping them.
+    Files are written as one single record batch, so loading doesn't need to decompress
+    or copy the data - columns of the loaded dataframe are read-only views on the mapped file.
+    ohlcv_load() keeps these views for data which doesn't need cleaning (sorted candles without
+    duplicate or missing candles). All processes reading the same file share one copy of it in
+    the operating system's page cache.
+    """
+
+    @staticmethod
+    def _write_feather(data: DataFrame, filename: Path) -> None:
+        """
+        Write to a temporary file and move it into place. Other processes may have the file
+        memory-mapped - truncating and rewriting it in place would crash them (SIGBUS).
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            dir=filename.parent, prefix=f".{filename.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        tmp_file = Path(tmp_name)
+        try:
+            # A single record batch allows zero-copy conversion to pandas.
+            data.to_feather(tmp_file, compression="uncompressed", chunksize=max(len(data), 1))
+            tmp_file.replace(filename)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _slice_timerange(table: pa.Table, timerange: TimeRange | None, timeframe: str) -> pa.Table:
+        """
+        Slice (zero-copy) table to timerange - assuming it's sorted by date.
+        One additional candle after the end of the timerange is kept (see load_ohlcv_filtered).
+        """
+        if (
+            not timerange
+            or table.num_rows == 0
+            or not pa.types.is_timestamp(table.schema.field("date").type)
+        ):
+            return table
+        dates = table.column("date").combine_chunks().to_numpy(zero_copy_only=False)
+        start, stop = 0, len(dates)
+        if timerange.starttype == "date":
+            start = int(np.searchsorted(dates, np.datetime64(timerange.startts, "s"), side="left"))
+        if timerange.stoptype == "date":
+            stop_date = timerange.stopts + timeframe_to_seconds(timeframe)
+            stop = int(np.searchsorted(dates, np.datetime64(stop_date, "s"), side="right"))
+        return table.slice(start, max(stop - start, 0))
+
+    def _read_ohlcv(
+        self, files: list[Path], timerange: TimeRange | None, timeframe: str
+    ) -> DataFrame:
+        """
+        Memory-map the main file and appended fragments.
+        """
+        tables = [feather.read_table(file, memory_map=True) for file in files]
+        table = tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+        if len(files) == 1:
+            # Appended fragments may not be sorted relative to the main file.
+            table = self._slice_timerange(table, timerange, timeframe)
+        return table.to_pandas(split_blocks=True)
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "arrow"
@@ -0,0 +1,197 @@
+"""
+Helpers for arrow based datahandlers (feather, parquet):
+timerange predicate pushdown, file statistics and chunked reading.
+"""
+
+import logging
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pandas import DataFrame, Timestamp, concat
+from pyarrow import dataset, feather
+
+from freqtrade.configuration import TimeRange
+from freqtrade.exchange import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# Rows per parquet row group. Files are written sorted by date, so row group statistics
+# (min / max date) allow skipping row groups outside of the requested timerange.
+# 50_000 rows correspond to ~1 month of 1m candles.
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+def build_trades_time_filter(timerange: TimeRange | None) -> dataset.Expression | None:
+    """
+    Build Arrow predicate filter for timerange filtering of trades data.
+    Treats 0 as unbounded (no filter on that side).
+    :param timerange: TimeRange object with start/stop timestamps
+    :return: Arrow filter expression or None if fully unbounded
+    """
+    if not timerange:
+        return None
+
+    # Treat 0 as unbounded
+    start_set = bool(timerange.startts and timerange.startts > 0)
+    stop_set = bool(timerange.stopts and timerange.stopts > 0)
+
+    if not (start_set or stop_set):
+        return None
+
+    ts_field = dataset.field("timestamp")
+    exprs = []
+
+    if start_set:
+        exprs.append(ts_field >= timerange.startts)
+    if stop_set:
+        exprs.append(ts_field <= timerange.stopts)
+
+    if len(exprs) == 1:
+        return exprs[0]
+    else:
+        return exprs[0] & exprs[1]
+
+
+def build_ohlcv_time_filter(
+    timerange: TimeRange | None, timeframe: str
+) -> dataset.Expression | None:
+    """
+    Build Arrow predicate filter on the "date" column of ohlcv data.
+    One additional candle after the end of the timerange is kept, so detection of
+    incomplete candles in `ohlcv_load()` keeps working after trimming.
+    :param timerange: TimeRange object - only "date" bounds are used
+    :param timeframe: Timeframe of the data
+    :return: Arrow filter expression or None if fully unbounded
+    """
+    if not timerange:
+        return None
+    date_field = dataset.field("date")
+    exprs = []
+    if timerange.starttype == "date":
+        exprs.append(date_field >= pa.scalar(timerange.startdt))
+    if timerange.stoptype == "date" and (stopdt := timerange.stopdt) is not None:
+        stop = stopdt + timedelta(seconds=timeframe_to_seconds(timeframe))
+        exprs.append(date_field <= pa.scalar(stop))
+
+    if not exprs:
+        return None
+    if len(exprs) == 1:
+        return exprs[0]
+    return exprs[0] & exprs[1]
+
+
+def load_ohlcv_filtered(
+    files: list[Path], file_format: str, timerange: TimeRange | None, timeframe: str
+) -> DataFrame | None:
+    """
+    Load ohlcv data from an arrow compatible file, pushing the timerange filter down to pyarrow.
+    Parquet files skip row groups based on their statistics, feather files avoid
+    converting rows outside of the timerange.
+    :param files: Files to load (main file and appended fragments)
+    :param file_format: "feather" or "parquet"
+    :param timerange: Timerange to load
+    :param timeframe: Timeframe of the data
+    :return: Filtered Dataframe - or None if no filter can be applied.
+    """
+    time_filter = build_ohlcv_time_filter(timerange, timeframe)
+    if time_filter is None:
+        return None
+    ds = dataset.dataset(files, format=file_format)
+    if not pa.types.is_timestamp(ds.schema.field("date").type):
+        # Files written by old versions may store dates as integers.
+        logger.debug(f"Unable to filter {files[0]} by date, loading entire file.")
+        return None
+    return ds.to_table(filter=time_filter).to_pandas()
+
+
+def _to_epoch_ms(value) -> int:
+    if isinstance(value, int):
+        # Files written by old versions may store dates as integers (milliseconds).
+        return value
+    return Timestamp(value).value // 1_000_000
+
+
+def arrow_files_stats(
+    files: list[Path], file_format: str, column: str
+) -> tuple[int, int, int] | None:
+    """
+    Min / max of column and total row count of files, without loading the data.
+    Parquet files provide this from their footer (row group statistics), feather files
+    only need to read the requested column.
+    :param files: Files to get statistics for
+    :param file_format: "feather" or "parquet"
+    :param column: Column to get min / max for ("date" or "timestamp")
+    :return: (min, max, rows) - min / max as epoch milliseconds - or None if not available.
+    """
+    mins = []
+    maxs = []
+    rows = 0
+    try:
+        for file in files:
+            if file_format == "parquet":
+                metadata = pq.read_metadata(file)
+                col_idx = metadata.schema.to_arrow_schema().get_field_index(column)
+                if col_idx < 0:
+                    return None
+                for rg_idx in range(metadata.num_row_groups):
+                    stats = metadata.row_group(rg_idx).column(col_idx).statistics
+                    if metadata.row_group(rg_idx).num_rows == 0:
+                        continue
+                    if stats is None or not stats.has_min_max:
+                        return None
+                    mins.append(_to_epoch_ms(stats.min))
+                    maxs.append(_to_epoch_ms(stats.max))
+                rows += metadata.num_rows
+            else:
+                table = feather.read_table(file, columns=[column], memory_map=True)
+                if table.num_rows > 0:
+                    min_max = pc.min_max(table[column])
+                    mins.append(_to_epoch_ms(min_max["min"].as_py()))
+                    maxs.append(_to_epoch_ms(min_max["max"].as_py()))
+                rows += table.num_rows
+    except (OSError, KeyError, pa.ArrowException) as e:
+        logger.debug(f"Unable to read statistics from {files[0]}: {e}")
+        return None
+    if rows == 0:
+        return 0, 0, 0
+    return min(mins), max(maxs), rows
+
+
+def _iter_file_batches(
+    files: list[Path], file_format: str, batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    for file in files:
+        if file_format == "parquet":
+            yield from pq.ParquetFile(file).iter_batches(batch_size=batch_size)
+        else:
+            with pa.OSFile(str(file)) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    for offset in range(0, batch.num_rows, batch_size):
+                        yield batch.slice(offset, batch_size)
+
+
+def arrow_files_chunks(files: list[Path], file_format: str, chunk_size: int) -> Iterator[DataFrame]:
+    """
+    Read files as dataframes of about chunk_size rows, keeping the order of files and rows.
+    Only the current chunk is kept in memory.
+    :param files: Files to read - in order
+    :param file_format: "feather" or "parquet"
+    :param chunk_size: Minimum number of rows per chunk (except for the last chunk)
+    """
+    batches: list[pa.RecordBatch] = []
+    rows = 0
+    for batch in _iter_file_batches(files, file_format, chunk_size):
+        batches.append(batch)
+        rows += batch.num_rows
+        if rows >= chunk_size:
+            yield concat([b.to_pandas() for b in batches], ignore_index=True)
+            batches, rows = [], 0
+    if batches:
+        yield concat([b.to_pandas() for b in batches], ignore_index=True)
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Iterator
+from pathlib import Path
 
 from pandas import DataFrame, read_feather, to_datetime
 from pyarrow import dataset
@@ -7,6 +9,12 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
+from .arrowfilters import (
+    arrow_files_chunks,
+    arrow_files_stats,
+    build_trades_time_filter,
+    load_ohlcv_filtered,
+)
 from .idatahandler import IDataHandler
 
 
@@ -16,6 +24,21 @@ logger = logging.getLogger(__name__)
 class FeatherDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
 
+    @staticmethod
+    def _write_feather(data: DataFrame, filename: Path) -> None:
+        data.to_feather(filename, compression_level=9, compression="lz4")
+
+    def _read_ohlcv(
+        self, files: list[Path], timerange: TimeRange | None, timeframe: str
+    ) -> DataFrame:
+        """
+        Read ohlcv data from the main file and appended fragments.
+        """
+        pairdata = load_ohlcv_filtered(files, "feather", timerange, timeframe)
+        if pairdata is None:
+            pairdata = self._read_files(read_feather, files)
+        return pairdata
+
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
@@ -32,9 +55,10 @@ class FeatherDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression="lz4"
-        )
+        self._write_feather(data.reset_index(drop=True).loc[:, self._columns], filename)
+        # Appended data is part of data now.
+        self._remove_fragments(filename)
+        self._write_metadata(filename, *self._dataframe_stats(data, "date"))
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -60,7 +84,15 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
+            files = [filename, *self._fragment_files(filename)]
+            pairdata = self._read_ohlcv(files, timerange, timeframe)
+            if len(files) > 1:
+                # Appended candles replace candles with the same date (e.g. incomplete candles)
+                pairdata = (
+                    pairdata.drop_duplicates(subset="date", keep="last")
+                    .sort_values("date", kind="stable")
+                    .reset_index(drop=True)
+                )
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -69,7 +101,8 @@ class FeatherDataHandler(IDataHandler):
                     "low": "float",
                     "close": "float",
                     "volume": "float",
-                }
+                },
+                copy=False,
             )
             pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
             return pairdata
@@ -89,7 +122,16 @@ class FeatherDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        metadata = self._read_metadata(filename)
+        fragment = self._next_fragment_file(filename)
+        self._write_feather(data.reset_index(drop=True).loc[:, self._columns], fragment)
+        self._append_metadata(filename, metadata, data, "date", replaces=True)
+        if len(self._fragment_files(filename)) >= self._append_compaction_threshold:
+            self.ohlcv_compact(pair, timeframe, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -101,16 +143,27 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
+        self._write_feather(data.reset_index(drop=True), filename)
+        self._remove_fragments(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            self.trades_store(pair, data, trading_mode)
+            return
+        metadata = self._read_metadata(filename)
+        fragment = self._next_fragment_file(filename)
+        self._write_feather(data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS], fragment)
+        self._append_metadata(filename, metadata, data, "timestamp", replaces=False)
+        if len(self._fragment_files(filename)) >= self._append_compaction_threshold:
+            self.trades_compact(pair, trading_mode)
 
     def _build_arrow_time_filter(self, timerange: TimeRange | None):
         """
@@ -119,28 +172,7 @@ class FeatherDataHandler(IDataHandler):
         :param timerange: TimeRange object with start/stop timestamps
         :return: Arrow filter expression or None if fully unbounded
         """
-        if not timerange:
-            return None
-
-        # Treat 0 as unbounded
-        start_set = bool(timerange.startts and timerange.startts > 0)
-        stop_set = bool(timerange.stopts and timerange.stopts > 0)
-
-        if not (start_set or stop_set):
-            return None
-
-        ts_field = dataset.field("timestamp")
-        exprs = []
-
-        if start_set:
-            exprs.append(ts_field >= timerange.startts)
-        if stop_set:
-            exprs.append(ts_field <= timerange.stopts)
-
-        if len(exprs) == 1:
-            return exprs[0]
-        else:
-            return exprs[0] & exprs[1]
+        return build_trades_time_filter(timerange)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
@@ -156,9 +188,10 @@ class FeatherDataHandler(IDataHandler):
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
+        files = [filename, *self._fragment_files(filename)]
         # Use Arrow dataset with optional timerange filtering, fallback to read_feather
         try:
-            dataset_reader = dataset.dataset(filename, format="feather")
+            dataset_reader = dataset.dataset(files, format="feather")
             time_filter = self._build_arrow_time_filter(timerange)
 
             if time_filter is not None and timerange is not None:
@@ -176,10 +209,24 @@ class FeatherDataHandler(IDataHandler):
         except (ImportError, AttributeError, ValueError) as e:
             # Fallback: load entire file
             logger.warning(f"Unable to use Arrow filtering, loading entire trades file: {e}")
-            tradesdata = read_feather(filename)
+            tradesdata = self._read_files(read_feather, files)
 
+        if len(files) > 1 and not tradesdata["timestamp"].is_monotonic_increasing:
+            tradesdata = tradesdata.sort_values("timestamp", kind="stable").reset_index(drop=True)
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if filename.exists():
+            yield from arrow_files_chunks(
+                [filename, *self._fragment_files(filename)], "feather", chunk_size
+            )
+
+    def _data_files_stats(self, files: list[Path], column: str) -> tuple[int, int, int] | None:
+        return arrow_files_stats(files, "feather", column)
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
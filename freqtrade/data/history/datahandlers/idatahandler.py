@@ -4,20 +4,31 @@ It's subclasses handle and storing data from disk.
 
 """
 
+import json
 import logging
+import os
 import re
+import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from copy import deepcopy
-from datetime import UTC, datetime
+from datetime import datetime
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+import pyarrow as pa
+from pandas import DataFrame, Timedelta, concat, to_datetime
+from pyarrow import feather
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import (
+    DEFAULT_DATAFRAME_COLUMNS,
+    DEFAULT_TRADES_COLUMNS,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
+    ohlcv_resample,
     trades_convert_types,
     trades_df_remove_duplicates,
     trim_dataframe,
@@ -33,6 +44,10 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Amount of appended fragments after which they're compacted into the main file.
+    _append_compaction_threshold = 20
+    # Maximum size (in bytes) of the on-disk cache of resampled candles.
+    _resample_cache_size = 1024 * 1024 * 1024
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -115,14 +130,24 @@ class IDataHandler(ABC):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: (min, max, len)
         """
-        df = self._ohlcv_load(pair, timeframe, None, candle_type)
-        if df.empty:
-            return (
-                datetime.fromtimestamp(0, tz=UTC),
-                datetime.fromtimestamp(0, tz=UTC),
-                0,
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type, no_timeframe_modify=True
             )
-        return df.iloc[0]["date"].to_pydatetime(), df.iloc[-1]["date"].to_pydatetime(), len(df)
+        metadata = self._read_metadata(filename)
+        if metadata is None:
+            # Appended candles may replace existing candles - so row counts are only
+            # available from file statistics if there are no fragments.
+            stats = None
+            if not self._fragment_files(filename):
+                stats = self._data_files_stats(self._data_files(filename), "date")
+            if stats is None:
+                df = self._ohlcv_load(pair, timeframe, None, candle_type)
+                stats = self._dataframe_stats(df, "date")
+            metadata = self._write_metadata(filename, *stats)
+        return self._metadata_to_min_max(metadata)
 
     @abstractmethod
     def _ohlcv_load(
@@ -152,6 +177,7 @@ class IDataHandler(ABC):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         if filename.exists():
             filename.unlink()
+            self._remove_fragments(filename)
             return True
         return False
 
@@ -165,7 +191,23 @@ class IDataHandler(ABC):
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :raises NotImplementedError: if the data format doesn't support appending
+        """
+
+    def ohlcv_compact(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Merge appended fragments into the main data file.
+        :param pair: Pair
+        :param timeframe: Timeframe
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not self._fragment_files(filename):
+            return
+        data = self._ohlcv_load(pair, timeframe, None, candle_type)
+        logger.debug(f"Compacting {pair}, {timeframe}, {candle_type} data.")
+        # ohlcv_store() removes the fragments after writing the main file.
+        self.ohlcv_store(pair, timeframe, data, candle_type)
 
     @classmethod
     def trades_get_available_data(cls, datadir: Path, trading_mode: TradingMode) -> list[str]:
@@ -198,18 +240,14 @@ class IDataHandler(ABC):
         :param trading_mode: Trading mode to use (used to determine the filename)
         :return: (min, max, len)
         """
-        df = self._trades_load(pair, trading_mode)
-        if df.empty:
-            return (
-                datetime.fromtimestamp(0, tz=UTC),
-                datetime.fromtimestamp(0, tz=UTC),
-                0,
-            )
-        return (
-            to_datetime(df.iloc[0]["timestamp"], unit="ms", utc=True).to_pydatetime(),
-            to_datetime(df.iloc[-1]["timestamp"], unit="ms", utc=True).to_pydatetime(),
-            len(df),
-        )
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        metadata = self._read_metadata(filename)
+        if metadata is None:
+            stats = self._data_files_stats(self._data_files(filename), "timestamp")
+            if stats is None:
+                stats = self._dataframe_stats(self._trades_load(pair, trading_mode), "timestamp")
+            metadata = self._write_metadata(filename, *stats)
+        return self._metadata_to_min_max(metadata)
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> list[str]:
@@ -237,14 +275,30 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :raises NotImplementedError: if the data format doesn't support appending
         """
 
+    def trades_compact(self, pair: str, trading_mode: TradingMode) -> None:
+        """
+        Merge appended fragments into the main trades file.
+        :param pair: Pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not self._fragment_files(filename):
+            return
+        data = self.trades_load(pair, trading_mode)
+        logger.debug(f"Compacting {pair} trades.")
+        # trades_store() removes the fragments after writing the main file.
+        self.trades_store(pair, data, trading_mode)
+
     @abstractmethod
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
@@ -267,6 +321,10 @@ class IDataHandler(ABC):
         """
         # Filter on expected columns (will remove the actual date column).
         self._trades_store(pair, data[DEFAULT_TRADES_COLUMNS], trading_mode)
+        self._write_metadata(
+            self._pair_trades_filename(self._datadir, pair, trading_mode),
+            *self._dataframe_stats(data, "timestamp"),
+        )
 
     def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
         """
@@ -278,6 +336,7 @@ class IDataHandler(ABC):
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if filename.exists():
             filename.unlink()
+            self._remove_fragments(filename)
             return True
         return False
 
@@ -303,6 +362,44 @@ class IDataHandler(ABC):
         trades = trades_convert_types(trades)
         return trades
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in time-ordered chunks of about chunk_size trades.
+        Implemented by datahandlers able to read files partially -
+        the default implementation loads all trades as one chunk.
+        """
+        yield self._trades_load(pair, trading_mode)
+
+    def trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int = 1_000_000
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in time-ordered chunks,
+        to process trade histories too large to be loaded at once.
+        Removes duplicates in the process - also duplicates of trades in the previous chunk.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param chunk_size: Approximate number of trades per chunk
+        :return: Iterator of trades dataframes
+        """
+        previous = DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        for chunk in self._trades_load_chunks(pair, trading_mode, chunk_size):
+            if chunk.empty:
+                continue
+            # Trades of the previous chunk which may be repeated in this chunk
+            seam = previous.loc[previous["timestamp"] >= chunk["timestamp"].min()]
+            if not seam.empty:
+                chunk = trades_df_remove_duplicates(concat([seam, chunk], ignore_index=True))
+                chunk = chunk.iloc[len(seam) :]
+            else:
+                chunk = trades_df_remove_duplicates(chunk)
+            if chunk.empty:
+                continue
+            previous = chunk
+            yield trades_convert_types(chunk.reset_index(drop=True))
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -342,6 +439,177 @@ class IDataHandler(ABC):
         filename = datadir.joinpath(f"{pair_s}-trades.{cls._get_file_extension()}")
         return filename
 
+    @staticmethod
+    def _fragment_dir(filename: Path) -> Path:
+        """
+        Directory containing data appended to `filename` which was not yet compacted.
+        """
+        return filename.with_name(f"{filename.name}.parts")
+
+    @classmethod
+    def _fragment_files(cls, filename: Path) -> list[Path]:
+        """
+        Appended fragments for `filename`, in the order they were written.
+        """
+        fragment_dir = cls._fragment_dir(filename)
+        if not fragment_dir.is_dir():
+            return []
+        return sorted(fragment_dir.glob(f"*.{cls._get_file_extension()}"))
+
+    @classmethod
+    def _next_fragment_file(cls, filename: Path) -> Path:
+        fragments = cls._fragment_files(filename)
+        seq = int(fragments[-1].stem) + 1 if fragments else 1
+        fragment_dir = cls._fragment_dir(filename)
+        fragment_dir.mkdir(parents=True, exist_ok=True)
+        return fragment_dir / f"{seq:06d}.{cls._get_file_extension()}"
+
+    @staticmethod
+    def _read_files(reader: Callable[[Path], DataFrame], files: list[Path]) -> DataFrame:
+        """
+        Read the main file and all appended fragments into one dataframe.
+        """
+        if len(files) == 1:
+            return reader(files[0])
+        return concat([reader(f) for f in files], ignore_index=True)
+
+    @classmethod
+    def _remove_fragments(cls, filename: Path) -> None:
+        fragment_dir = cls._fragment_dir(filename)
+        if fragment_dir.is_dir():
+            shutil.rmtree(fragment_dir)
+
+    @classmethod
+    def _data_files(cls, filename: Path) -> list[Path]:
+        """
+        All files containing data for `filename` - the file itself and appended fragments.
+        """
+        if not filename.is_file():
+            return []
+        return [filename, *cls._fragment_files(filename)]
+
+    def _data_files_stats(self, files: list[Path], column: str) -> tuple[int, int, int] | None:
+        """
+        Min / max of column (as epoch milliseconds) and row count of the data in files,
+        without loading the data.
+        Implemented by datahandlers with file formats providing statistics.
+        :return: (min, max, rows) - or None if not available
+        """
+        return None
+
+    @staticmethod
+    def _dataframe_stats(data: DataFrame, column: str) -> tuple[int, int, int]:
+        """
+        Min / max of column (as epoch milliseconds) and row count of data.
+        """
+        if data.empty:
+            return 0, 0, 0
+        first, last = data[column].min(), data[column].max()
+        if column == "date":
+            first = first.value // 1_000_000
+            last = last.value // 1_000_000
+        return int(first), int(last), len(data)
+
+    def _metadata_filename(self, filename: Path) -> Path:
+        """
+        Sidecar file caching min / max / row count of the data in filename.
+        Kept in a separate directory, so listing data never picks it up.
+        """
+        return self._datadir.joinpath(
+            ".metadata", f"{filename.relative_to(self._datadir).as_posix()}.json"
+        )
+
+    def _files_signature(self, files: list[Path]) -> list[list]:
+        signature = []
+        for file in files:
+            stat = file.stat()
+            signature.append(
+                [file.relative_to(self._datadir).as_posix(), stat.st_size, stat.st_mtime_ns]
+            )
+        return signature
+
+    def _read_metadata(self, filename: Path) -> dict | None:
+        """
+        Read cached metadata for filename.
+        :return: Metadata dict - or None if missing or outdated (data files changed since).
+        """
+        files = self._data_files(filename)
+        if not files:
+            return {"start": 0, "end": 0, "count": 0}
+        try:
+            metadata = misc.file_load_json(self._metadata_filename(filename))
+        except Exception:
+            logger.warning(f"Invalid metadata for {filename}, ignoring.")
+            return None
+        if not metadata or metadata.get("files") != self._files_signature(files):
+            return None
+        return metadata
+
+    def _write_metadata(self, filename: Path, start: int, end: int, count: int) -> dict:
+        """
+        Cache metadata for filename - valid until the data files change.
+        :param start: First date / timestamp (epoch milliseconds)
+        :param end: Last date / timestamp (epoch milliseconds)
+        :param count: Number of rows
+        """
+        metadata = {
+            "start": start,
+            "end": end,
+            "count": count,
+            "files": self._files_signature(self._data_files(filename)),
+        }
+        metadata_file = self._metadata_filename(filename)
+        try:
+            metadata_file.parent.mkdir(parents=True, exist_ok=True)
+            misc.file_dump_json(metadata_file, metadata, log=False)
+        except OSError as e:
+            logger.debug(f"Unable to write metadata for {filename}: {e}")
+        return metadata
+
+    def _append_metadata(
+        self,
+        filename: Path,
+        metadata: dict | None,
+        data: DataFrame,
+        column: str,
+        replaces: bool,
+    ) -> None:
+        """
+        Update metadata after data has been appended to filename.
+        If the metadata before appending wasn't valid, it's rebuilt on the next call
+        to `*_data_min_max()` instead.
+        :param metadata: Metadata as read before appending
+        :param data: Appended data
+        :param column: Date column of data ("date" or "timestamp")
+        :param replaces: Appended rows replace stored rows with identical dates (ohlcv data)
+        """
+        if metadata is None or data.empty:
+            return
+        start, end, count = self._dataframe_stats(data, column)
+        if metadata["count"] == 0:
+            self._write_metadata(filename, start, end, count)
+        elif not replaces:
+            self._write_metadata(
+                filename,
+                min(metadata["start"], start),
+                max(metadata["end"], end),
+                metadata["count"] + count,
+            )
+        elif start >= metadata["end"]:
+            # Only the last stored candle can be replaced.
+            overlap = 1 if start == metadata["end"] else 0
+            self._write_metadata(
+                filename, metadata["start"], end, metadata["count"] + count - overlap
+            )
+
+    @staticmethod
+    def _metadata_to_min_max(metadata: dict) -> tuple[datetime, datetime, int]:
+        return (
+            to_datetime(metadata["start"], unit="ms", utc=True).to_pydatetime(),
+            to_datetime(metadata["end"], unit="ms", utc=True).to_pydatetime(),
+            metadata["count"],
+        )
+
     @staticmethod
     def timeframe_to_file(timeframe: str):
         return timeframe.replace("M", "Mo")
@@ -375,6 +643,7 @@ class IDataHandler(ABC):
         drop_incomplete: bool = False,
         startup_candles: int = 0,
         warn_no_data: bool = True,
+        resample: bool = False,
     ) -> DataFrame:
         """
         Load cached candle (OHLCV) data for the given pair.
@@ -387,6 +656,7 @@ class IDataHandler(ABC):
         :param startup_candles: Additional candles to load at the start of the period
         :param warn_no_data: Log a warning message when no data is found
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :param resample: Build the timeframe from a smaller timeframe if it's not available.
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
         # Fix startup period
@@ -397,28 +667,174 @@ class IDataHandler(ABC):
         pairdf = self._ohlcv_load(
             pair, timeframe, timerange=timerange_startup, candle_type=candle_type
         )
+        if pairdf.empty and resample:
+            pairdf = self._ohlcv_load_resampled(pair, timeframe, candle_type)
         if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data):
             return pairdf
         else:
             enddate = pairdf.iloc[-1]["date"]
+            is_clean = self._ohlcv_is_clean(pairdf, timeframe, fill_missing)
 
             if timerange_startup:
                 self._validate_pairdata(pair, pairdf, timeframe, candle_type, timerange_startup)
-                pairdf = trim_dataframe(pairdf, timerange_startup)
+                if is_clean:
+                    pairdf = self._trim_sorted_dataframe(pairdf, timerange_startup)
+                else:
+                    pairdf = trim_dataframe(pairdf, timerange_startup)
                 if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data, True):
                     return pairdf
 
             # incomplete candles should only be dropped if we didn't trim the end beforehand.
-            pairdf = clean_ohlcv_dataframe(
-                pairdf,
-                timeframe,
-                pair=pair,
-                fill_missing=fill_missing,
-                drop_incomplete=(drop_incomplete and enddate == pairdf.iloc[-1]["date"]),
-            )
+            drop_incomplete = drop_incomplete and enddate == pairdf.iloc[-1]["date"]
+            if is_clean:
+                # Keep the loaded columns (e.g. views on memory-mapped arrow files).
+                if drop_incomplete:
+                    pairdf = pairdf.iloc[:-1]
+                pairdf = DataFrame({col: pairdf[col].array for col in pairdf.columns}, copy=False)
+            else:
+                pairdf = clean_ohlcv_dataframe(
+                    pairdf,
+                    timeframe,
+                    pair=pair,
+                    fill_missing=fill_missing,
+                    drop_incomplete=drop_incomplete,
+                )
             self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data)
             return pairdf
 
+    def resample_base_timeframe(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> str | None:
+        """
+        Timeframe available on disk which timeframe can be resampled from.
+        Uses the largest available timeframe evenly dividing timeframe.
+        :return: Timeframe - or None if timeframe can't be built from available data
+        """
+        tf_seconds = timeframe_to_seconds(timeframe)
+        trading_mode = TradingMode.SPOT if candle_type == CandleType.SPOT else TradingMode.FUTURES
+        candidates = [
+            tf
+            for p, tf, ct in self.ohlcv_get_available_data(self._datadir, trading_mode)
+            if p == pair
+            and ct == candle_type
+            and timeframe_to_seconds(tf) < tf_seconds
+            and tf_seconds % timeframe_to_seconds(tf) == 0
+        ]
+        return max(candidates, key=timeframe_to_seconds, default=None)
+
+    def _resample_cache_dir(self) -> Path:
+        """
+        Directory caching resampled candles.
+        Separate from the data, so listing data never picks it up.
+        """
+        return self._datadir.joinpath(".resampled")
+
+    def _resample_cache_filename(self, pair: str, timeframe: str, candle_type: CandleType) -> Path:
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        return self._resample_cache_dir().joinpath(
+            f"{filename.relative_to(self._datadir).as_posix()}.feather"
+        )
+
+    def _ohlcv_load_resampled(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Load all candles of pair in timeframe, resampled from a smaller timeframe.
+        Resampled candles are cached on disk until the data of the smaller timeframe changes.
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        if self._data_files(self._pair_data_filename(self._datadir, pair, timeframe, candle_type)):
+            # Data is available - just not within the requested timerange.
+            return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+        base_timeframe = self.resample_base_timeframe(pair, timeframe, candle_type)
+        if not base_timeframe:
+            return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+        base_files = self._data_files(
+            self._pair_data_filename(self._datadir, pair, base_timeframe, candle_type)
+        )
+        signature = json.dumps(
+            {"base_timeframe": base_timeframe, "files": self._files_signature(base_files)}
+        ).encode()
+
+        cache_file = self._resample_cache_filename(pair, timeframe, candle_type)
+        try:
+            table = feather.read_table(cache_file)
+            if (table.schema.metadata or {}).get(b"freqtrade") == signature:
+                # Keep recently used files in the cache.
+                os.utime(cache_file)
+                return table.to_pandas()
+        except (OSError, pa.ArrowInvalid):
+            pass
+
+        logger.info(f"Resampling {pair}, {candle_type} data from {base_timeframe} to {timeframe}.")
+        base_data = self.ohlcv_load(
+            pair,
+            base_timeframe,
+            candle_type,
+            fill_missing=False,
+            warn_no_data=False,
+        )
+        pairdf = ohlcv_resample(base_data, base_timeframe, timeframe)
+        self._write_resample_cache(cache_file, pairdf, signature)
+        return pairdf
+
+    def _write_resample_cache(self, cache_file: Path, data: DataFrame, signature: bytes) -> None:
+        """
+        Store resampled candles, evicting the least recently used files
+        once the cache grows beyond _resample_cache_size.
+        """
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"freqtrade": signature}
+            )
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            feather.write_feather(table, cache_file, compression="lz4")
+
+            files = sorted(
+                ((f, f.stat()) for f in self._resample_cache_dir().rglob("*.feather")),
+                key=lambda x: x[1].st_mtime_ns,
+                reverse=True,
+            )
+            total_size = 0
+            for file, stat in files:
+                total_size += stat.st_size
+                if total_size > self._resample_cache_size and file != cache_file:
+                    file.unlink()
+        except (OSError, pa.ArrowException) as e:
+            logger.debug(f"Unable to cache resampled data in {cache_file}: {e}")
+
+    @staticmethod
+    def _ohlcv_is_clean(pairdf: DataFrame, timeframe: str, fill_missing: bool) -> bool:
+        """
+        Check if pairdf is already in the shape clean_ohlcv_dataframe() would return -
+        sorted by date without duplicate candles, and without missing candles if fill_missing
+        is set. Only timeframes evenly dividing a day are considered.
+        """
+        tf_seconds = timeframe_to_seconds(timeframe)
+        if list(pairdf.columns) != DEFAULT_DATAFRAME_COLUMNS or 86400 % tf_seconds != 0:
+            return False
+        dates = pairdf["date"]
+        if not fill_missing:
+            return dates.is_monotonic_increasing and dates.is_unique
+        return (
+            dates.iloc[0].value % (tf_seconds * 1_000_000_000) == 0
+            and (dates.diff().iloc[1:] == Timedelta(seconds=tf_seconds)).all()
+            and not pairdf[["open", "high", "low", "close"]].isna().to_numpy().any()
+        )
+
+    @staticmethod
+    def _trim_sorted_dataframe(pairdf: DataFrame, timerange: TimeRange) -> DataFrame:
+        """
+        trim_dataframe() for dataframes sorted by date - slicing instead of copying the rows.
+        """
+        start, stop = 0, len(pairdf)
+        if timerange.starttype == "date":
+            start = int(pairdf["date"].searchsorted(timerange.startdt, side="left"))
+        if timerange.stoptype == "date":
+            stop = int(pairdf["date"].searchsorted(timerange.stopdt, side="right"))
+        return pairdf.iloc[start:stop]
+
     def _check_empty_df(
         self,
         pairdf: DataFrame,
@@ -501,6 +917,8 @@ class IDataHandler(ABC):
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
         file_old.rename(file_new)
+        if self._fragment_dir(file_old).is_dir():
+            self._fragment_dir(file_old).rename(self._fragment_dir(file_new))
 
     def fix_funding_fee_timeframe(self, ff_timeframe: str):
         """
@@ -561,10 +979,18 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .featherdatahandler import FeatherDataHandler
 
         return FeatherDataHandler
+    elif datatype == "arrow":
+        from .arrowdatahandler import ArrowDataHandler
+
+        return ArrowDataHandler
     elif datatype == "parquet":
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "parquet_partitioned":
+        from .parquetpartitioneddatahandler import ParquetPartitionedDataHandler
+
+        return ParquetPartitionedDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
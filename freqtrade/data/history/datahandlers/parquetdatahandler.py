@@ -1,11 +1,21 @@
 import logging
+from collections.abc import Iterator
+from pathlib import Path
 
 from pandas import DataFrame, read_parquet, to_datetime
+from pyarrow import dataset
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
+from .arrowfilters import (
+    PARQUET_ROW_GROUP_SIZE,
+    arrow_files_chunks,
+    arrow_files_stats,
+    build_trades_time_filter,
+    load_ohlcv_filtered,
+)
 from .idatahandler import IDataHandler
 
 
@@ -31,7 +41,12 @@ class ParquetDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=PARQUET_ROW_GROUP_SIZE
+        )
+        # Appended data is part of data now.
+        self._remove_fragments(filename)
+        self._write_metadata(filename, *self._dataframe_stats(data, "date"))
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -57,7 +72,17 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
+            files = [filename, *self._fragment_files(filename)]
+            pairdata = load_ohlcv_filtered(files, "parquet", timerange, timeframe)
+            if pairdata is None:
+                pairdata = self._read_files(read_parquet, files)
+            if len(files) > 1:
+                # Appended candles replace candles with the same date (e.g. incomplete candles)
+                pairdata = (
+                    pairdata.drop_duplicates(subset="date", keep="last")
+                    .sort_values("date", kind="stable")
+                    .reset_index(drop=True)
+                )
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -86,7 +111,18 @@ class ParquetDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        metadata = self._read_metadata(filename)
+        fragment = self._next_fragment_file(filename)
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            fragment, row_group_size=PARQUET_ROW_GROUP_SIZE
+        )
+        self._append_metadata(filename, metadata, data, "date", replaces=True)
+        if len(self._fragment_files(filename)) >= self._append_compaction_threshold:
+            self.ohlcv_compact(pair, timeframe, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -98,36 +134,71 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_parquet(filename)
+        data.reset_index(drop=True).to_parquet(filename, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        self._remove_fragments(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            self.trades_store(pair, data, trading_mode)
+            return
+        metadata = self._read_metadata(filename)
+        fragment = self._next_fragment_file(filename)
+        data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS].to_parquet(
+            fragment, row_group_size=PARQUET_ROW_GROUP_SIZE
+        )
+        self._append_metadata(filename, metadata, data, "timestamp", replaces=False)
+        if len(self._fragment_files(filename)) >= self._append_compaction_threshold:
+            self.trades_compact(pair, trading_mode)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from file
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
-        :return: List of trades
+        :param timerange: Timerange to load trades for - filters data to this range if provided
+        :return: Dataframe containing trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_parquet(filename)
+        files = [filename, *self._fragment_files(filename)]
+        time_filter = build_trades_time_filter(timerange)
+        if time_filter is not None:
+            # Row groups outside of the timerange are skipped based on their statistics
+            tradesdata = (
+                dataset.dataset(files, format="parquet").to_table(filter=time_filter).to_pandas()
+            )
+        else:
+            tradesdata = self._read_files(read_parquet, files)
+
+        if len(files) > 1 and not tradesdata["timestamp"].is_monotonic_increasing:
+            tradesdata = tradesdata.sort_values("timestamp", kind="stable").reset_index(drop=True)
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if filename.exists():
+            yield from arrow_files_chunks(
+                [filename, *self._fragment_files(filename)], "parquet", chunk_size
+            )
+
+    def _data_files_stats(self, files: list[Path], column: str) -> tuple[int, int, int] | None:
+        return arrow_files_stats(files, "parquet", column)
+
     @classmethod
     def _get_file_extension(cls):
         return "parquet"
@@ -0,0 +1,568 @@
+import logging
+import shutil
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from pandas import DataFrame, Series, concat, read_parquet, to_datetime
+from pyarrow import dataset
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import (
+    DEFAULT_DATAFRAME_COLUMNS,
+    DEFAULT_TRADES_COLUMNS,
+    ListPairsWithTimeframes,
+)
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exchange import timeframe_to_seconds
+
+from .arrowfilters import (
+    PARQUET_ROW_GROUP_SIZE,
+    arrow_files_chunks,
+    arrow_files_stats,
+    build_trades_time_filter,
+    load_ohlcv_filtered,
+)
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetPartitionedDataHandler(IDataHandler):
+    """
+    Parquet datahandler storing data partitioned by month, in a hive style directory layout.
+    OHLCV data:
+        <datadir>/ohlcv/pair=<pair>/timeframe=<timeframe>/candle_type=<candle_type>/
+            year=<year>/month=<month>/data.parquet
+    Trades data:
+        <datadir>/trades/pair=<pair>/year=<year>/month=<month>/part-<timestamp>.parquet
+    Futures data is stored below <datadir>/futures/ - as for the other formats.
+    Loading a timerange, appending and purging only touch the affected partitions.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "parquet"
+
+    @classmethod
+    def _pair_data_filename(
+        cls,
+        datadir: Path,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        no_timeframe_modify: bool = False,
+    ) -> Path:
+        """
+        Directory containing all partitions for this pair / timeframe / candle type.
+        """
+        if not no_timeframe_modify:
+            timeframe = cls.timeframe_to_file(timeframe)
+        if candle_type != CandleType.SPOT:
+            datadir = datadir.joinpath("futures")
+        return datadir.joinpath(
+            "ohlcv",
+            f"pair={misc.pair_to_filename(pair)}",
+            f"timeframe={timeframe}",
+            f"candle_type={CandleType.from_string(candle_type)}",
+        )
+
+    @classmethod
+    def _pair_trades_filename(cls, datadir: Path, pair: str, trading_mode: TradingMode) -> Path:
+        """
+        Directory containing all trades partitions for this pair.
+        """
+        if trading_mode == TradingMode.FUTURES:
+            datadir = datadir.joinpath("futures")
+        return datadir.joinpath("trades", f"pair={misc.pair_to_filename(pair)}")
+
+    @staticmethod
+    def _partition_value(directory: Path) -> str:
+        return directory.name.split("=", 1)[1]
+
+    @classmethod
+    def _partition_files(
+        cls, root: Path, start: datetime | None = None, stop: datetime | None = None
+    ) -> list[Path]:
+        """
+        Data files of all monthly partitions below root, in chronological order.
+        :param root: Partition root (pair / timeframe / candle type directory)
+        :param start: Skip partitions ending before this date
+        :param stop: Skip partitions starting after this date
+        """
+        partitions = []
+        for month_dir in root.glob("year=*/month=*"):
+            month_start, month_end = cls._month_bounds(month_dir)
+            if (start and month_end <= start) or (stop and month_start > stop):
+                continue
+            partitions.append((month_start, month_dir))
+
+        return [
+            file
+            for _, month_dir in sorted(partitions)
+            for file in sorted(month_dir.glob("*.parquet"))
+        ]
+
+    @classmethod
+    def _data_files(cls, filename: Path) -> list[Path]:
+        return cls._partition_files(filename)
+
+    def _data_files_stats(self, files: list[Path], column: str) -> tuple[int, int, int] | None:
+        return arrow_files_stats(files, "parquet", column)
+
+    @staticmethod
+    def _split_months(data: DataFrame, dates: Series) -> Iterator[tuple[Path, DataFrame]]:
+        """
+        Split data into monthly partitions.
+        :param data: Dataframe to split
+        :param dates: Dates (UTC) of the rows in data
+        :return: Iterator of (relative partition directory, partition data)
+        """
+        keys = (dates.dt.year * 100 + dates.dt.month).to_numpy()
+        for key, group in data.groupby(keys, sort=True):
+            yield (
+                Path(f"year={key // 100}", f"month={key % 100:02d}"),
+                group.reset_index(drop=True),
+            )
+
+    @classmethod
+    def _month_bounds(cls, month_dir: Path) -> tuple[datetime, datetime]:
+        """
+        Start (inclusive) and end (exclusive) of a monthly partition directory.
+        """
+        month_start = datetime(
+            int(cls._partition_value(month_dir.parent)),
+            int(cls._partition_value(month_dir)),
+            1,
+            tzinfo=UTC,
+        )
+        return month_start, (month_start + timedelta(days=32)).replace(day=1)
+
+    @staticmethod
+    def _purge_month(
+        month_dir: Path, column: str, start: datetime | None, stop: datetime | None
+    ) -> bool:
+        """
+        Remove rows within start and stop (both inclusive) from a monthly partition.
+        :return: True if rows were removed
+        """
+        files = sorted(month_dir.glob("*.parquet"))
+        if not files:
+            return False
+        data = concat([read_parquet(f) for f in files], ignore_index=True)
+        dates = to_datetime(data[column], unit="ms" if column == "timestamp" else None, utc=True)
+        purge = Series(True, index=data.index)
+        if start:
+            purge &= dates >= start
+        if stop:
+            purge &= dates <= stop
+        if not purge.any():
+            return False
+        data = data[~purge.to_numpy()].reset_index(drop=True)
+        if data.empty:
+            shutil.rmtree(month_dir)
+            return True
+        # Write next to the existing files first, so an interruption doesn't lose data.
+        tmp_file = month_dir / "purge.parquet.tmp"
+        data.to_parquet(tmp_file, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        for f in files:
+            f.unlink()
+        if column == "timestamp":
+            tmp_file.rename(month_dir / f"part-{int(data.iloc[0][column]):013d}.parquet")
+        else:
+            tmp_file.rename(month_dir / "data.parquet")
+        return True
+
+    @classmethod
+    def _purge_partitions(cls, root: Path, column: str, timerange: TimeRange | None) -> bool:
+        """
+        Remove all partitions below root - or only the data within timerange.
+        Months fully within the timerange are dropped, boundary months are rewritten.
+        :param root: Partition root (pair / timeframe / candle type or trades pair directory)
+        :param column: Date column - "date" for ohlcv, "timestamp" (epoch ms) for trades
+        :param timerange: Limit deletion to this timerange (both bounds inclusive)
+        :return: True if data was deleted
+        """
+        if not root.exists():
+            return False
+        start = timerange.startdt if timerange and timerange.starttype == "date" else None
+        stop = timerange.stopdt if timerange and timerange.stoptype == "date" else None
+        if start is None and stop is None:
+            shutil.rmtree(root)
+            return True
+
+        deleted = False
+        for month_dir in sorted(root.glob("year=*/month=*")):
+            month_start, month_end = cls._month_bounds(month_dir)
+            if (start and month_end <= start) or (stop and month_start > stop):
+                continue
+            if (start is None or month_start >= start) and (stop is None or month_end <= stop):
+                shutil.rmtree(month_dir)
+                deleted = True
+            else:
+                deleted = cls._purge_month(month_dir, column, start, stop) or deleted
+
+        for year_dir in root.glob("year=*"):
+            if not any(year_dir.iterdir()):
+                year_dir.rmdir()
+        if not any(root.iterdir()):
+            root.rmdir()
+        return deleted
+
+    @classmethod
+    def ohlcv_get_available_data(
+        cls, datadir: Path, trading_mode: TradingMode
+    ) -> ListPairsWithTimeframes:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        :param datadir: Directory to search for ohlcv files
+        :param trading_mode: trading-mode to be used
+        :return: List of Tuples of (pair, timeframe, CandleType)
+        """
+        if trading_mode == TradingMode.FUTURES:
+            datadir = datadir.joinpath("futures")
+        return [
+            (
+                cls.rebuild_pair_from_filename(cls._partition_value(p.parent.parent)),
+                cls.rebuild_timeframe_from_filename(cls._partition_value(p.parent)),
+                CandleType.from_string(cls._partition_value(p)),
+            )
+            for p in datadir.glob("ohlcv/pair=*/timeframe=*/candle_type=*")
+            if p.is_dir()
+        ]
+
+    @classmethod
+    def ohlcv_get_pairs(cls, datadir: Path, timeframe: str, candle_type: CandleType) -> list[str]:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        for the specified timeframe
+        :param datadir: Directory to search for ohlcv files
+        :param timeframe: Timeframe to search pairs for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: List of Pairs
+        """
+        if candle_type != CandleType.SPOT:
+            datadir = datadir.joinpath("futures")
+        pattern = (
+            f"ohlcv/pair=*/timeframe={cls.timeframe_to_file(timeframe)}/"
+            f"candle_type={CandleType.from_string(candle_type)}"
+        )
+        return [
+            cls.rebuild_pair_from_filename(cls._partition_value(p.parent.parent))
+            for p in datadir.glob(pattern)
+        ]
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data, replacing existing data for this pair.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        root = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if root.exists():
+            shutil.rmtree(root)
+        data = data.reset_index(drop=True).loc[:, self._columns]
+        for partition, part_data in self._split_months(data, data["date"]):
+            (root / partition).mkdir(parents=True, exist_ok=True)
+            part_data.to_parquet(
+                root / partition / "data.parquet", row_group_size=PARQUET_ROW_GROUP_SIZE
+            )
+        self._write_metadata(root, *self._dataframe_stats(data, "date"))
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Only partitions within the timerange are read.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        root = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        start: datetime | None = None
+        stop: datetime | None = None
+        if timerange and timerange.starttype == "date":
+            start = timerange.startdt
+        if timerange and timerange.stoptype == "date" and (stopdt := timerange.stopdt) is not None:
+            # Include the candle after the end of the timerange (see load_ohlcv_filtered)
+            stop = stopdt + timedelta(seconds=timeframe_to_seconds(timeframe))
+        files = self._partition_files(root, start, stop)
+        if not files:
+            return DataFrame(columns=self._columns)
+        try:
+            pairdata = load_ohlcv_filtered(files, "parquet", timerange, timeframe)
+            if pairdata is None:
+                pairdata = self._read_files(read_parquet, files)
+            pairdata.columns = self._columns
+            pairdata = pairdata.astype(
+                dtype={
+                    "open": "float",
+                    "high": "float",
+                    "low": "float",
+                    "close": "float",
+                    "volume": "float",
+                }
+            )
+            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            return pairdata
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {root}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Only partitions (months) contained in data are rewritten.
+        Appended candles replace stored candles with the same date.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        root = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        metadata = self._read_metadata(root)
+        data = data.reset_index(drop=True).loc[:, self._columns]
+        for partition, part_data in self._split_months(data, data["date"]):
+            filename = root / partition / "data.parquet"
+            if filename.exists():
+                part_data = (
+                    concat([read_parquet(filename), part_data], ignore_index=True)
+                    .drop_duplicates(subset="date", keep="last")
+                    .sort_values("date", kind="stable")
+                    .reset_index(drop=True)
+                )
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            part_data.to_parquet(filename, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        self._append_metadata(root, metadata, data, "date", replaces=True)
+
+    def ohlcv_purge(
+        self,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        timerange: TimeRange | None = None,
+    ) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :param timerange: Only delete candles within this timerange.
+                        Months fully within the timerange are dropped, boundary months rewritten.
+        :return: True when deleted, false if file did not exist.
+        """
+        root = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        return self._purge_partitions(root, "date", timerange)
+
+    def rename_futures_data(
+        self, pair: str, new_pair: str, timeframe: str, candle_type: CandleType
+    ):
+        """
+        Temporary method to migrate data from old naming to new naming (BTC/USDT -> BTC/USDT:USDT)
+        Only used for binance to support the binance futures naming unification.
+        """
+        dir_old = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        dir_new = self._pair_data_filename(self._datadir, new_pair, timeframe, candle_type)
+        if dir_new.exists():
+            logger.warning(f"{dir_new} exists already, can't migrate {pair}.")
+            return
+        dir_new.parent.mkdir(parents=True, exist_ok=True)
+        dir_old.rename(dir_new)
+
+    def fix_funding_fee_timeframe(self, ff_timeframe: str):
+        """
+        Temporary method to migrate data from old funding fee timeframe to the correct timeframe
+        Applies to bybit and okx, where funding-fee and mark candles have different timeframes.
+        """
+        paircombs = self.ohlcv_get_available_data(self._datadir, TradingMode.FUTURES)
+        funding_rate_combs = [
+            f for f in paircombs if f[2] == CandleType.FUNDING_RATE and f[1] != ff_timeframe
+        ]
+
+        if funding_rate_combs:
+            logger.warning(
+                f"Migrating {len(funding_rate_combs)} funding fees to correct timeframe."
+            )
+
+        for pair, timeframe, candletype in funding_rate_combs:
+            old_dir = self._pair_data_filename(self._datadir, pair, timeframe, candletype)
+            new_dir = self._pair_data_filename(self._datadir, pair, ff_timeframe, candletype)
+            if new_dir.exists():
+                logger.warning(f"{new_dir} already exists, Removing.")
+                shutil.rmtree(new_dir)
+            new_dir.parent.mkdir(parents=True, exist_ok=True)
+            old_dir.rename(new_dir)
+
+    @classmethod
+    def trades_get_available_data(cls, datadir: Path, trading_mode: TradingMode) -> list[str]:
+        """
+        Returns a list of all pairs with trades data available in this datadir
+        :param datadir: Directory to search for trades files
+        :param trading_mode: trading-mode to be used
+        :return: List of pairs
+        """
+        if trading_mode == TradingMode.FUTURES:
+            datadir = datadir.joinpath("futures")
+        return cls.trades_get_pairs(datadir)
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> list[str]:
+        """
+        Returns a list of all pairs for which trade data is available in this
+        :param datadir: Directory to search for trades files
+        :return: List of Pairs
+        """
+        return [
+            cls.rebuild_pair_from_filename(cls._partition_value(p))
+            for p in datadir.glob("trades/pair=*")
+            if p.is_dir()
+        ]
+
+    def _write_trades_partitions(self, root: Path, data: DataFrame) -> list[Path]:
+        """
+        Write trades as new files into their monthly partitions.
+        :return: List of partition directories written to
+        """
+        data = data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS]
+        dates = to_datetime(data["timestamp"], unit="ms", utc=True)
+        month_dirs = []
+        for partition, part_data in self._split_months(data, dates):
+            month_dir = root / partition
+            month_dir.mkdir(parents=True, exist_ok=True)
+            name = f"part-{int(part_data.iloc[0]['timestamp']):013d}"
+            filename = month_dir / f"{name}.parquet"
+            suffix = 0
+            while filename.exists():
+                suffix += 1
+                filename = month_dir / f"{name}-{suffix}.parquet"
+            part_data.to_parquet(filename, row_group_size=PARQUET_ROW_GROUP_SIZE)
+            month_dirs.append(month_dir)
+        return month_dirs
+
+    @staticmethod
+    def _compact_trades_partition(month_dir: Path) -> None:
+        files = sorted(month_dir.glob("*.parquet"))
+        if len(files) < 2:
+            return
+        data = (
+            concat([read_parquet(f) for f in files], ignore_index=True)
+            .sort_values("timestamp", kind="stable")
+            .reset_index(drop=True)
+        )
+        # Write next to the existing files first, so an interruption doesn't lose data.
+        tmp_file = month_dir / "compact.parquet.tmp"
+        data.to_parquet(tmp_file, row_group_size=PARQUET_ROW_GROUP_SIZE)
+        for f in files:
+            f.unlink()
+        tmp_file.rename(month_dir / f"part-{int(data.iloc[0]['timestamp']):013d}.parquet")
+
+    def trades_compact(self, pair: str, trading_mode: TradingMode) -> None:
+        """
+        Merge appended files of every monthly partition into one file per month.
+        :param pair: Pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        for month_dir in sorted(root.glob("year=*/month=*")):
+            self._compact_trades_partition(month_dir)
+
+    def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+        """
+        Store trades data, replacing existing trades for this pair.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if root.exists():
+            shutil.rmtree(root)
+        self._write_trades_partitions(root, data)
+
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
+        """
+        Append data to existing files.
+        New trades are written as additional files to the affected partitions.
+        Partitions are compacted once they contain too many files.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        metadata = self._read_metadata(root)
+        for month_dir in self._write_trades_partitions(root, data):
+            if len(list(month_dir.glob("*.parquet"))) >= self._append_compaction_threshold:
+                self._compact_trades_partition(month_dir)
+        self._append_metadata(root, metadata, data, "timestamp", replaces=False)
+
+    def trades_purge(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
+    ) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Only delete trades within this timerange.
+                        Months fully within the timerange are dropped, boundary months rewritten.
+        :return: True when deleted, false if file did not exist.
+        """
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        return self._purge_partitions(root, "timestamp", timerange)
+
+    def _trades_load(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
+    ) -> DataFrame:
+        """
+        Load trades for a pair from disk
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for - filters data to this range if provided
+        :return: Dataframe containing trades
+        """
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        time_filter = build_trades_time_filter(timerange)
+        start = stop = None
+        if time_filter is not None and timerange:
+            # Same bounds as used by the filter (trade timestamps, in ms)
+            if timerange.startts > 0:
+                start = datetime.fromtimestamp(timerange.startts / 1000, tz=UTC)
+            if timerange.stopts > 0:
+                stop = datetime.fromtimestamp(timerange.stopts / 1000, tz=UTC)
+        files = self._partition_files(root, start, stop)
+        if not files:
+            return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+
+        if time_filter is not None:
+            tradesdata = (
+                dataset.dataset(files, format="parquet").to_table(filter=time_filter).to_pandas()
+            )
+        else:
+            tradesdata = self._read_files(read_parquet, files)
+        if tradesdata["timestamp"].is_monotonic_increasing:
+            return tradesdata
+        return tradesdata.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, chunk_size: int
+    ) -> Iterator[DataFrame]:
+        root = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        yield from arrow_files_chunks(self._partition_files(root), "parquet", chunk_size)
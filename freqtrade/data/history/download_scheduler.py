@@ -0,0 +1,293 @@
+"""
+Concurrent, resumable download of candle (OHLCV) data for many pairs, timeframes and
+candle types.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+
+from pandas import DataFrame, concat
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.data.history.datahandlers import IDataHandler
+from freqtrade.data.history.history_cache import pair_history_cache
+from freqtrade.data.history.history_utils import _load_cached_data_for_updating
+from freqtrade.enums import CandleType
+from freqtrade.exchange import Exchange, timeframe_to_msecs
+from freqtrade.util import dt_ts, format_ms_time
+from freqtrade.util.progress_tracker import CustomProgress, retrieve_progress_tracker
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    pair: str
+    timeframe: str
+    candle_type: CandleType
+
+    @property
+    def key(self) -> str:
+        return f"{self.pair}|{self.timeframe}|{self.candle_type.value}"
+
+
+class DownloadScheduler:
+    """
+    Download candles for all jobs (pair, timeframe, candle type) concurrently.
+    All jobs run in the exchange's event loop, sharing the rate limiter of the ccxt
+    exchange - so the exchange's rate limit applies to all downloads combined.
+
+    Jobs download their timerange in segments of `segment_calls` requests. Each segment is
+    stored once downloaded, together with a checkpoint of the job's progress - so an
+    interrupted download resumes where it stopped, instead of starting the pair over.
+    """
+
+    # Number of candle requests per segment.
+    segment_calls = 100
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        data_handler: IDataHandler,
+        *,
+        timerange: TimeRange | None = None,
+        new_pairs_days: int = 30,
+        erase: bool = False,
+        prepend: bool = False,
+        workers: int = 4,
+    ) -> None:
+        """
+        :param workers: Number of jobs to download concurrently.
+        """
+        self._exchange = exchange
+        self._data_handler = data_handler
+        self._timerange = timerange
+        self._new_pairs_days = new_pairs_days
+        self._erase = erase
+        self._prepend = prepend
+        self._workers = max(workers, 1)
+        self.jobs: list[DownloadJob] = []
+        self.failed_jobs: list[DownloadJob] = []
+        self.candles = 0
+        self.requests = 0
+
+        # Checkpoints are only valid for downloads with identical parameters
+        self._params = {
+            "format": data_handler._get_file_extension(),
+            "timerange": (
+                [timerange.starttype, timerange.stoptype, timerange.startts, timerange.stopts]
+                if timerange
+                else None
+            ),
+            "erase": erase,
+            "prepend": prepend,
+        }
+        self._checkpoint_lock = Lock()
+        self._checkpoints = self._load_checkpoints()
+
+    @property
+    def checkpoint_file(self) -> Path:
+        return self._data_handler._datadir / ".metadata" / "download-checkpoints.json"
+
+    def _load_checkpoints(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.checkpoint_file.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring invalid download checkpoints in {self.checkpoint_file}.")
+            return {}
+
+    def _save_checkpoint(self, job: DownloadJob, checkpoint: dict | None) -> None:
+        """
+        Store (or remove, if checkpoint is None) the checkpoint of job.
+        """
+        with self._checkpoint_lock:
+            if checkpoint is None:
+                if self._checkpoints.pop(job.key, None) is None:
+                    return
+            else:
+                self._checkpoints[job.key] = checkpoint
+
+            if not self._checkpoints:
+                self.checkpoint_file.unlink(missing_ok=True)
+                return
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first - an interruption must not corrupt the file
+            tmp_file = self.checkpoint_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(self._checkpoints))
+            tmp_file.replace(self.checkpoint_file)
+
+    def add_job(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        job = DownloadJob(pair, timeframe, candle_type)
+        if job not in self.jobs:
+            self.jobs.append(job)
+
+    def run(self, progress_tracker: CustomProgress | None = None) -> None:
+        """
+        Download all jobs. Blocks until all jobs are finished.
+        Failed jobs are logged, and available in `failed_jobs`.
+        """
+        progress_tracker = retrieve_progress_tracker(progress_tracker)
+        start = time.monotonic()
+        requests_start = self._exchange._ohlcv_request_count
+        with progress_tracker as progress:
+            task = progress.add_task("Downloading data...", total=len(self.jobs))
+            with self._exchange._loop_lock:
+                self._exchange.loop.run_until_complete(self._run_jobs(progress, task))
+
+        duration = max(time.monotonic() - start, 0.001)
+        self.requests = self._exchange._ohlcv_request_count - requests_start
+        logger.info(
+            f"Downloaded {self.candles} candles with {self.requests} requests "
+            f"in {duration:.1f}s ({self.candles / duration:.1f} candles/s, "
+            f"{self.requests / duration:.1f} requests/s)."
+        )
+
+    async def _run_jobs(self, progress: CustomProgress, task) -> None:
+        semaphore = asyncio.Semaphore(self._workers)
+
+        async def run_job(job: DownloadJob) -> None:
+            async with semaphore:
+                if not await self._download_job(job):
+                    self.failed_jobs.append(job)
+                progress.update(
+                    task, advance=1, description=f"Downloaded {job.pair}, {job.timeframe}"
+                )
+
+        await asyncio.gather(*(run_job(job) for job in self.jobs))
+
+    def _prepare_job(self, job: DownloadJob) -> tuple[DataFrame, int, int | None]:
+        """
+        Load existing data, and determine the timerange to download - resuming from the
+        job's checkpoint if available.
+        :return: Existing data, since_ms, until_ms
+        """
+        checkpoint = self._checkpoints.get(job.key)
+        resume = checkpoint is not None and checkpoint["params"] == self._params
+        if self._erase and not resume:
+            if self._data_handler.ohlcv_purge(job.pair, job.timeframe, job.candle_type):
+                logger.info(
+                    f"Deleting existing data for pair {job.pair}, {job.timeframe}, "
+                    f"{job.candle_type}."
+                )
+
+        data, since_ms, until_ms = _load_cached_data_for_updating(
+            job.pair,
+            job.timeframe,
+            self._timerange,
+            data_handler=self._data_handler,
+            candle_type=job.candle_type,
+            prepend=self._prepend,
+        )
+        if resume and checkpoint is not None:
+            since_ms, until_ms = checkpoint["next_ms"], checkpoint["until_ms"]
+            logger.info(
+                f"Resuming download of {job.pair}, {job.timeframe}, {job.candle_type} "
+                f"from {format_ms_time(since_ms)}."
+            )
+        if not since_ms:
+            since_ms = int((datetime.now() - timedelta(days=self._new_pairs_days)).timestamp())
+            since_ms *= 1000
+        return data, since_ms, until_ms
+
+    def _store_segment(self, job: DownloadJob, data: DataFrame, new_data: DataFrame) -> DataFrame:
+        """
+        Store downloaded candles.
+        :param data: Data stored so far
+        :param new_data: Newly downloaded candles
+        :return: Data stored so far - only the latest stored candles if candles were appended
+        """
+        if new_data.empty:
+            return data
+        if not data.empty and not self._prepend:
+            if new_data.iloc[-1]["date"] < data.iloc[-1]["date"]:
+                return data
+            # The last stored candle is stored again, as it may have been incomplete.
+            new_candles = new_data.loc[new_data["date"] >= data.iloc[-1]["date"]]
+            try:
+                self._data_handler.ohlcv_append(
+                    job.pair, job.timeframe, data=new_candles, candle_type=job.candle_type
+                )
+                return new_candles
+            except NotImplementedError:
+                # Data format doesn't support appending - rewrite the whole file.
+                pass
+
+        if not data.empty:
+            new_data = clean_ohlcv_dataframe(
+                concat([data, new_data], axis=0),
+                job.timeframe,
+                job.pair,
+                fill_missing=False,
+                drop_incomplete=False,
+            )
+        self._data_handler.ohlcv_store(
+            job.pair, job.timeframe, data=new_data, candle_type=job.candle_type
+        )
+        return new_data
+
+    async def _download_job(self, job: DownloadJob) -> bool:
+        """
+        Download the candles of one job, segment by segment.
+        :return: bool with success state
+        """
+        try:
+            data, since_ms, until_ms = await asyncio.to_thread(self._prepare_job, job)
+            end_ms = until_ms or dt_ts()
+            logger.info(
+                f'Download history data for "{job.pair}", {job.timeframe}, {job.candle_type} '
+                f"and store in {self._data_handler._datadir}. From {format_ms_time(since_ms)} "
+                f"to {format_ms_time(until_ms) if until_ms else 'now'}"
+            )
+            timeframe_ms = timeframe_to_msecs(job.timeframe)
+            segment_ms = (
+                timeframe_ms
+                * self._exchange.ohlcv_candle_limit(job.timeframe, job.candle_type, since_ms)
+                * self.segment_calls
+            )
+            while since_ms < end_ms:
+                segment_end = min(since_ms + segment_ms, end_ms)
+                new_data = await self._exchange._async_get_historic_ohlcv_df(
+                    pair=job.pair,
+                    timeframe=job.timeframe,
+                    since_ms=since_ms,
+                    candle_type=job.candle_type,
+                    # Detect the listing date (if supported) until data was found
+                    is_new_pair=data.empty,
+                    until_ms=segment_end,
+                )
+                data = await asyncio.to_thread(self._store_segment, job, data, new_data)
+                self.candles += len(new_data)
+                next_ms = segment_end
+                if not new_data.empty:
+                    # The last candle of each download is dropped as incomplete.
+                    next_ms = min(next_ms, dt_ts(new_data.iloc[-1]["date"]) + timeframe_ms)
+                since_ms = next_ms if next_ms > since_ms else segment_end
+                await asyncio.to_thread(
+                    self._save_checkpoint,
+                    job,
+                    {"params": self._params, "next_ms": since_ms, "until_ms": until_ms},
+                )
+
+            await asyncio.to_thread(self._save_checkpoint, job, None)
+            return True
+        except Exception:
+            logger.exception(
+                f'Failed to download history data for pair: "{job.pair}", '
+                f"timeframe: {job.timeframe}, {job.candle_type}."
+            )
+            return False
+        finally:
+            # Free memory used by cached, now outdated data.
+            pair_history_cache.invalidate(
+                self._data_handler._datadir.resolve(), job.pair, job.timeframe, job.candle_type
+            )
@@ -0,0 +1,128 @@
+"""
+Process-wide cache of loaded pair histories.
+Used by long running processes (webserver) and commands running multiple backtests
+(lookahead-analysis, recursive-analysis), which would otherwise load the same files
+from disk over and over again.
+"""
+
+import logging
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from threading import Lock
+
+from cachetools import LRUCache
+from pandas import DataFrame
+
+from freqtrade.constants import Config
+
+
+logger = logging.getLogger(__name__)
+
+# Cache size (in MB) used by commands enabling the cache, unless configured otherwise.
+DEFAULT_DATALOAD_CACHE_SIZE = 1024
+
+
+def _dataframe_size(value: tuple[list, DataFrame]) -> int:
+    return max(int(value[1].memory_usage(index=True).sum()), 1)
+
+
+class PairHistoryCache:
+    """
+    LRU cache of loaded dataframes, bounded by their memory usage.
+    Entries are keyed by the data files they were loaded from (datadir, pair, timeframe,
+    candle type) plus the load parameters - and are only valid as long as the signature
+    (size / mtime) of the data files doesn't change.
+    Disabled (size 0) unless enabled via `configure()`.
+    """
+
+    def __init__(self, max_size_mb: int = 0) -> None:
+        self._lock = Lock()
+        self._cache: LRUCache | None = None
+        self.set_size(max_size_mb)
+
+    def set_size(self, max_size_mb: int) -> None:
+        """
+        Change the size of the cache. Drops all cached entries.
+        :param max_size_mb: Maximum memory usage of cached dataframes in MB. 0 disables the cache.
+        """
+        with self._lock:
+            self._cache = (
+                LRUCache(maxsize=max_size_mb * 1024 * 1024, getsizeof=_dataframe_size)
+                if max_size_mb > 0
+                else None
+            )
+
+    def configure(self, config: Config) -> None:
+        """
+        Enable the cache, sized according to the `dataload_cache_size` setting.
+        """
+        size = config.get("dataload_cache_size", DEFAULT_DATALOAD_CACHE_SIZE)
+        logger.info(f"Using pair history cache of {size} MB.")
+        self.set_size(size)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    @property
+    def currsize(self) -> int:
+        """Memory usage of cached dataframes, in bytes"""
+        with self._lock:
+            return int(self._cache.currsize) if self._cache is not None else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache) if self._cache is not None else 0
+
+    def get_or_load(
+        self,
+        key: tuple[Hashable, ...],
+        signature: list,
+        loader: Callable[[], DataFrame],
+    ) -> DataFrame:
+        """
+        Return a copy of the cached dataframe for key - loading it using loader if necessary.
+        :param key: Cache key. Must start with (datadir, pair, timeframe, candle_type).
+        :param signature: Signature of the data files - cached data for a different
+                          signature is outdated.
+        :param loader: Function loading the dataframe.
+        :return: Dataframe - callers may modify it, without affecting the cache.
+        """
+        if self._cache is None or not signature:
+            return loader()
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1].copy()
+
+        df = loader()
+        with self._lock:
+            if self._cache is not None:
+                try:
+                    self._cache[key] = (signature, df)
+                except ValueError:
+                    # Dataframe is larger than the whole cache
+                    logger.debug(f"Unable to cache {key[1:4]}, data too large.")
+        return df.copy()
+
+    def invalidate(
+        self,
+        datadir: Path | None = None,
+        pair: str | None = None,
+        timeframe: str | None = None,
+        candle_type: str | None = None,
+    ) -> None:
+        """
+        Remove cached entries matching all given arguments.
+        Called when data is written, to free memory used by outdated entries.
+        """
+        match = (datadir, pair, timeframe, candle_type)
+        with self._lock:
+            if self._cache is None:
+                return
+            for key in list(self._cache.keys()):
+                if all(m is None or m == k for m, k in zip(match, key[:4], strict=False)):
+                    del self._cache[key]
+
+
+pair_history_cache = PairHistoryCache()
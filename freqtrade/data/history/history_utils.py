@@ -1,5 +1,7 @@
 import logging
 import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -17,10 +19,12 @@ from freqtrade.constants import (
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
-    trades_df_remove_duplicates,
+    trades_df_merge,
+    trades_df_new_trades,
     trades_list_to_df,
 )
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.data.history.history_cache import pair_history_cache
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
@@ -46,6 +50,7 @@ def load_pair_history(
     data_format: str | None = None,
     data_handler: IDataHandler | None = None,
     candle_type: CandleType = CandleType.SPOT,
+    resample: bool = False,
 ) -> DataFrame:
     """
     Load cached ohlcv history for the given pair.
@@ -61,19 +66,63 @@ def load_pair_history(
     :param data_handler: Initialized data-handler to use.
                          Will be initialized from data_format if not set
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param resample: Build timeframe from a smaller timeframe if no data for timeframe
+                     is available.
     :return: DataFrame with ohlcv data, or empty DataFrame
     """
     data_handler = get_datahandler(datadir, data_format, data_handler)
 
-    return data_handler.ohlcv_load(
-        pair=pair,
-        timeframe=timeframe,
-        timerange=timerange,
-        fill_missing=fill_up_missing,
-        drop_incomplete=drop_incomplete,
-        startup_candles=startup_candles,
-        candle_type=candle_type,
+    def _load() -> DataFrame:
+        return data_handler.ohlcv_load(
+            pair=pair,
+            timeframe=timeframe,
+            timerange=timerange,
+            fill_missing=fill_up_missing,
+            drop_incomplete=drop_incomplete,
+            startup_candles=startup_candles,
+            candle_type=candle_type,
+            resample=resample,
+        )
+
+    if not pair_history_cache.enabled:
+        return _load()
+
+    key = (
+        data_handler._datadir.resolve(),
+        pair,
+        timeframe,
+        candle_type,
+        type(data_handler).__name__,
+        (timerange.starttype, timerange.startts, timerange.stoptype, timerange.stopts)
+        if timerange
+        else None,
+        fill_up_missing,
+        drop_incomplete,
+        startup_candles,
+        resample,
     )
+    signature = _pair_data_signature(data_handler, pair, timeframe, candle_type)
+    if not signature and resample:
+        # Resampled data is valid as long as the data it's built from doesn't change.
+        if base_timeframe := data_handler.resample_base_timeframe(pair, timeframe, candle_type):
+            signature = _pair_data_signature(data_handler, pair, base_timeframe, candle_type)
+    return pair_history_cache.get_or_load(key, signature, _load)
+
+
+def _pair_data_signature(
+    data_handler: IDataHandler, pair: str, timeframe: str, candle_type: CandleType
+) -> list:
+    """
+    Signature (size / mtime) of the files containing data for pair.
+    Empty if no data is available.
+    """
+    for no_timeframe_modify in (False, True):
+        filename = data_handler._pair_data_filename(
+            data_handler._datadir, pair, timeframe, candle_type, no_timeframe_modify
+        )
+        if files := data_handler._data_files(filename):
+            return data_handler._files_signature(files)
+    return []
 
 
 def load_data(
@@ -88,9 +137,12 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int | None = None,
+    resample: bool = False,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
+    Pairs are loaded in parallel, using a thread pool.
 
     :param datadir: Path to the data storage location.
     :param timeframe: Timeframe (e.g. "5m")
@@ -101,6 +153,10 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of pairs to load in parallel.
+                    Defaults to the number of CPUs (max. 8). 1 loads pairs sequentially.
+    :param resample: Build timeframe from a smaller timeframe for pairs without data
+                     in timeframe.
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -109,8 +165,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -119,7 +175,19 @@ def load_data(
             startup_candles=startup_candles,
             data_handler=data_handler,
             candle_type=candle_type,
+            resample=resample,
         )
+
+    workers = dataload_workers(workers, len(pairs))
+    if workers > 1:
+        logger.debug(f"Loading {len(pairs)} pairs using {workers} workers.")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() keeps the order of pairs
+            histories = list(executor.map(load_pair, pairs))
+    else:
+        histories = [load_pair(pair) for pair in pairs]
+
+    for pair, hist in zip(pairs, histories, strict=True):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -133,6 +201,17 @@ def load_data(
     return result
 
 
+def dataload_workers(workers: int | None, pair_count: int) -> int:
+    """
+    Number of threads to use to load data for pair_count pairs.
+    :param workers: Configured number of workers (`dataload_workers`) - None for automatic.
+    :param pair_count: Number of pairs to load
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8)
+    return max(1, min(workers, pair_count))
+
+
 def refresh_data(
     *,
     datadir: Path,
@@ -315,6 +394,24 @@ def _download_pair_history(
                 f"Downloaded data for {pair} with length {len(new_dataframe)}. Parallel Method."
             )
 
+        if not data.empty and not prepend:
+            # Only store new candles. The last stored candle is stored again,
+            # as it may have been incomplete.
+            if new_dataframe.empty or new_dataframe.iloc[-1]["date"] < data.iloc[-1]["date"]:
+                return True
+            new_candles = new_dataframe.loc[new_dataframe["date"] >= data.iloc[-1]["date"]]
+            try:
+                data_handler.ohlcv_append(
+                    pair, timeframe, data=new_candles, candle_type=candle_type
+                )
+                logger.debug(
+                    "New End: %s", f"{new_candles.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                )
+                return True
+            except NotImplementedError:
+                # Data format doesn't support appending - rewrite the whole file.
+                pass
+
         if data.empty:
             data = new_dataframe
         else:
@@ -345,6 +442,9 @@ def _download_pair_history(
             f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
         )
         return False
+    finally:
+        # Free memory used by cached, now outdated data.
+        pair_history_cache.invalidate(data_handler._datadir.resolve(), pair, timeframe, candle_type)
 
 
 def refresh_backtest_ohlcv_data(
@@ -360,18 +460,35 @@ def refresh_backtest_ohlcv_data(
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
     no_parallel_download: bool = False,
+    workers: int | None = None,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param workers: Download this many pairs / timeframes concurrently, using the
+                    DownloadScheduler. None downloads one after the other.
     :return: List of pairs that are not available.
     """
-    progress_tracker = retrieve_progress_tracker(progress_tracker)
-
     pairs_not_available = []
     fast_candles: dict[PairWithTimeframe, DataFrame] = {}
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
+    if workers is not None:
+        return _refresh_backtest_ohlcv_data_concurrent(
+            exchange,
+            pairs=pairs,
+            timeframes=timeframes,
+            data_handler=data_handler,
+            trading_mode=trading_mode,
+            timerange=timerange,
+            new_pairs_days=new_pairs_days,
+            erase=erase,
+            prepend=prepend,
+            progress_tracker=progress_tracker,
+            workers=workers,
+        )
+
+    progress_tracker = retrieve_progress_tracker(progress_tracker)
     with progress_tracker as progress:
         tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
         timeframe_task = progress.add_task("Timeframe", total=tf_length)
@@ -460,6 +577,56 @@ def refresh_backtest_ohlcv_data(
     return pairs_not_available
 
 
+def _refresh_backtest_ohlcv_data_concurrent(
+    exchange: Exchange,
+    pairs: list[str],
+    timeframes: list[str],
+    data_handler: IDataHandler,
+    trading_mode: str,
+    timerange: TimeRange | None,
+    new_pairs_days: int,
+    erase: bool,
+    prepend: bool,
+    progress_tracker: CustomProgress | None,
+    workers: int,
+) -> list[str]:
+    """
+    Variant of refresh_backtest_ohlcv_data downloading all pairs, timeframes and
+    candle types concurrently.
+    :return: List of pairs that are not available.
+    """
+    from freqtrade.data.history.download_scheduler import DownloadScheduler
+
+    pairs_not_available = []
+    candle_type = CandleType.get_default(trading_mode)
+    scheduler = DownloadScheduler(
+        exchange,
+        data_handler,
+        timerange=timerange,
+        new_pairs_days=new_pairs_days,
+        erase=erase,
+        prepend=prepend,
+        workers=workers,
+    )
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        for timeframe in timeframes:
+            scheduler.add_job(pair, str(timeframe), candle_type)
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            scheduler.add_job(pair, str(tf_funding_rate), CandleType.FUNDING_RATE)
+            scheduler.add_job(pair, str(tf_mark), fr_candle_type)
+
+    scheduler.run(progress_tracker)
+    return pairs_not_available
+
+
 def _download_all_pairs_history_parallel(
     exchange: Exchange,
     pairs: list[str],
@@ -490,11 +657,37 @@ def _download_all_pairs_history_parallel(
         needed_pairs: ListPairsWithTimeframes = [
             (p, timeframe, candle_type) for p in [p for p in pairs]
         ]
-        candles = exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since, cache=False)
+        candles = dict(exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since, cache=False))
 
     return candles
 
 
+def _store_new_trades(
+    data_handler: IDataHandler,
+    pair: str,
+    trading_mode: TradingMode,
+    trades: DataFrame,
+    new_trades: DataFrame,
+) -> None:
+    """
+    Store downloaded trades - appended to the stored trades if the data format supports it.
+    :param trades: Last stored trades - empty if no trades are stored
+    :param new_trades: Downloaded trades, not contained in the stored trades
+    """
+    if trades.empty:
+        data_handler.trades_store(pair, new_trades, trading_mode)
+    elif not new_trades.empty:
+        try:
+            data_handler.trades_append(pair, new_trades, trading_mode)
+        except NotImplementedError:
+            # Data format doesn't support appending - rewrite the whole file.
+            data_handler.trades_store(
+                pair,
+                trades_df_merge(data_handler.trades_load(pair, trading_mode), new_trades),
+                trading_mode,
+            )
+
+
 def _download_trades_history(
     exchange: Exchange,
     pair: str,
@@ -516,17 +709,25 @@ def _download_trades_history(
         if timerange.stoptype == "date":
             until = timerange.stopts * 1000
 
-    trades = data_handler.trades_load(pair, trading_mode)
+    first_date, last_date, trades_count = data_handler.trades_data_min_max(pair, trading_mode)
+    # Only the last stored trades are needed to continue the download.
+    seam_start = dt_ts(last_date) - 5 * 1000
+    trades = data_handler.trades_load(
+        pair, trading_mode, timerange=TimeRange("date", None, seam_start, 0)
+    )
+    trades = trades.loc[trades["timestamp"] >= seam_start]
+    if trades.empty:
+        trades_count = 0
 
     # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
     # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
     # DEFAULT_TRADES_COLUMNS: 1 -> id
 
-    if not trades.empty and since > 0 and (since + 1000) < trades.iloc[0]["timestamp"]:
+    if not trades.empty and since > 0 and (since + 1000) < dt_ts(first_date):
         # since is before the first trade
         raise ValueError(
             f"Start {format_ms_time_det(since)} earlier than "
-            f"available data ({format_ms_time_det(trades.iloc[0]['timestamp'])}). "
+            f"available data ({format_ms_time_det(dt_ts(first_date))}). "
             f"Please use `--erase` if you'd like to redownload {pair}."
         )
 
@@ -545,13 +746,13 @@ def _download_trades_history(
 
     logger.debug(
         "Current Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if trades.empty else f"{first_date:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "Current End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if trades.empty else f"{last_date:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"Current Amount of trades: {len(trades)}")
+    logger.info(f"Current Amount of trades: {trades_count}")
 
     new_trades = exchange.get_historic_trades(
         pair=pair,
@@ -559,21 +760,24 @@ def _download_trades_history(
         until=until,
         from_id=from_id,
     )
-    new_trades_df = trades_list_to_df(new_trades[1])
-    trades = concat([trades, new_trades_df], axis=0)
-    # Remove duplicates to make sure we're not storing data we don't need
-    trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    # Trades overlapping with the existing data are already stored.
+    new_trades_df = trades_df_new_trades(trades, trades_list_to_df(new_trades[1]))
+    _store_new_trades(data_handler, pair, trading_mode, trades, new_trades_df)
+    if not new_trades_df.empty:
+        if trades.empty:
+            first_date = new_trades_df.iloc[0]["date"]
+        trades_count += len(new_trades_df)
+        last_date = max(last_date, new_trades_df.iloc[-1]["date"])
 
     logger.debug(
         "New Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{first_date:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "New End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{last_date:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"New Amount of trades: {len(trades)}")
+    logger.info(f"New Amount of trades: {trades_count}")
     return True
 
 
@@ -766,6 +970,7 @@ def download_data(
                     data_format_ohlcv=config["dataformat_ohlcv"],
                     data_format_trades=config["dataformat_trades"],
                     candle_type=config.get("candle_type_def", CandleType.SPOT),
+                    workers=config.get("dataload_workers"),
                 )
         else:
             if not exchange.get_option("ohlcv_has_history", True):
@@ -794,6 +999,7 @@ def download_data(
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
                 no_parallel_download=config.get("no_parallel_download", False),
+                workers=config.get("download_workers"),
             )
     finally:
         if pairs_not_available:
@@ -18,7 +18,7 @@ from freqtrade.exchange.binance_public_data import (
     download_archive_trades,
 )
 from freqtrade.exchange.common import retrier
-from freqtrade.exchange.exchange_types import FtHas, Tickers
+from freqtrade.exchange.exchange_types import FtHas, OHLCVResponse, Tickers
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
 from freqtrade.misc import deep_merge_dicts, json_load
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts
@@ -39,6 +39,7 @@ class Binance(Exchange):
         "trades_pagination_arg": "fromId",
         "trades_has_history": True,
         "fetch_orders_limit_minutes": None,
+        "fetch_open_orders_all_pairs": False,  # Heavily rate-limited without a pair
         "l2_limit_range": [5, 10, 20, 50, 100, 500, 1000],
         "ws_enabled": True,
         "has_delisting": True,
@@ -160,33 +161,12 @@ class Binance(Exchange):
                 x = self.loop.run_until_complete(
                     self._async_get_candle_history(pair, timeframe, candle_type, 0)
                 )
-            if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
-                # Set starting date to first available candle.
-                since_ms = x[3][0][0]
-                logger.info(
-                    f"Candle-data for {pair} available starting with "
-                    f"{datetime.fromtimestamp(since_ms // 1000, tz=UTC).isoformat()}."
-                )
-                if until_ms and since_ms >= until_ms:
-                    logger.warning(
-                        f"No available candle-data for {pair} before "
-                        f"{dt_from_ts(until_ms).isoformat()}"
-                    )
-                    return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
-
-        if (
-            self._config["exchange"].get("only_from_ccxt", False)
-            or
-            # only download timeframes with significant improvements,
-            # otherwise fall back to rest API
-            not (
-                (candle_type == CandleType.SPOT and timeframe in ["1s", "1m", "3m", "5m"])
-                or (
-                    candle_type == CandleType.FUTURES
-                    and timeframe in ["1m", "3m", "5m", "15m", "30m"]
-                )
-            )
-        ):
+            listing_since_ms = self._listing_since_ms(pair, since_ms, until_ms, x)
+            if listing_since_ms is None:
+                return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+            since_ms = listing_since_ms
+
+        if not self._use_archive_ohlcv(timeframe, candle_type):
             return super().get_historic_ohlcv(
                 pair=pair,
                 timeframe=timeframe,
@@ -206,6 +186,94 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async version of get_historic_ohlcv, including "fast new pair" detection
+        and downloads from data.binance.vision.
+        """
+        if is_new_pair and candle_type in (CandleType.SPOT, CandleType.FUTURES, CandleType.MARK):
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
+            listing_since_ms = self._listing_since_ms(pair, since_ms, until_ms, x)
+            if listing_since_ms is None:
+                return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+            since_ms = listing_since_ms
+
+        df = DataFrame()
+        rest_since_ms = since_ms
+        if self._use_archive_ohlcv(timeframe, candle_type):
+            df = await download_archive_ohlcv(
+                candle_type=candle_type,
+                pair=pair,
+                timeframe=timeframe,
+                since_ms=since_ms,
+                until_ms=until_ms,
+                markets=self.markets,
+                cache_dir=self._archive_cache_dir(),
+            )
+            if not df.empty:
+                rest_since_ms = dt_ts(df.iloc[-1].date) + timeframe_to_msecs(timeframe)
+            if until_ms and rest_since_ms > until_ms:
+                return df
+
+        rest_df = await super()._async_get_historic_ohlcv_df(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=rest_since_ms,
+            candle_type=candle_type,
+            is_new_pair=is_new_pair,
+            until_ms=until_ms,
+        )
+        return concat_safe([df, rest_df])
+
+    def _listing_since_ms(
+        self, pair: str, since_ms: int, until_ms: int | None, first_candles: OHLCVResponse
+    ) -> int | None:
+        """
+        Move since_ms to the pair's listing date, if the pair was listed after since_ms.
+        :param first_candles: Response of a candle request with since=0 (the oldest candles)
+        :return: New since_ms - or None if there's no candle-data before until_ms
+        """
+        x = first_candles
+        if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
+            # Set starting date to first available candle.
+            since_ms = x[3][0][0]
+            logger.info(
+                f"Candle-data for {pair} available starting with "
+                f"{datetime.fromtimestamp(since_ms // 1000, tz=UTC).isoformat()}."
+            )
+            if until_ms and since_ms >= until_ms:
+                logger.warning(
+                    f"No available candle-data for {pair} before {dt_from_ts(until_ms).isoformat()}"
+                )
+                return None
+        return since_ms
+
+    def _use_archive_ohlcv(self, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Only download timeframes with significant improvements from data.binance.vision,
+        otherwise fall back to rest API
+        """
+        return not self._config["exchange"].get("only_from_ccxt", False) and (
+            (candle_type == CandleType.SPOT and timeframe in ["1s", "1m", "3m", "5m"])
+            or (candle_type == CandleType.FUTURES and timeframe in ["1m", "3m", "5m", "15m", "30m"])
+        )
+
+    def _archive_cache_dir(self) -> Path | None:
+        """
+        Directory caching archives downloaded from data.binance.vision - None if disabled.
+        """
+        if self._config["exchange"].get("archive_cache", False) and self._config.get("datadir"):
+            return Path(self._config["datadir"]) / ".archive_cache"
+        return None
+
     def get_historic_ohlcv_fast(
         self,
         pair: str,
@@ -227,6 +295,7 @@ class Binance(Exchange):
                     since_ms=since_ms,
                     until_ms=until_ms,
                     markets=self.markets,
+                    cache_dir=self._archive_cache_dir(),
                 )
             )
 
@@ -417,6 +486,7 @@ class Binance(Exchange):
                 since_ms=since,
                 until_ms=until,
                 markets=self.markets,
+                cache_dir=self._archive_cache_dir(),
             )
 
             if not res:
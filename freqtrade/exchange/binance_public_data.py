@@ -4,11 +4,21 @@ Documentation can be found in https://github.com/binance/binance-public-data
 """
 
 import asyncio
+import atexit
+import hashlib
 import logging
+import multiprocessing
+import os
+import re
 import zipfile
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, timedelta
 from io import BytesIO
-from typing import Any
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import urlparse
 
 import aiohttp
 import numpy as np
@@ -16,13 +26,17 @@ import pandas as pd
 from pandas import DataFrame
 
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import ohlcv_resample
 from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
 from freqtrade.misc import chunks
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_now
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Http404(Exception):
     def __init__(self, msg, date, url):
@@ -37,6 +51,134 @@ class BadHttpStatus(Exception):
     pass
 
 
+class BadChecksum(Exception):
+    """Downloaded archive doesn't match its published checksum"""
+
+    pass
+
+
+# Timeframes of the daily kline archives
+ARCHIVE_TIMEFRAMES = [
+    "1s",
+    "1m",
+    "3m",
+    "5m",
+    "15m",
+    "30m",
+    "1h",
+    "2h",
+    "4h",
+    "6h",
+    "8h",
+    "12h",
+    "1d",
+]
+
+# Downloads of at least this many days parse archives in a process pool.
+PROCESS_POOL_MIN_DAYS = 30
+
+# Errors parsing an archive - the archive is unusable, and removed from the archive cache.
+ARCHIVE_PARSE_ERRORS = (zipfile.BadZipFile, ValueError)
+
+_parse_executor: ProcessPoolExecutor | None = None
+
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """
+    Process pool parsing downloaded archives, shared by all downloads.
+    """
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 8),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_executor
+
+
+@atexit.register
+def shutdown_parse_executor() -> None:
+    """
+    Shut down the process pool parsing archives - it's created again when needed.
+    """
+    global _parse_executor
+    executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def parse_archive(func: Callable[[bytes], T], content: bytes, executor: Executor | None) -> T:
+    """
+    Parse archive content with func in executor.
+    A broken process pool (e.g. a worker killed by the OOM killer) is replaced by a new
+    process pool, which parses the archive again.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, content)
+    except BrokenProcessPool:
+        if executor is _parse_executor:
+            logger.warning("Archive parsing process pool is broken, starting a new one.")
+            shutdown_parse_executor()
+        return await loop.run_in_executor(get_parse_executor(), func, content)
+
+
+class ArchiveCache:
+    """
+    Local, content-addressed cache of archives downloaded from data.binance.vision.
+    Archives are stored once per content in `objects/` (named by their sha256 checksum),
+    and referenced by their url in `refs/`.
+    Archives are verified against their checksum whenever they're read - corrupted archives
+    are removed from the cache, so they're downloaded again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _ref_file(self, url: str) -> Path:
+        return self.directory / "refs" / f"{urlparse(url).path.lstrip('/')}.sha256"
+
+    def _object_file(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / f"{digest}.zip"
+
+    @staticmethod
+    def _write_atomic(file: Path, content: bytes) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(content)
+        tmp_file.replace(file)
+
+    def get(self, url: str) -> bytes | None:
+        """
+        :return: Content of the archive downloaded from url, None if not cached.
+        """
+        try:
+            digest = self._ref_file(url).read_text().strip()
+            content = self._object_file(digest).read_bytes()
+        except (OSError, ValueError):
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            logger.warning(f"Removing corrupted archive {url} from the archive cache.")
+            # The object is corrupted for all urls referencing it.
+            self._object_file(digest).unlink(missing_ok=True)
+            self.remove(url)
+            return None
+        return content
+
+    def put(self, url: str, content: bytes) -> None:
+        digest = hashlib.sha256(content).hexdigest()
+        object_file = self._object_file(digest)
+        if not object_file.exists():
+            self._write_atomic(object_file, content)
+        self._write_atomic(self._ref_file(url), digest.encode())
+
+    def remove(self, url: str) -> None:
+        """
+        Remove url from the cache. The archive itself is kept - other urls may reference it.
+        """
+        self._ref_file(url).unlink(missing_ok=True)
+
+
 async def download_archive_ohlcv(
     candle_type: CandleType,
     pair: str,
@@ -46,6 +188,7 @@ async def download_archive_ohlcv(
     until_ms: int | None,
     markets: dict[str, Any],
     stop_on_404: bool = True,
+    cache_dir: Path | None = None,
 ) -> DataFrame:
     """
     Fetch OHLCV data from https://data.binance.vision
@@ -62,6 +205,7 @@ async def download_archive_ohlcv(
     :markets: the CCXT markets dict, when it's None, the function will load the markets data
         from a new `ccxt.binance` instance
     :param stop_on_404: Stop to download the following data when a 404 returned
+    :param cache_dir: Directory of the archive cache. `None` disables the cache.
     :return: the date range is between [since_ms, until_ms), return an empty DataFrame if no data
         available in the time range
     """
@@ -78,7 +222,14 @@ async def download_archive_ohlcv(
         if start >= end:
             return DataFrame()
         df = await _download_archive_ohlcv(
-            symbol, pair, timeframe, candle_type, start, end, stop_on_404
+            symbol,
+            pair,
+            timeframe,
+            candle_type,
+            start,
+            end,
+            stop_on_404,
+            ArchiveCache(cache_dir) if cache_dir else None,
         )
         logger.debug(
             f"Downloaded data for {pair} from https://data.binance.vision with length {len(df)}."
@@ -113,18 +264,31 @@ async def _download_archive_ohlcv(
     start: date,
     end: date,
     stop_on_404: bool,
+    cache: ArchiveCache | None = None,
 ) -> DataFrame:
     # daily dataframes, `None` indicates missing data in that day (when `stop_on_404` is False)
     dfs: list[DataFrame | None] = []
     # the current day being processing, starting at 1.
     current_day = 0
 
+    all_dates = list(date_range(start, end))
+    executor = get_parse_executor() if len(all_dates) >= PROCESS_POOL_MIN_DAYS else None
     connector = aiohttp.TCPConnector(limit=100)
     async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
         # the HTTP connections has been throttled by TCPConnector
-        for dates in chunks(list(date_range(start, end)), 1000):
+        for dates in chunks(all_dates, 1000):
             tasks = [
-                asyncio.create_task(get_daily_ohlcv(symbol, timeframe, candle_type, date, session))
+                asyncio.create_task(
+                    get_daily_ohlcv(
+                        symbol,
+                        timeframe,
+                        candle_type,
+                        date,
+                        session,
+                        cache=cache,
+                        executor=executor,
+                    )
+                )
                 for date in dates
             ]
             for task in tasks:
@@ -229,6 +393,111 @@ def binance_vision_trades_zip_url(symbol: str, candle_type: CandleType, date: da
     return url
 
 
+async def download_archive_zip(
+    url: str, date: date, session: aiohttp.ClientSession, verify: bool = False
+) -> bytes:
+    """
+    Download the archive at url.
+    :param verify: Verify the archive against its published checksum (if available)
+    :return: Content of the archive
+    """
+    async with session.get(url) as resp:
+        if resp.status == 200:
+            content = await resp.read()
+            logger.debug(f"Successfully downloaded {url}")
+        elif resp.status == 404:
+            logger.debug(f"Failed to download {url}")
+            raise Http404(f"404: {url}", date, url)
+        else:
+            raise BadHttpStatus(f"{resp.status} - {resp.reason}")
+    if verify:
+        checksum = await get_archive_checksum(url, session)
+        if checksum is not None and hashlib.sha256(content).hexdigest() != checksum:
+            raise BadChecksum(f"Checksum mismatch: {url}")
+    return content
+
+
+async def get_archive_checksum(url: str, session: aiohttp.ClientSession) -> str | None:
+    """
+    :return: Published sha256 checksum of the archive at url, None if unavailable
+    """
+    async with session.get(f"{url}.CHECKSUM") as resp:
+        if resp.status != 200:
+            logger.debug(f"No checksum available for {url}.")
+            return None
+        content = await resp.read()
+    match = re.match(rb"\s*([0-9a-fA-F]{64})\b", content)
+    return match.group(1).decode().lower() if match else None
+
+
+def parse_ohlcv_zip(content: bytes) -> DataFrame:
+    """
+    Parse a daily kline archive.
+    :return: A dataframe containing columns date,open,high,low,close,volume
+    """
+    with zipfile.ZipFile(BytesIO(content)) as zipf:
+        with zipf.open(zipf.namelist()[0]) as csvf:
+            # https://github.com/binance/binance-public-data/issues/283
+            first_byte = csvf.read(1)[0]
+            if chr(first_byte).isdigit():
+                header = None
+            else:
+                header = 0
+            csvf.seek(0)
+
+            df = pd.read_csv(
+                csvf,
+                usecols=[0, 1, 2, 3, 4, 5],
+                names=["date", "open", "high", "low", "close", "volume"],
+                header=header,
+            )
+            df["date"] = pd.to_datetime(
+                np.where(df["date"] > 1e13, df["date"] // 1000, df["date"]),
+                unit="ms",
+                utc=True,
+            )
+            return df
+
+
+async def get_cached_daily_ohlcv(
+    symbol: str,
+    timeframe: str,
+    candle_type: CandleType,
+    date: date,
+    cache: ArchiveCache,
+    executor: Executor | None = None,
+) -> DataFrame | None:
+    """
+    Load daily OHLCV from the archive cache.
+    If the timeframe itself isn't cached, candles are resampled from the archive of the
+    largest smaller timeframe in the cache.
+    :return: A dataframe containing columns date,open,high,low,close,volume - or None
+    """
+    timeframe_secs = timeframe_to_seconds(timeframe)
+    base_timeframes = [
+        tf
+        for tf in ARCHIVE_TIMEFRAMES
+        if timeframe_to_seconds(tf) < timeframe_secs
+        and timeframe_secs % timeframe_to_seconds(tf) == 0
+    ]
+    for base_timeframe in [timeframe, *reversed(base_timeframes)]:
+        url = binance_vision_ohlcv_zip_url(symbol, base_timeframe, candle_type, date)
+        content = cache.get(url)
+        if content is None:
+            continue
+        try:
+            df = await parse_archive(parse_ohlcv_zip, content, executor)
+        except ARCHIVE_PARSE_ERRORS as e:
+            logger.warning(f"Removing unreadable archive {url} from the archive cache: {e}")
+            cache.remove(url)
+            continue
+        logger.debug(f"Loaded {url} from the archive cache.")
+        if base_timeframe != timeframe:
+            df = ohlcv_resample(df, base_timeframe, timeframe)
+        return df
+    return None
+
+
 async def get_daily_ohlcv(
     symbol: str,
     timeframe: str,
@@ -237,6 +506,8 @@ async def get_daily_ohlcv(
     session: aiohttp.ClientSession,
     retry_count: int = 3,
     retry_delay: float = 0.0,
+    cache: ArchiveCache | None = None,
+    executor: Executor | None = None,
 ) -> DataFrame:
     """
     Get daily OHLCV from https://data.binance.vision
@@ -249,8 +520,14 @@ async def get_daily_ohlcv(
     :session: an aiohttp.ClientSession instance
     :retry_count: times to retry before returning the exceptions
     :retry_delay: the time to wait before every retry
+    :cache: archive cache - archives are loaded from / stored in the cache if provided
+    :executor: executor parsing the archive - uses the loop's default executor if None
     :return: A dataframe containing columns date,open,high,low,close,volume
     """
+    if cache is not None:
+        df = await get_cached_daily_ohlcv(symbol, timeframe, candle_type, date, cache, executor)
+        if df is not None:
+            return df
 
     url = binance_vision_ohlcv_zip_url(symbol, timeframe, candle_type, date)
 
@@ -265,37 +542,11 @@ async def get_daily_ohlcv(
             )
             await asyncio.sleep(sleep_secs)
         try:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    content = await resp.read()
-                    logger.debug(f"Successfully downloaded {url}")
-                    with zipfile.ZipFile(BytesIO(content)) as zipf:
-                        with zipf.open(zipf.namelist()[0]) as csvf:
-                            # https://github.com/binance/binance-public-data/issues/283
-                            first_byte = csvf.read(1)[0]
-                            if chr(first_byte).isdigit():
-                                header = None
-                            else:
-                                header = 0
-                            csvf.seek(0)
-
-                            df = pd.read_csv(
-                                csvf,
-                                usecols=[0, 1, 2, 3, 4, 5],
-                                names=["date", "open", "high", "low", "close", "volume"],
-                                header=header,
-                            )
-                            df["date"] = pd.to_datetime(
-                                np.where(df["date"] > 1e13, df["date"] // 1000, df["date"]),
-                                unit="ms",
-                                utc=True,
-                            )
-                            return df
-                elif resp.status == 404:
-                    logger.debug(f"Failed to download {url}")
-                    raise Http404(f"404: {url}", date, url)
-                else:
-                    raise BadHttpStatus(f"{resp.status} - {resp.reason}")
+            content = await download_archive_zip(url, date, session, verify=cache is not None)
+            df = await parse_archive(parse_ohlcv_zip, content, executor)
+            if cache is not None:
+                cache.put(url, content)
+            return df
         except Exception as e:
             retry += 1
             if isinstance(e, Http404) or retry > retry_count:
@@ -311,6 +562,7 @@ async def download_archive_trades(
     until_ms: int | None,
     markets: dict[str, Any],
     stop_on_404: bool = True,
+    cache_dir: Path | None = None,
 ) -> tuple[str, list[list]]:
     try:
         symbol = markets[pair]["id"]
@@ -323,7 +575,13 @@ async def download_archive_trades(
         if start >= end:
             return pair, []
         result_list = await _download_archive_trades(
-            symbol, pair, candle_type, start, end, stop_on_404
+            symbol,
+            pair,
+            candle_type,
+            start,
+            end,
+            stop_on_404,
+            ArchiveCache(cache_dir) if cache_dir else None,
         )
         return pair, result_list
 
@@ -385,6 +643,16 @@ def parse_trades_from_zip(csvf):
     return df.loc[:, DEFAULT_TRADES_COLUMNS].to_records(index=False).tolist()
 
 
+def parse_trades_zip(content: bytes) -> list[list]:
+    """
+    Parse a daily aggTrades archive.
+    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    """
+    with zipfile.ZipFile(BytesIO(content)) as zipf:
+        with zipf.open(zipf.namelist()[0]) as csvf:
+            return parse_trades_from_zip(csvf)
+
+
 async def get_daily_trades(
     symbol: str,
     candle_type: CandleType,
@@ -392,9 +660,11 @@ async def get_daily_trades(
     session: aiohttp.ClientSession,
     retry_count: int = 3,
     retry_delay: float = 0.0,
+    cache: ArchiveCache | None = None,
+    executor: Executor | None = None,
 ) -> list[list]:
     """
-    Get daily OHLCV from https://data.binance.vision
+    Get daily trades from https://data.binance.vision
     See https://github.com/binance/binance-public-data
 
     :symbol: binance symbol name, e.g. BTCUSDT
@@ -403,11 +673,22 @@ async def get_daily_trades(
     :session: an aiohttp.ClientSession instance
     :retry_count: times to retry before returning the exceptions
     :retry_delay: the time to wait before every retry
+    :cache: archive cache - archives are loaded from / stored in the cache if provided
+    :executor: executor parsing the archive - uses the loop's default executor if None
     :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
     """
 
     url = binance_vision_trades_zip_url(symbol, candle_type, date)
 
+    if cache is not None and (content := cache.get(url)) is not None:
+        try:
+            result = await parse_archive(parse_trades_zip, content, executor)
+            logger.debug(f"Loaded {url} from the archive cache.")
+            return result
+        except ARCHIVE_PARSE_ERRORS as e:
+            logger.warning(f"Removing unreadable archive {url} from the archive cache: {e}")
+            cache.remove(url)
+
     logger.debug(f"download trades data from binance: {url}")
 
     retry = 0
@@ -419,18 +700,11 @@ async def get_daily_trades(
             )
             await asyncio.sleep(sleep_secs)
         try:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    content = await resp.read()
-                    logger.debug(f"Successfully downloaded {url}")
-                    with zipfile.ZipFile(BytesIO(content)) as zipf:
-                        with zipf.open(zipf.namelist()[0]) as csvf:
-                            return parse_trades_from_zip(csvf)
-                elif resp.status == 404:
-                    logger.debug(f"Failed to download {url}")
-                    raise Http404(f"404: {url}", date, url)
-                else:
-                    raise BadHttpStatus(f"{resp.status} - {resp.reason}")
+            content = await download_archive_zip(url, date, session, verify=cache is not None)
+            result = await parse_archive(parse_trades_zip, content, executor)
+            if cache is not None:
+                cache.put(url, content)
+            return result
         except Exception as e:
             logger.info("download Daily_trades raised: %s", e)
             retry += 1
@@ -446,18 +720,25 @@ async def _download_archive_trades(
     start: date,
     end: date,
     stop_on_404: bool,
+    cache: ArchiveCache | None = None,
 ) -> list[list]:
     # daily dataframes, `None` indicates missing data in that day (when `stop_on_404` is False)
     results: list[list] = []
     # the current day being processing, starting at 1.
     current_day = 0
 
+    all_dates = list(date_range(start, end))
+    executor = get_parse_executor() if len(all_dates) >= PROCESS_POOL_MIN_DAYS else None
     connector = aiohttp.TCPConnector(limit=100)
     async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
         # the HTTP connections has been throttled by TCPConnector
-        for dates in chunks(list(date_range(start, end)), 30):
+        for dates in chunks(all_dates, 30):
             tasks = [
-                asyncio.create_task(get_daily_trades(symbol, candle_type, date, session))
+                asyncio.create_task(
+                    get_daily_trades(
+                        symbol, candle_type, date, session, cache=cache, executor=executor
+                    )
+                )
                 for date in dates
             ]
             for task in tasks:
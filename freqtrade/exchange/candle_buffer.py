@@ -0,0 +1,276 @@
+"""
+In-memory candle storage for Exchange._klines.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# open, high, low, close, volume
+_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
+
+
+def ticks_to_arrays(ticks: list[list], drop_incomplete: bool) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert candles as returned by ccxt.fetch_ohlcv to arrays of dates and values,
+    like clean_ohlcv_dataframe: sorted by date, with candles of the same date merged
+    (first open, highest high, lowest low, last close, highest volume).
+    :param drop_incomplete: Drop the last candle, assuming it's incomplete
+    :return: Tuple of dates (as int64 nanoseconds) and values (open, high, low, close, volume)
+    """
+    data = np.array(ticks, dtype=np.float64).reshape(-1, len(DEFAULT_DATAFRAME_COLUMNS))
+    data = data[np.argsort(data[:, 0], kind="stable")]
+    dates = data[:, 0].astype(np.int64) * 1_000_000
+    values = data[:, 1:]
+    dates, starts = np.unique(dates, return_index=True)
+    if len(starts) < len(values):
+        ends = np.append(starts[1:], len(values))
+        values = np.column_stack(
+            (
+                values[starts, _OPEN],
+                np.fmax.reduceat(values[:, _HIGH], starts),
+                np.fmin.reduceat(values[:, _LOW], starts),
+                values[ends - 1, _CLOSE],
+                np.fmax.reduceat(values[:, _VOLUME], starts),
+            )
+        )
+    if drop_incomplete:
+        dates, values = dates[:-1], values[:-1]
+    return dates, values
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity, array-backed buffer of gap-free candles.
+    New candles are upserted in place - merged into existing candles of the same date,
+    or appended (evicting the oldest candles once the capacity is reached).
+    Candles live in arrays of twice the capacity, which are compacted once their end
+    is reached - so the candles are always stored contiguously.
+    """
+
+    def __init__(self, timeframe: str, capacity: int) -> None:
+        self.capacity = max(capacity, 1)
+        self._tf_ns = timeframe_to_seconds(timeframe) * 1_000_000_000
+        self._dates = np.empty(2 * self.capacity, dtype=np.int64)
+        self._values = np.empty((2 * self.capacity, len(_VALUE_COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    @staticmethod
+    def supports(timeframe: str) -> bool:
+        """
+        Candles of timeframes with varying length (e.g. months) or candles aligned
+        to specific weekdays are not supported.
+        """
+        return timeframe_to_seconds(timeframe) < 10000 * 60
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame, timeframe: str, capacity: int) -> "CandleBuffer | None":
+        """
+        Create a buffer from the last `capacity` candles of df.
+        :return: CandleBuffer - or None if df contains gaps or unsorted candles
+        """
+        buffer = cls(timeframe, capacity)
+        df = df.tail(buffer.capacity)
+        dates = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        if len(dates) > 1 and not (np.diff(dates) == buffer._tf_ns).all():
+            return None
+        buffer._append(dates, df[_VALUE_COLUMNS].to_numpy(dtype=np.float64))
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _append(self, dates: np.ndarray, values: np.ndarray) -> None:
+        n = len(dates)
+        if n >= self.capacity:
+            self._dates[: self.capacity] = dates[-self.capacity :]
+            self._values[: self.capacity] = values[-self.capacity :]
+            self._start, self._size = 0, self.capacity
+            return
+        end = self._start + self._size
+        if end + n > len(self._dates):
+            # Move the candles to keep to the start of the arrays.
+            keep = min(self._size, self.capacity - n)
+            self._dates[:keep] = self._dates[end - keep : end]
+            self._values[:keep] = self._values[end - keep : end]
+            self._start, self._size, end = 0, keep, keep
+        self._dates[end : end + n] = dates
+        self._values[end : end + n] = values
+        self._size += n
+        if self._size > self.capacity:
+            self._start += self._size - self.capacity
+            self._size = self.capacity
+
+    def upsert(self, dates: np.ndarray, values: np.ndarray) -> bool:
+        """
+        Merge candles into the buffer.
+        Candles with the same date as a buffered candle are merged (first open, highest
+        high, lowest low, last close, highest volume), newer candles are appended - with
+        missing candles in between filled up using the previous close and 0 volume.
+        :param dates: Candle dates as int64 nanoseconds, sorted without duplicates
+        :param values: Candle values (open, high, low, close, volume) - see ticks_to_arrays()
+        :return: False if the candles can't be merged (candles before the first candle
+            of a buffer below capacity, or candles not aligned with the buffered candles) -
+            the buffer is unchanged in this case.
+        """
+        if len(dates) == 0:
+            return True
+        if self._size == 0:
+            if len(dates) > 1 and not (np.diff(dates) == self._tf_ns).all():
+                return False
+            self._append(dates, values)
+            return True
+
+        first = self._dates[self._start]
+        last = self._dates[self._start + self._size - 1]
+        offsets, remainder = np.divmod(dates - first, self._tf_ns)
+        if remainder.any() or (offsets[0] < 0 and self._size < self.capacity):
+            return False
+        # Candles before the first candle of a full buffer would be evicted right away.
+        keep = offsets >= 0
+        dates, values, offsets = dates[keep], values[keep], offsets[keep]
+
+        existing = dates <= last
+        if existing.any():
+            rows = self._start + offsets[existing]
+            old, new = self._values[rows], values[existing]
+            merged = np.empty_like(old)
+            merged[:, _OPEN] = np.where(np.isnan(old[:, _OPEN]), new[:, _OPEN], old[:, _OPEN])
+            merged[:, _HIGH] = np.fmax(old[:, _HIGH], new[:, _HIGH])
+            merged[:, _LOW] = np.fmin(old[:, _LOW], new[:, _LOW])
+            merged[:, _CLOSE] = np.where(np.isnan(new[:, _CLOSE]), old[:, _CLOSE], new[:, _CLOSE])
+            merged[:, _VOLUME] = np.fmax(old[:, _VOLUME], new[:, _VOLUME])
+            self._values[rows] = merged
+
+        if not existing.all():
+            dates, values = dates[~existing], values[~existing]
+            count = (dates[-1] - last) // self._tf_ns
+            new_dates = last + self._tf_ns * np.arange(1, count + 1, dtype=np.int64)
+            new_values = np.full((count, len(_VALUE_COLUMNS)), np.nan)
+            new_values[(dates - last) // self._tf_ns - 1] = values
+            if count > len(dates):
+                # Fill up missing candles
+                close = np.concatenate(
+                    ([self._values[self._start + self._size - 1, _CLOSE]], new_values[:, _CLOSE])
+                )
+                valid = np.where(~np.isnan(close), np.arange(len(close)), 0)
+                close = close[np.maximum.accumulate(valid)][1:]
+                missing = np.isnan(new_values[:, _CLOSE])
+                new_values[:, _CLOSE] = close
+                for col in (_OPEN, _HIGH, _LOW):
+                    new_values[missing, col] = close[missing]
+                new_values[missing, _VOLUME] = 0.0
+                logger.debug(
+                    f"Missing data fillup: {count - len(dates)} candles added "
+                    f"to {len(dates)} new candles."
+                )
+            self._append(new_dates, new_values)
+        return True
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        :return: Buffered candles as a new DataFrame
+        """
+        window = slice(self._start, self._start + self._size)
+        # Copy the values - the buffer is updated in place, dataframes handed out must not change.
+        df = DataFrame(self._values[window].copy(), columns=_VALUE_COLUMNS)
+        df.insert(0, "date", to_datetime(self._dates[window], unit="ns", utc=True))
+        return df
+
+
+class CandleCache(MutableMapping):
+    """
+    Candles per (pair, timeframe, candle_type) - mapping to DataFrames.
+    Candles updated via `upsert()` are kept in a CandleBuffer - and only converted to a
+    DataFrame when accessed.
+    """
+
+    def __init__(self) -> None:
+        self._frames: dict[PairWithTimeframe, DataFrame | None] = {}
+        self._buffers: dict[PairWithTimeframe, CandleBuffer] = {}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        df = self._frames[key]
+        if df is None:
+            df = self._buffers[key].to_dataframe()
+            self._frames[key] = df
+        return df
+
+    def __setitem__(self, key: PairWithTimeframe, value: DataFrame) -> None:
+        self._frames[key] = value
+        self._buffers.pop(key, None)
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._frames[key]
+        self._buffers.pop(key, None)
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._frames
+
+    def upsert(
+        self,
+        key: PairWithTimeframe,
+        ticks: list[list],
+        timeframe: str,
+        capacity: int,
+        drop_incomplete: bool = False,
+    ) -> bool:
+        """
+        Merge candles into the cached candles of key, keeping the last `capacity` candles.
+        :param ticks: Candles as returned by ccxt.fetch_ohlcv
+        :param drop_incomplete: Drop the last candle of ticks, assuming it's incomplete
+        :return: False if the candles couldn't be merged - the cache entry is unchanged.
+        """
+        if not CandleBuffer.supports(timeframe):
+            return False
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.capacity != max(capacity, 1):
+            if key in self._frames:
+                buffer = CandleBuffer.from_dataframe(self[key], timeframe, capacity)
+            else:
+                buffer = CandleBuffer(timeframe, capacity)
+            if buffer is None:
+                return False
+        if not buffer.upsert(*ticks_to_arrays(ticks, drop_incomplete)):
+            return False
+        self._buffers[key] = buffer
+        self._frames[key] = None
+        return True
+
+
+class CandleCacheView(Mapping):
+    """
+    Read-only view of some keys of a CandleCache.
+    DataFrames are only built when accessed - and reflect the current cache contents.
+    """
+
+    def __init__(self, cache: CandleCache, keys: Iterable[PairWithTimeframe]) -> None:
+        self._cache = cache
+        self._keys = {key: None for key in keys if key in cache}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -7,6 +7,7 @@ from typing import Any, TypeVar, cast, overload
 
 from freqtrade.exceptions import DDosProtection, RetryableOrderError, TemporaryError
 from freqtrade.mixins import LoggingMixin
+from freqtrade.util import latency_registry
 
 
 logger = logging.getLogger(__name__)
@@ -110,12 +111,20 @@ def calculate_backoff(retrycount, max_retries):
     return (max_retries - retrycount) ** 2 + 1
 
 
+def _endpoint_name(f) -> str:
+    """Name under which the request latency of f is recorded"""
+    return getattr(f, "__name__", type(f).__name__)
+
+
 def retrier_async(f):
+    endpoint = _endpoint_name(f)
+
     async def wrapper(*args, **kwargs):
         count = kwargs.pop("count", API_RETRY_COUNT)
         kucoin = args[0].name == "KuCoin"  # Check if the exchange is KuCoin.
         try:
-            return await f(*args, **kwargs)
+            with latency_registry.measure("exchange", endpoint):
+                return await f(*args, **kwargs)
         except TemporaryError as ex:
             msg = f'{f.__name__}() returned exception: "{ex}". '
             if count > 0:
@@ -165,11 +174,14 @@ def retrier(*, retries=API_RETRY_COUNT) -> Callable[[F], F]: ...
 
 def retrier(_func: F | None = None, *, retries=API_RETRY_COUNT):
     def decorator(f: F) -> F:
+        endpoint = _endpoint_name(f)
+
         @wraps(f)
         def wrapper(*args, **kwargs):
             count = kwargs.pop("count", retries)
             try:
-                return f(*args, **kwargs)
+                with latency_registry.measure("exchange", endpoint):
+                    return f(*args, **kwargs)
             except (TemporaryError, RetryableOrderError) as ex:
                 msg = f'{f.__name__}() returned exception: "{ex}". '
                 if count > 0:
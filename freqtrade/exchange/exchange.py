@@ -7,7 +7,8 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Callable, Coroutine, Generator, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
@@ -39,7 +40,7 @@ from freqtrade.constants import (
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     ohlcv_to_dataframe,
-    trades_df_remove_duplicates,
+    trades_df_merge,
     trades_dict_to_list,
     trades_list_to_df,
 )
@@ -63,6 +64,7 @@ from freqtrade.exceptions import (
     RetryableOrderError,
     TemporaryError,
 )
+from freqtrade.exchange.candle_buffer import CandleCache, CandleCacheView
 from freqtrade.exchange.common import (
     API_FETCH_ORDER_RETRY_COUNT,
     retrier,
@@ -160,6 +162,7 @@ class Exchange:
         "needs_trading_fees": False,  # use fetch_trading_fees to cache fees
         "order_props_in_contracts": ["amount", "filled", "remaining"],
         "fetch_orders_limit_minutes": None,  # "fetch_orders" is not time-limited by default
+        "fetch_open_orders_all_pairs": True,  # "fetch_open_orders" works without a pair
         # Override createMarketBuyOrderRequiresPrice where ccxt has it wrong
         "marketOrderRequiresPrice": False,
         "exchange_has_overrides": {},  # Dictionary overriding ccxt's "has".
@@ -225,6 +228,8 @@ class Exchange:
 
         # Holds last candle refreshed time of each pair
         self._pairs_last_refresh_time: dict[PairWithTimeframe, int] = {}
+        # Number of candle requests sent (including retries) - used for download statistics
+        self._ohlcv_request_count = 0
         # Timestamp of last markets refresh
         self._last_markets_refresh: int = 0
 
@@ -239,7 +244,7 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines = CandleCache()
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -258,6 +263,11 @@ class Exchange:
             not self._ft_has["always_require_api_keys"] and config.get("dry_run", False),
         )
         self.log_responses = exchange_conf.get("log_responses", False)
+        self._bulk_order_polling = exchange_conf.get("bulk_order_polling", False)
+        # Set once fetching open orders without a pair failed
+        self._open_orders_require_pair = False
+        # Open orders fetched in bulk by refresh_order_snapshot(), served once by fetch_order()
+        self._order_snapshot: dict[str, CcxtOrder] = {}
 
         # Assign this directly for easy access
         self._ohlcv_partial_candle = self._ft_has["ohlcv_partial_candle"]
@@ -1582,6 +1592,8 @@ class Exchange:
     def fetch_order(self, order_id: str, pair: str, params: dict | None = None) -> CcxtOrder:
         if self._config["dry_run"]:
             return self.fetch_dry_run_order(order_id)
+        if (order := self._order_snapshot.pop(order_id, None)) is not None:
+            return order
         if params is None:
             params = {}
         try:
@@ -1637,6 +1649,7 @@ class Exchange:
 
     @retrier
     def cancel_order(self, order_id: str, pair: str, params: dict | None = None) -> dict[str, Any]:
+        self._order_snapshot.pop(order_id, None)
         if self._config["dry_run"]:
             try:
                 order = self.fetch_dry_run_order(order_id)
@@ -1774,6 +1787,90 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    @retrier(retries=0)
+    def _fetch_open_orders(self, pair: str | None) -> list[CcxtOrder]:
+        """
+        Fetch open orders of one pair - or of all pairs if pair is None
+        """
+        try:
+            orders: list[CcxtOrder] = self._api.fetch_open_orders(pair)
+            self._log_exchange_response("fetch_open_orders", orders)
+            return orders
+        except (ccxt.NotSupported, ccxt.ArgumentsRequired) as e:
+            raise OperationalException(
+                f"Exchange {self._api.name} does not support fetching open orders in batch. "
+                f"Message: {e}"
+            ) from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.OperationFailed, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f"Could not fetch open orders due to {e.__class__.__name__}. Message: {e}"
+            ) from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    def clear_order_snapshot(self) -> None:
+        """
+        Drop open orders fetched by refresh_order_snapshot() which were not used.
+        """
+        self._order_snapshot = {}
+
+    def refresh_order_snapshot(self, orders: list[tuple[str, str]]) -> None:
+        """
+        Fetch open orders in bulk - so the following fetch_order() calls for these orders
+        are served from this snapshot instead of one request per order.
+        Uses one request for all pairs where the exchange supports this - otherwise one
+        request per pair with multiple open orders.
+        Orders missing from the snapshot (e.g. orders closed in the meantime) are fetched
+        individually by fetch_order(). Each snapshot entry is served once.
+        :param orders: list of (order_id, pair) of open orders
+        """
+        self.clear_order_snapshot()
+        if (
+            self._config["dry_run"]
+            or not self._bulk_order_polling
+            or len(orders) < 2
+            or not self.exchange_has("fetchOpenOrders")
+        ):
+            return
+        orders_per_pair: dict[str, int] = {}
+        for _, pair in orders:
+            orders_per_pair[pair] = orders_per_pair.get(pair, 0) + 1
+        open_orders: list[CcxtOrder] | None = None
+        try:
+            if (
+                self._ft_has["fetch_open_orders_all_pairs"]
+                and not self._open_orders_require_pair
+                and len(orders_per_pair) > 1
+            ):
+                try:
+                    open_orders = self._fetch_open_orders(None)
+                except OperationalException as e:
+                    logger.warning(
+                        f"Fetching open orders of all pairs at once is not supported, "
+                        f"fetching them per pair. {e}"
+                    )
+                    self._open_orders_require_pair = True
+            if open_orders is None:
+                open_orders = []
+                for pair, count in orders_per_pair.items():
+                    if count > 1:
+                        open_orders.extend(self._fetch_open_orders(pair))
+        except ExchangeError as e:
+            logger.warning(f"Could not fetch open orders in bulk, fetching them individually. {e}")
+            return
+        except OperationalException as e:
+            logger.warning(f"Fetching open orders in bulk is not supported, disabling it. {e}")
+            self._bulk_order_polling = False
+            return
+        order_ids = {order_id for order_id, _ in orders}
+        self._order_snapshot = {
+            order["id"]: self._order_contracts_to_amount(order)
+            for order in open_orders
+            if order.get("id") in order_ids
+        }
+
     def _fetch_orders_emulate(self, pair: str, since_ms: int) -> list[CcxtOrder]:
         orders = []
         if self.exchange_has("fetchClosedOrders"):
@@ -2439,16 +2536,38 @@ class Exchange:
         :return: Dataframe with candle (OHLCV) data
         """
         with self._loop_lock:
-            pair, _, _, data, _ = self.loop.run_until_complete(
-                self._async_get_historic_ohlcv(
+            return self.loop.run_until_complete(
+                self._async_get_historic_ohlcv_df(
                     pair=pair,
                     timeframe=timeframe,
                     since_ms=since_ms,
-                    until_ms=until_ms,
                     candle_type=candle_type,
-                    raise_=True,
+                    is_new_pair=is_new_pair,
+                    until_ms=until_ms,
                 )
             )
+
+    async def _async_get_historic_ohlcv_df(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Async version of get_historic_ohlcv - to be awaited in the exchange's event loop.
+        Used to download multiple pairs concurrently.
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+            raise_=True,
+        )
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
         return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
 
@@ -2552,6 +2671,18 @@ class Exchange:
             return True
         return False
 
+    def wait_for_ws_candles(self, timeframe: str, candle_ts: int, timeout: float) -> bool:
+        """
+        Wait until all pairs of the timeframe watched via websocket received the candle
+        opening at candle_ts.
+        :param candle_ts: Open time of the candle to wait for (in ms)
+        :param timeout: Maximum time to wait in seconds
+        :return: True if all candles arrived - False on timeout, or if websockets are not used.
+        """
+        if not self._exchange_ws:
+            return False
+        return self._exchange_ws.wait_for_candles(timeframe, candle_ts, timeout)
+
     def _build_coroutine(
         self,
         pair: str,
@@ -2612,7 +2743,7 @@ class Exchange:
         """
         input_coroutines: list[Coroutine[Any, Any, OHLCVResponse]] = []
         cached_pairs = []
-        for pair, timeframe, candle_type in set(pair_list):
+        for pair, timeframe, candle_type in dict.fromkeys(pair_list):
             invalid_funding = (
                 candle_type == CandleType.FUNDING_RATE
                 and timeframe != self.get_option("funding_fee_timeframe")
@@ -2659,35 +2790,49 @@ class Exchange:
         ticks: list[list],
         cache: bool,
         drop_incomplete: bool,
-    ) -> DataFrame:
+    ) -> DataFrame | None:
+        """
+        Convert ticks to a dataframe - and merge them into the cached candles if cache is set.
+        :return: DataFrame - or None if the ticks were merged into the candle cache
+            without building a dataframe (see CandleCache.upsert()).
+        """
         # keeping last candle time as last refreshed time of the pair
         if ticks and cache:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
             self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0]
         has_cache = cache and (pair, timeframe, c_type) in self._klines
+        if has_cache:
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            # Merge new candles in place, aging out old candles
+            if self._klines.upsert(
+                (pair, timeframe, c_type),
+                ticks,
+                timeframe,
+                candle_limit + self._startup_candle_count,
+                drop_incomplete,
+            ):
+                return None
         # in case of existing cache, fill_missing happens after concatenation
         ohlcv_df = ohlcv_to_dataframe(
             ticks, timeframe, pair=pair, fill_missing=not has_cache, drop_incomplete=drop_incomplete
         )
         # keeping parsed dataframe in cache
-        if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+        if has_cache:
+            old = self._klines[(pair, timeframe, c_type)]
+            # Reassign so we return the updated, combined df
+            ohlcv_df = clean_ohlcv_dataframe(
+                concat([old, ohlcv_df], axis=0),
+                timeframe,
+                pair,
+                fill_missing=True,
+                drop_incomplete=False,
+            )
+            # Age out old candles
+            ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
+            ohlcv_df = ohlcv_df.reset_index(drop=True)
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
+        elif cache:
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -2697,7 +2842,8 @@ class Exchange:
         since_ms: int | None = None,
         cache: bool = True,
         drop_incomplete: bool | None = None,
-    ) -> dict[PairWithTimeframe, DataFrame]:
+        on_batch: Callable[[list[PairWithTimeframe]], None] | None = None,
+    ) -> Mapping[PairWithTimeframe, DataFrame]:
         """
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
         Loops asynchronously over pair_list and downloads all pairs async (semi-parallel).
@@ -2707,25 +2853,25 @@ class Exchange:
         :param cache: Assign result to _klines. Useful for one-off downloads like for pairlists
         :param drop_incomplete: Control candle dropping.
             Specifying None defaults to _ohlcv_partial_candle
-        :return: Dict of [{(pair, timeframe): Dataframe}]
+        :param on_batch: Called with the refreshed pairs whenever a batch of pairs has been
+            refreshed - while the next batch is downloaded in the background.
+            Pairs are downloaded in the order of pair_list.
+        :return: Dict of [{(pair, timeframe): Dataframe}] - with cache set, this is a view
+            of the cached candles, which only builds dataframes when accessed.
         """
         logger.debug("Refreshing candle (OHLCV) data for %d pairs", len(pair_list))
 
         # Gather coroutines to run
         ohlcv_dl_jobs, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
+        if on_batch and cached_pairs:
+            on_batch(cached_pairs)
 
-        results_df = {}
-        # Chunk requests into batches of 100 to avoid overwhelming ccxt Throttling
-        for dl_jobs_batch in chunks(ohlcv_dl_jobs, 100):
-
-            async def gather_coroutines(coro):
-                return await asyncio.gather(*coro, return_exceptions=True)
-
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_coroutines(dl_jobs_batch))
-
+        results_df: dict[PairWithTimeframe, DataFrame] = {}
+        all_refreshed: list[PairWithTimeframe] = []
+        for results in self._download_ohlcv_batches(ohlcv_dl_jobs, prefetch=on_batch is not None):
+            refreshed = []
             for res in results:
-                if isinstance(res, Exception):
+                if isinstance(res, BaseException):
                     logger.warning(f"Async code raised an exception: {repr(res)}")
                     continue
                 # Deconstruct tuple (has 5 elements)
@@ -2735,16 +2881,49 @@ class Exchange:
                     pair, timeframe, c_type, ticks, cache, drop_incomplete_
                 )
 
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
-
-        # Return cached klines
-        for pair, timeframe, c_type in cached_pairs:
-            results_df[(pair, timeframe, c_type)] = self.klines(
-                (pair, timeframe, c_type), copy=False
-            )
+                if ohlcv_df is not None and not cache:
+                    results_df[(pair, timeframe, c_type)] = ohlcv_df
+                refreshed.append((pair, timeframe, c_type))
+            all_refreshed.extend(refreshed)
+            if on_batch:
+                on_batch(refreshed)
 
+        if cache:
+            # Return refreshed and cached klines
+            return CandleCacheView(self._klines, all_refreshed + cached_pairs)
         return results_df
 
+    def _download_ohlcv_batches(
+        self, dl_jobs: list[Coroutine[Any, Any, OHLCVResponse]], prefetch: bool
+    ) -> Iterator[list[OHLCVResponse | BaseException]]:
+        """
+        Run download coroutines in batches of 100 to avoid overwhelming ccxt Throttling.
+        :param prefetch: Download the next batch in a background thread while the caller
+            processes the current batch.
+        :return: Iterator over the results of each batch
+        """
+
+        async def gather_coroutines(coro):
+            return await asyncio.gather(*coro, return_exceptions=True)
+
+        def download(batch) -> list[OHLCVResponse | BaseException]:
+            with self._loop_lock:
+                return self.loop.run_until_complete(gather_coroutines(batch))
+
+        batches = list(chunks(dl_jobs, 100))
+        if not prefetch or len(batches) < 2:
+            for batch in batches:
+                yield download(batch)
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ft-refresh") as executor:
+            future = executor.submit(download, batches[0])
+            for batch in batches[1:]:
+                results = future.result()
+                future = executor.submit(download, batch)
+                yield results
+            yield future.result()
+
     def refresh_ohlcv_with_cache(
         self, pairs: list[PairWithTimeframe], since_ms: int
     ) -> dict[PairWithTimeframe, DataFrame]:
@@ -2771,7 +2950,9 @@ class Exchange:
         }
         pairs_to_download = [p for p in pairs if p not in candles]
         if pairs_to_download:
-            candles = self.refresh_latest_ohlcv(pairs_to_download, since_ms=since_ms, cache=False)
+            candles = dict(
+                self.refresh_latest_ohlcv(pairs_to_download, since_ms=since_ms, cache=False)
+            )
             for c, val in candles.items():
                 self._expiring_candle_cache[(c[1], since_ms)][c] = val
         return candles
@@ -2797,6 +2978,7 @@ class Exchange:
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         returns tuple: (pair, timeframe, ohlcv_list)
         """
+        self._ohlcv_request_count += 1
         try:
             # Fetch OHLCV asynchronously
             s = "(" + dt_from_ts(since_ms).isoformat() + ") " if since_ms is not None else ""
@@ -2907,25 +3089,54 @@ class Exchange:
         ticks: list[list],
         cache: bool,
         first_required_candle_date: int,
+        stored_trades: DataFrame | None = None,
     ) -> DataFrame:
+        """
+        Merge new ticks into the trades in cache (or the stored trades, if provided).
+        :param stored_trades: Previously stored trades, sorted by timestamp
+        """
         # keeping parsed dataframe in cache
         trades_df = trades_list_to_df(ticks, True)
+        if stored_trades is not None and not stored_trades.empty:
+            trades_df = trades_df_merge(stored_trades, trades_df)
 
         if cache:
             if (pair, timeframe, c_type) in self._trades:
                 old = self._trades[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                combined_df = concat([old, trades_df], axis=0)
                 logger.debug(f"Clean duplicated ticks from Trades data {pair}")
-                trades_df = DataFrame(
-                    trades_df_remove_duplicates(combined_df), columns=combined_df.columns
-                )
-                # Age out old candles
-                trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
-                trades_df = trades_df.reset_index(drop=True)
+                # Only the seam of old and new trades is deduplicated
+                trades_df = trades_df_merge(old, trades_df)
+            # Age out old candles
+            trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
+            trades_df = trades_df.reset_index(drop=True)
             self._trades[(pair, timeframe, c_type)] = trades_df
         return trades_df
 
+    @staticmethod
+    def _store_cached_trades(
+        data_handler, pair: str, trading_mode: TradingMode, trades_df: DataFrame
+    ) -> None:
+        """
+        Store trades of the in-memory cache on disk, to reuse them after a restart.
+        Only trades after the stored trades are appended - the file is rewritten once
+        it contains more than twice the trades in memory (as aged out trades remain stored).
+        """
+        cached_pair = f"{pair}-cached"
+        _, stored_end, stored_count = data_handler.trades_data_min_max(cached_pair, trading_mode)
+        if 0 < stored_count <= 2 * len(trades_df):
+            # Trades with the same timestamp as the last stored trade may be new.
+            # Duplicates are removed when loading.
+            new_trades = trades_df.loc[trades_df["timestamp"] >= dt_ts(stored_end)]
+            try:
+                if not new_trades.empty:
+                    data_handler.trades_append(
+                        cached_pair, new_trades[DEFAULT_TRADES_COLUMNS], trading_mode
+                    )
+                return
+            except NotImplementedError:
+                pass
+        data_handler.trades_store(cached_pair, trades_df[DEFAULT_TRADES_COLUMNS], trading_mode)
+
     async def _build_trades_dl_jobs(
         self, pairwt: PairWithTimeframe, data_handler, cache: bool
     ) -> tuple[PairWithTimeframe, DataFrame | None]:
@@ -2996,19 +3207,16 @@ class Exchange:
                 return pairwt, None
 
             if new_ticks:
-                all_stored_ticks_list = all_stored_ticks_df[DEFAULT_TRADES_COLUMNS].values.tolist()
-                all_stored_ticks_list.extend(new_ticks)
                 trades_df = self._process_trades_df(
                     pair,
                     timeframe,
                     candle_type,
-                    all_stored_ticks_list,
+                    new_ticks,
                     cache,
                     first_required_candle_date=first_candle_ms,
+                    stored_trades=all_stored_ticks_df,
                 )
-                data_handler.trades_store(
-                    f"{pair}-cached", trades_df[DEFAULT_TRADES_COLUMNS], self.trading_mode
-                )
+                self._store_cached_trades(data_handler, pair, self.trading_mode, trades_df)
                 return pairwt, trades_df
             else:
                 logger.error(f"No new ticks for {pair}")
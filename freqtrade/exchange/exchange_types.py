@@ -47,6 +47,7 @@ class FtHas(TypedDict, total=False):
     l2_limit_upper: int | None
     # fetch_orders
     fetch_orders_limit_minutes: int | None
+    fetch_open_orders_all_pairs: bool
     # Futures
     ccxt_futures_name: str  # usually swap
     mark_ohlcv_price: str
@@ -3,7 +3,7 @@ import logging
 import time
 from copy import deepcopy
 from functools import partial
-from threading import Thread
+from threading import Condition, Thread
 
 import ccxt
 
@@ -29,6 +29,9 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Open time of the latest candle received per pair/timeframe combination
+        self.klines_last_candle: dict[PairWithTimeframe, int] = {}
+        self._klines_received = Condition()
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -85,6 +88,7 @@ class ExchangeWS:
         """
         self._ccxt_object.ohlcvs.get(paircomb[0], {}).pop(paircomb[1], None)
         self.klines_last_refresh.pop(paircomb, None)
+        self.klines_last_candle.pop(paircomb, None)
 
     @retrier(retries=3)
     def ohlcvs(self, pair: str, timeframe: str) -> list[list]:
@@ -175,6 +179,10 @@ class ExchangeWS:
                 start = dt_ts()
                 data = await self._ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                if data:
+                    with self._klines_received:
+                        self.klines_last_candle[(pair, timeframe, candle_type)] = data[-1][0]
+                        self._klines_received.notify_all()
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {(dt_ts() - start) / 1000:.3f}s"
@@ -196,6 +204,23 @@ class ExchangeWS:
         asyncio.run_coroutine_threadsafe(self._schedule_while_true(), loop=self._loop)
         self.cleanup_expired()
 
+    def wait_for_candles(self, timeframe: str, candle_ts: int, timeout: float) -> bool:
+        """
+        Wait until all watched pairs of the timeframe received the candle opening at candle_ts.
+        :param candle_ts: Open time of the candle to wait for (in ms)
+        :param timeout: Maximum time to wait in seconds
+        :return: True if all candles arrived - False on timeout, or if no pair is watched.
+        """
+
+        def received() -> bool:
+            watched = [p for p in list(self._klines_watching) if p[1] == timeframe]
+            return bool(watched) and all(
+                self.klines_last_candle.get(p, 0) >= candle_ts for p in watched
+            )
+
+        with self._klines_received:
+            return self._klines_received.wait_for(received, timeout=max(timeout, 0.0))
+
     async def get_ohlcv(
         self,
         pair: str,
@@ -18,8 +18,8 @@ from numpy.typing import NDArray
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import Config
-from freqtrade.data.history import load_pair_history
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, Config
+from freqtrade.data.history import load_data
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
@@ -694,14 +694,19 @@ class FreqaiDataDrawer:
         for pair in dk.all_pairs:
             if pair not in history_data:
                 history_data[pair] = {}
-            for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                history_data[pair][tf] = load_pair_history(
-                    datadir=self.config["datadir"],
-                    timeframe=tf,
-                    pair=pair,
-                    timerange=timerange,
-                    data_format=self.config.get("dataformat_ohlcv", "feather"),
-                    candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+        for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
+            data = load_data(
+                datadir=self.config["datadir"],
+                timeframe=tf,
+                pairs=dk.all_pairs,
+                timerange=timerange,
+                data_format=self.config.get("dataformat_ohlcv", "feather"),
+                candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                workers=self.config.get("dataload_workers"),
+            )
+            for pair in dk.all_pairs:
+                history_data[pair][tf] = data.get(
+                    pair, DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
                 )
 
     def get_base_and_corr_dataframes(
@@ -8,14 +8,22 @@ from copy import deepcopy
 from datetime import UTC, datetime, time, timedelta
 from math import isclose
 from threading import Lock
-from time import sleep
+from time import perf_counter, sleep
 from typing import Any
 
 from schedule import Scheduler
 
 from freqtrade import constants
 from freqtrade.configuration import remove_exchange_credentials, validate_config_consistency
-from freqtrade.constants import BuySell, Config, EntryExecuteMode, ExchangeConfig, LongShort
+from freqtrade.constants import (
+    BuySell,
+    Config,
+    EntryExecuteMode,
+    ExchangeConfig,
+    ListPairsWithTimeframes,
+    LongShort,
+    PairWithTimeframe,
+)
 from freqtrade.data.converter import order_book_to_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
@@ -62,7 +70,14 @@ from freqtrade.rpc.rpc_types import (
 )
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise, MeasureTime, PeriodicCache, dt_from_ts, dt_now
+from freqtrade.util import (
+    FtPrecise,
+    MeasureTime,
+    PeriodicCache,
+    dt_from_ts,
+    dt_now,
+    latency_registry,
+)
 from freqtrade.util.migrations.binance_mig import migrate_binance_futures_names
 from freqtrade.wallets import Wallets
 
@@ -186,6 +201,9 @@ class FreqtradeBot(LoggingMixin):
             )
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
+        self._pipelined_analysis = self.config.get("internals", {}).get(
+            "pipelined_analysis", False
+        ) and not self.config.get("exchange", {}).get("use_public_trades", False)
 
     def notify_status(self, msg: str, msg_type=RPCMessageType.STATUS) -> None:
         """
@@ -251,37 +269,47 @@ class FreqtradeBot(LoggingMixin):
         :return: True if one or more trades has been created or closed, False otherwise
         """
 
+        start = perf_counter()
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with self._measure_phase("reload_markets"):
+            self.exchange.reload_markets()
 
-        self.update_trades_without_assigned_fees()
+        with self._measure_phase("update_fees"):
+            self.update_trades_without_assigned_fees()
 
-        # Query trades from persistence layer
-        trades: list[Trade] = Trade.get_open_trades()
+        with self._measure_phase("refresh_whitelist"):
+            # Query trades from persistence layer
+            trades: list[Trade] = Trade.get_open_trades()
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
-        # Refreshing candles
-        self.dataprovider.refresh(
-            self.pairlists.create_pair_list(self.active_pair_whitelist),
-            self.strategy.gather_informative_pairs(),
-        )
+        if self._pipelined_analysis:
+            with self._measure_phase("refresh_and_analyze"):
+                self._refresh_and_analyze_pipelined()
+        else:
+            with self._measure_phase("refresh_candles"):
+                # Refreshing candles
+                self.dataprovider.refresh(
+                    self.pairlists.create_pair_list(self.active_pair_whitelist),
+                    self.strategy.gather_informative_pairs(),
+                )
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-            current_time=datetime.now(UTC)
-        )
+            with self._measure_phase("analyze"):
+                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                    current_time=datetime.now(UTC)
+                )
 
-        with self._measure_execution:
-            self.strategy.analyze(self.active_pair_whitelist)
+                with self._measure_execution:
+                    self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
+        with self._exit_lock, self._measure_phase("manage_orders"):
             # Check for exchange cancellations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, freqtrade may try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, self._measure_phase("exit_positions"):
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
@@ -289,16 +317,67 @@ class FreqtradeBot(LoggingMixin):
 
         # Check if we need to adjust our current positions before attempting to enter new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with self._exit_lock, self._measure_phase("adjust_positions"):
                 self.process_open_trade_positions()
 
         # Then looking for entry opportunities
         if self.state == State.RUNNING and self.get_free_open_trades():
-            self.enter_positions()
+            with self._measure_phase("enter_positions"):
+                self.enter_positions()
         self._schedule.run_pending()
-        Trade.commit()
+        with self._measure_phase("commit"):
+            Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
         self.last_process = datetime.now(UTC)
+        latency_registry.observe("process", "total", perf_counter() - start)
+
+    @staticmethod
+    def _measure_phase(phase: str):
+        """
+        Measure the duration of one phase of process() - exposed via the latency metrics.
+        """
+        return latency_registry.measure("process", phase)
+
+    def _refresh_and_analyze_pipelined(self) -> None:
+        """
+        Refresh candles, and analyze each pair as soon as its candles - and the candles of
+        all informative pairs - are refreshed, while the remaining candles are downloaded.
+        """
+        pairs = self.pairlists.create_pair_list(self.active_pair_whitelist)
+        informative_pairs = self.strategy.gather_informative_pairs()
+        refreshed: set[PairWithTimeframe] = set()
+        analyzed: set[str] = set()
+        # Only analysis counts towards the analysis time limit - not downloading candles.
+        analysis_time = 0.0
+
+        def analyze(pairs_to_analyze: list[str]) -> None:
+            nonlocal analysis_time
+            start = perf_counter()
+            self.strategy.analyze(pairs_to_analyze)
+            analysis_time += perf_counter() - start
+
+        def analyze_refreshed(refreshed_pairs: ListPairsWithTimeframes) -> None:
+            refreshed.update(refreshed_pairs)
+            if not refreshed.issuperset(informative_pairs):
+                return
+            ready = [p[0] for p in pairs if p in refreshed and p[0] not in analyzed]
+            analyzed.update(ready)
+            analyze(ready)
+
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+            current_time=datetime.now(UTC)
+        )
+
+        self.dataprovider.refresh(pairs, informative_pairs, on_refreshed=analyze_refreshed)
+        if missing := [p for p in informative_pairs if p not in refreshed]:
+            self.log_once(
+                f"Informative pairs {missing} were not refreshed, analysis waited for all "
+                "candles to be refreshed.",
+                logger.info,
+            )
+        # Pairs which failed to refresh are analyzed with the cached candles
+        analyze([p for p in self.active_pair_whitelist if p not in analyzed])
+        self._measure_execution.check(analysis_time)
 
     def process_stopped(self) -> None:
         """
@@ -1569,31 +1648,41 @@ class FreqtradeBot(LoggingMixin):
         Timeout setting takes priority over limit order adjustment request.
         :return: None
         """
-        for trade in Trade.get_open_trades():
-            open_order: Order
-            for open_order in trade.open_orders:
-                try:
-                    order = self.exchange.fetch_order(open_order.order_id, trade.pair)
-
-                except ExchangeError:
-                    logger.info(
-                        "Cannot query order for %s due to %s", trade, traceback.format_exc()
-                    )
-                    continue
-
-                fully_cancelled = self.update_trade_state(trade, open_order.order_id, order)
-                not_closed = order["status"] == "open" or fully_cancelled
+        trades = Trade.get_open_trades()
+        self.exchange.refresh_order_snapshot(
+            [(order.order_id, trade.pair) for trade in trades for order in trade.open_orders]
+        )
+        try:
+            for trade in trades:
+                open_order: Order
+                for open_order in trade.open_orders:
+                    try:
+                        order = self.exchange.fetch_order(open_order.order_id, trade.pair)
 
-                if not_closed:
-                    if fully_cancelled or (
-                        open_order
-                        and self.strategy.ft_check_timed_out(trade, open_order, datetime.now(UTC))
-                    ):
-                        self.handle_cancel_order(
-                            order, open_order, trade, constants.CANCEL_REASON["TIMEOUT"]
+                    except ExchangeError:
+                        logger.info(
+                            "Cannot query order for %s due to %s", trade, traceback.format_exc()
                         )
-                    else:
-                        self.replace_order(order, open_order, trade)
+                        continue
+
+                    fully_cancelled = self.update_trade_state(trade, open_order.order_id, order)
+                    not_closed = order["status"] == "open" or fully_cancelled
+
+                    if not_closed:
+                        if fully_cancelled or (
+                            open_order
+                            and self.strategy.ft_check_timed_out(
+                                trade, open_order, datetime.now(UTC)
+                            )
+                        ):
+                            self.handle_cancel_order(
+                                order, open_order, trade, constants.CANCEL_REASON["TIMEOUT"]
+                            )
+                        else:
+                            self.replace_order(order, open_order, trade)
+        finally:
+            # Don't serve unused snapshot entries outside of this loop
+            self.exchange.clear_order_snapshot()
 
     def handle_cancel_order(
         self, order: CcxtOrder, order_obj: Order, trade: Trade, reason: str, replacing: bool = False
@@ -316,6 +316,8 @@ class Backtesting:
             startup_candles=self.required_startup,
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
+            workers=self.config.get("dataload_workers"),
+            resample=self.config.get("dataload_resample", False),
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
         )
 
@@ -354,6 +356,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("dataload_workers"),
+                resample=self.config.get("dataload_resample", False),
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
             )
         else:
@@ -372,6 +376,7 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("dataload_workers"),
                 candle_type=CandleType.FUNDING_RATE,
             )
 
@@ -384,6 +389,7 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
+                workers=self.config.get("dataload_workers"),
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
             )
             # Combine data to avoid combining the data per trade.
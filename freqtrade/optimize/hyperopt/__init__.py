@@ -1,5 +1,6 @@
 from freqtrade.optimize.hyperopt.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
+from freqtrade.optimize.hyperopt_loss.hyperopt_loss_metrics import HyperoptLossMetrics
 
 
-__all__ = ["Hyperopt", "IHyperOptLoss"]
+__all__ = ["Hyperopt", "HyperoptLossMetrics", "IHyperOptLoss"]
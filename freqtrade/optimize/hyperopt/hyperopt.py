@@ -15,15 +15,22 @@ from typing import Any
 
 import rapidjson
 from joblib import Parallel, cpu_count
-from optuna.trial import FrozenTrial, Trial, TrialState
+from joblib.externals.loky import get_reusable_executor
+from optuna.trial import FrozenTrial, Trial, TrialState, create_trial
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
+from freqtrade.data.btanalysis import get_latest_hyperopt_file
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_cache import (
+    HyperoptResultCache,
+    get_hyperopt_cache_fingerprint,
+)
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_resources import HyperoptResourceMonitor
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -77,6 +84,17 @@ class Hyperopt:
 
         self.clean_hyperopt()
 
+        self.resume_file: Path | None = None
+        self.resumed_epochs = 0
+        if self.config.get("hyperopt_resume"):
+            self.resume_file = get_latest_hyperopt_file(
+                self.config["user_data_dir"] / "hyperopt_results", self.config["hyperopt_resume"]
+            )
+            if not HyperoptTools._test_hyperopt_results_exist(self.resume_file):
+                raise OperationalException(f"Hyperopt file {self.resume_file} to resume not found.")
+            # New epochs are appended to the resumed file.
+            self.results_file = self.resume_file
+
         self.num_epochs_saved = 0
         self.current_best_epoch: dict[str, Any] | None = None
 
@@ -90,6 +108,8 @@ class Hyperopt:
 
         self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
         self.count_skipped_epochs = 0
+        self.result_cache: HyperoptResultCache | None = None
+        self.resource_monitor = HyperoptResourceMonitor(self.config)
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -142,11 +162,13 @@ class Hyperopt:
             self._hyper_out.add_data(
                 self.config,
                 [results],
-                self.total_epochs,
+                self.total_epochs + self.resumed_epochs,
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def run_optimizer_parallel(
+        self, parallel: Parallel, asked: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
 
         def optimizer_wrapper(*args, **kwargs):
@@ -159,6 +181,118 @@ class Hyperopt:
 
         return parallel(optimizer_wrapper(v) for v in asked)
 
+    def run_optimizer_cached(
+        self, parallel: Parallel, asked: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Run the optimizer for all asked points which are not in the result cache.
+        Cached results are returned instantly, in the same order as `asked`.
+        """
+        if self.result_cache is None:
+            return self.run_optimizer_parallel(parallel, asked)
+
+        results: list[dict[str, Any] | None] = [self.result_cache.get(p) for p in asked]
+        # Parameters may be modified while running the epoch - so copy them.
+        to_run = [dict(p) for p, r in zip(asked, results, strict=True) if r is None]
+        if to_run:
+            new_results = iter(self.run_optimizer_parallel(parallel, to_run))
+            for idx, res in enumerate(results):
+                if res is None:
+                    results[idx] = res = next(new_results)
+                    self.result_cache.store(asked[idx], res)
+
+        return results  # type: ignore[return-value]
+
+    def run_optimizer_single(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run the optimizer in the main process, using the result cache if available"""
+        if self.result_cache is None:
+            return self.hyperopter.generate_optimizer(params)
+        if (result := self.result_cache.get(params)) is None:
+            result = self.hyperopter.generate_optimizer(dict(params))
+            self.result_cache.store(params, result)
+        return result
+
+    def check_recycle_workers(self, parallel: Parallel, jobs: int) -> None:
+        """
+        Restart all worker processes if one of them exceeded the configured
+        epoch count or memory limit - releasing memory accumulated by prior epochs.
+        """
+        if jobs == 1:
+            # Epochs run in the main process, which can't be restarted.
+            return
+        if not self.resource_monitor.should_recycle():
+            return
+        # Leave the Parallel context to release its workers, stop the (otherwise reused)
+        # worker processes - and re-enter, starting new workers.
+        parallel.__exit__(None, None, None)
+        get_reusable_executor(reuse=True).shutdown(wait=True)
+        parallel.__enter__()
+        self.resource_monitor.workers_recycled()
+
+    def _init_result_cache(self) -> None:
+        if not self.config.get("hyperopt_cache", False):
+            return
+        fingerprint = get_hyperopt_cache_fingerprint(
+            self.hyperopter.backtesting.strategy,
+            self.hyperopter.custom_hyperoptloss,
+            self.hyperopter.data_fingerprint,
+        )
+        self.result_cache = HyperoptResultCache(
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_cache", fingerprint
+        )
+
+    def resume_from_file(self) -> None:
+        """
+        Seed the optimizer with the epochs of a previous hyperopt run.
+        The previous run must have used the same strategy and the same spaces.
+        """
+        if not self.resume_file:
+            return
+        strategy_name = self.hyperopter.get_strategy_name()
+        dimensions = self.hyperopter.o_dimensions
+        skipped = 0
+        for epochs in HyperoptTools._read_results(self.resume_file):
+            for epoch in epochs:
+                if epoch.get("is_best") is None:
+                    raise OperationalException(
+                        f"Hyperopt file {self.resume_file} is incompatible with this version "
+                        "of Freqtrade and cannot be resumed."
+                    )
+                if epoch["results_metrics"].get("strategy_name", strategy_name) != strategy_name:
+                    raise OperationalException(
+                        f"Hyperopt file {self.resume_file} was created with a different strategy."
+                    )
+                if set(epoch["params_dict"].keys()) != set(dimensions.keys()):
+                    raise OperationalException(
+                        f"Hyperopt file {self.resume_file} was created with different spaces."
+                    )
+                self.resumed_epochs = max(self.resumed_epochs + 1, epoch["current_epoch"])
+                try:
+                    self.opt.add_trial(
+                        create_trial(
+                            params=epoch["params_dict"],
+                            distributions=dimensions,
+                            value=epoch["loss"],
+                        )
+                    )
+                except ValueError:
+                    # Parameter outside of the current search space.
+                    skipped += 1
+                    continue
+                if HyperoptTools.is_best_loss(epoch, self.current_best_loss):
+                    self.current_best_loss = epoch["loss"]
+                    self.current_best_epoch = epoch
+
+        logger.info(
+            f"Resuming from {self.resumed_epochs} {plural(self.resumed_epochs, 'epoch')} "
+            f"of '{self.resume_file}'."
+        )
+        if skipped > 0:
+            logger.warning(
+                f"{skipped} previous {plural(skipped, 'epoch')} outside of the current "
+                "search space not used to seed the optimizer."
+            )
+
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
@@ -228,6 +362,7 @@ class Hyperopt:
         # order they will be shown to the user.
         val["is_best"] = is_best
         val["is_random"] = is_random
+        self.resource_monitor.add(val.get("resource_usage"))
         self.print_results(val)
 
         if is_best:
@@ -250,6 +385,7 @@ class Hyperopt:
         logger.info(f"Using optimizer random state: {self.random_state}")
         self.hyperopt_table_header = -1
         self.hyperopter.prepare_hyperopt()
+        self._init_result_cache()
 
         cpus = cpu_count()
         logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
@@ -257,6 +393,7 @@ class Hyperopt:
         logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
         self.opt = self.hyperopter.get_optimizer(self.random_state)
+        self.resume_from_file()
         self._setup_logging_mp_workaround()
         try:
             with Parallel(n_jobs=config_jobs) as parallel:
@@ -275,9 +412,9 @@ class Hyperopt:
                         asked, is_random = self.get_asked_points(
                             n_points=1, dimensions=self.hyperopter.o_dimensions
                         )
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
+                        f_val0 = self.run_optimizer_single(asked[0].params)
                         self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
+                        self.evaluate_result(f_val0, 1 + self.resumed_epochs, is_random[0])
                         pbar.update(task, advance=1)
                         start += 1
 
@@ -292,7 +429,7 @@ class Hyperopt:
                             n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
                         )
 
-                        f_val = self.run_optimizer_parallel(
+                        f_val = self.run_optimizer_cached(
                             parallel,
                             [asked1.params for asked1 in asked],
                         )
@@ -303,12 +440,13 @@ class Hyperopt:
 
                         for j, val in enumerate(f_val):
                             # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
+                            current = i * jobs + j + 1 + start + self.resumed_epochs
 
                             self.evaluate_result(val, current, is_random[j])
                             pbar.update(task, advance=1)
                         logging_mp_handle(log_queue)
                         gc.collect()
+                        self.check_recycle_workers(parallel, jobs)
 
                         if (
                             self.hyperopter.es_epochs > 0
@@ -326,6 +464,14 @@ class Hyperopt:
                 f"skipped due to duplicate parameters."
             )
 
+        self.resource_monitor.log_summary()
+
+        if self.result_cache is not None and self.result_cache.hits > 0:
+            logger.info(
+                f"{self.result_cache.hits} {plural(self.result_cache.hits, 'epoch')} "
+                f"served from the hyperopt result cache."
+            )
+
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
             f"saved to '{self.results_file}'."
@@ -339,7 +485,7 @@ class Hyperopt:
             )
 
             HyperoptTools.show_epoch_details(
-                self.current_best_epoch, self.total_epochs, self.print_json
+                self.current_best_epoch, self.total_epochs + self.resumed_epochs, self.print_json
             )
         elif self.num_epochs_saved > 0:
             print(
@@ -0,0 +1,171 @@
+"""
+Persistent result cache for hyperopt epochs.
+Allows repeated parameter points (within a run, or across runs) to reuse
+previously calculated results instead of running a full backtest again.
+"""
+
+import hashlib
+import inspect
+import logging
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+
+from freqtrade.optimize.hyperopt_tools import hyperopt_serializer
+
+
+logger = logging.getLogger(__name__)
+
+# Config keys which have no impact on the result of an individual epoch.
+NOT_IMPORTANT_KEYS = (
+    "strategy_list",
+    "original_config",
+    "telegram",
+    "api_server",
+    "epochs",
+    "early_stop",
+    "hyperopt_jobs",
+    "hyperopt_random_state",
+    "hyperopt_cache",
+    "hyperopt_resume",
+    "hyperopt_worker_max_epochs",
+    "hyperopt_worker_max_rss",
+    "print_all",
+    "print_json",
+    "print_colorized",
+    "verbosity",
+    "logfile",
+)
+
+
+def get_data_fingerprint(data: dict[str, DataFrame]) -> str:
+    """
+    Generate a hash identifying the candle data used for hyperopt.
+    Only OHLCV columns are considered - indicators are covered by the strategy hash.
+    :param data: Dictionary of pair -> dataframe, as loaded from disk.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    for pair in sorted(data):
+        df = data[pair]
+        digest.update(pair.encode("utf-8"))
+        columns = [c for c in ("date", "open", "high", "low", "close", "volume") if c in df]
+        digest.update(str(len(df)).encode("utf-8"))
+        # Row hashes in row order - reordered candles must change the fingerprint.
+        digest.update(hash_pandas_object(df[columns], index=False).to_numpy().tobytes())
+    return digest.hexdigest().lower()
+
+
+def get_hyperopt_cache_fingerprint(strategy, hyperopt_loss, data_fingerprint: str) -> str:
+    """
+    Generate unique identification hash for a hyperopt setup.
+    Identical config (ignoring options which don't change epoch results), strategy file,
+    hyperopt loss file and data will always return an identical hash.
+    :param strategy: strategy object.
+    :param hyperopt_loss: hyperopt loss object.
+    :param data_fingerprint: hash of the data, as returned by `get_data_fingerprint()`.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    config = deepcopy(strategy.config)
+    for k in NOT_IMPORTANT_KEYS:
+        if k in config:
+            del config[k]
+
+    digest.update(
+        rapidjson.dumps(config, default=str, number_mode=rapidjson.NM_NAN, sort_keys=True).encode(
+            "utf-8"
+        )
+    )
+    digest.update(
+        rapidjson.dumps(
+            strategy._ft_params_from_file, default=str, number_mode=rapidjson.NM_NAN
+        ).encode("utf-8")
+    )
+    with Path(strategy.__file__).open("rb") as fp:
+        digest.update(fp.read())
+    # Resolved classes carry the file they were loaded from.
+    loss_file = getattr(hyperopt_loss, "__file__", None) or inspect.getfile(type(hyperopt_loss))
+    with Path(loss_file).open("rb") as fp:
+        digest.update(fp.read())
+    digest.update(data_fingerprint.encode("utf-8"))
+    return digest.hexdigest().lower()
+
+
+class HyperoptResultCache:
+    """
+    Memo of epoch results, keyed by the canonicalised parameter dict.
+    Results are persisted to one json-lines file per fingerprint, so a repeated
+    parameter point in a later run returns the stored result instantly.
+    """
+
+    def __init__(self, cache_dir: Path, fingerprint: str) -> None:
+        self.cache_file = cache_dir / f"{fingerprint}.jsonl"
+        self._results: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self._load()
+
+    @staticmethod
+    def get_key(params: dict[str, Any]) -> str:
+        return rapidjson.dumps(
+            params,
+            default=hyperopt_serializer,
+            number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+            sort_keys=True,
+        )
+
+    def _load(self) -> None:
+        if not self.cache_file.is_file():
+            return
+        with self.cache_file.open("r") as f:
+            for line in f:
+                try:
+                    entry = rapidjson.loads(
+                        line, number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN
+                    )
+                except ValueError:
+                    # Partially written line from an interrupted run.
+                    continue
+                self._results[entry["key"]] = entry["result"]
+        logger.info(f"Loaded {len(self._results)} cached hyperopt results from {self.cache_file}.")
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, params: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Return a copy of the cached result for these parameters, or None.
+        """
+        result = self._results.get(self.get_key(params))
+        if result is None:
+            return None
+        self.hits += 1
+        return deepcopy(result)
+
+    def store(self, params: dict[str, Any], result: dict[str, Any]) -> None:
+        """
+        Store the result of one epoch. Must be called before the result is
+        enriched with epoch-specific information (epoch number, is_best, ...).
+        """
+        key = self.get_key(params)
+        if key in self._results:
+            return
+        # Resource usage is only valid for the epoch which actually ran.
+        result = {k: v for k, v in result.items() if k != "resource_usage"}
+        line = rapidjson.dumps(
+            {"key": key, "result": result},
+            default=hyperopt_serializer,
+            number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+        )
+        # Keep the json-roundtripped version, so cached results look identical across runs.
+        self._results[key] = rapidjson.loads(
+            line, number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN
+        )["result"]
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.cache_file.open("a") as f:
+            f.write(line)
+            f.write("\n")
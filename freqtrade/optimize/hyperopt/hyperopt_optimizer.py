@@ -9,6 +9,7 @@ import warnings
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import optuna
 from joblib import delayed, dump, load, wrap_non_picklable_objects
@@ -29,7 +30,13 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_cache import get_data_fingerprint
+from freqtrade.optimize.hyperopt.hyperopt_resources import (
+    get_resource_snapshot,
+    get_resource_usage,
+)
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
+from freqtrade.optimize.hyperopt_loss.hyperopt_loss_metrics import HyperoptLossMetrics
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import (
@@ -49,6 +56,10 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Processed data, loaded once per (worker) process and reused for all epochs of this process.
+# Keyed by data file and data generation, to avoid reusing data of a prior hyperopt run.
+_processed_cache: dict[tuple[str, str], dict[str, DataFrame]] = {}
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -105,6 +116,8 @@ class HyperOptimizer:
         self.data_pickle_file = data_pickle_file
 
         self.market_change = 0.0
+        self.data_fingerprint = ""
+        self.data_generation = uuid4().hex
 
         self.es_epochs = config.get("early_stop", 0)
         if self.es_epochs > 0 and self.es_epochs < 0.2 * config.get("epochs", 0):
@@ -273,6 +286,7 @@ class HyperOptimizer:
         Keep this function as optimized as possible!
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
+        resources_start = get_resource_snapshot()
         backtest_start_time = datetime.now(UTC)
 
         # Apply parameters
@@ -321,8 +335,7 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed = self.load_processed_data()
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
@@ -340,8 +353,25 @@ class HyperOptimizer:
         result = self._get_results_dict(
             bt_results, self.min_date, self.max_date, params_dict, processed=processed
         )
+        result["resource_usage"] = get_resource_usage(
+            resources_start, result["results_metrics"]["total_trades"]
+        )
         return result
 
+    def load_processed_data(self) -> dict[str, DataFrame]:
+        """
+        Load the prepared data, attaching to the data file only once per process.
+        The file is memory-mapped, so all worker processes share the same page-cache copy.
+        Each epoch receives shallow copies, so added columns don't leak into the next epoch,
+        while the (read-only) arrays are not copied.
+        """
+        key = (str(self.data_pickle_file), self.data_generation)
+        if key not in _processed_cache:
+            _processed_cache.clear()
+            with self.data_pickle_file.open("rb") as f:
+                _processed_cache[key] = load(f, mmap_mode="r")
+        return {pair: df.copy(deep=False) for pair, df in _processed_cache[key].items()}
+
     def _get_results_dict(
         self,
         backtesting_results: BacktestContentType,
@@ -377,6 +407,7 @@ class HyperOptimizer:
         # path. We do not want to optimize 'hodl' strategies.
         loss: float = MAX_LOSS
         if trade_count >= self.config["hyperopt_min_trades"]:
+            starting_balance = get_dry_run_wallet(self.config)
             loss = self.calculate_loss(
                 results=backtesting_results["results"],
                 trade_count=trade_count,
@@ -385,7 +416,10 @@ class HyperOptimizer:
                 config=self.config,
                 processed=processed,
                 backtest_stats=strat_stats,
-                starting_balance=get_dry_run_wallet(self.config),
+                starting_balance=starting_balance,
+                metrics=HyperoptLossMetrics(
+                    backtesting_results["results"], min_date, max_date, starting_balance
+                ),
             )
         return {
             "loss": loss,
@@ -463,7 +497,12 @@ class HyperOptimizer:
 
     def prepare_hyperopt_data(self) -> None:
         HyperoptStateContainer.set_state(HyperoptState.DATALOAD)
+        self.data_generation = uuid4().hex
         data, self.timerange = self.backtesting.load_bt_data()
+        if self.config.get("hyperopt_cache", False):
+            self.data_fingerprint = get_data_fingerprint(
+                data | {f"{pair}|detail": df for pair, df in self.backtesting.detail_data.items()}
+            )
         logger.info("Dataload complete. Calculating indicators")
 
         if not self.analyze_per_epoch:
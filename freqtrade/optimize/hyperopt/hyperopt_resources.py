@@ -0,0 +1,152 @@
+"""
+Resource usage tracking for hyperopt epochs and worker processes.
+"""
+
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import psutil
+
+from freqtrade.constants import Config
+from freqtrade.misc import plural
+
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ResourceSnapshot:
+    wall_time: float
+    cpu_time: float
+    rss: int
+    peak_rss: int
+
+
+def get_peak_rss() -> int:
+    """
+    Peak resident set size of the current process since it started, in bytes.
+    """
+    if resource is None:
+        return getattr(psutil.Process().memory_info(), "peak_wset", 0)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in kilobytes elsewhere.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def get_resource_snapshot() -> ResourceSnapshot:
+    """
+    Snapshot of the current process' resource usage. Used by worker processes.
+    """
+    return ResourceSnapshot(
+        wall_time=time.perf_counter(),
+        cpu_time=time.process_time(),
+        rss=psutil.Process().memory_info().rss,
+        peak_rss=get_peak_rss(),
+    )
+
+
+def get_resource_usage(start: ResourceSnapshot, trade_count: int) -> dict[str, Any]:
+    """
+    Resource usage of one epoch, compared to the snapshot taken at epoch start.
+    peak_rss_delta is the peak rss during the epoch minus rss at epoch start. The peak is the
+    high-water mark of the process - if it wasn't raised during the epoch, it's an upper bound.
+    """
+    end = get_resource_snapshot()
+    return {
+        "pid": os.getpid(),
+        "wall_time": round(end.wall_time - start.wall_time, 3),
+        "cpu_time": round(end.cpu_time - start.cpu_time, 3),
+        "rss": end.rss,
+        "peak_rss": end.peak_rss,
+        "peak_rss_delta": max(end.peak_rss - start.rss, 0),
+        "trade_count": trade_count,
+    }
+
+
+@dataclass
+class WorkerStats:
+    epochs: int
+    first_rss: int
+    max_rss: int
+
+
+class HyperoptResourceMonitor:
+    """
+    Collects per-epoch resource usage in the main process, detects workers
+    which should be recycled and summarizes the resource usage of the run.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.max_epochs_per_worker: int = config.get("hyperopt_worker_max_epochs", 0)
+        self.max_rss: int = int(config.get("hyperopt_worker_max_rss", 0) * MB)
+        self._workers: dict[int, WorkerStats] = {}
+        self.epochs = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.max_epoch_wall_time = 0.0
+        self.max_rss_seen = 0
+        self.max_rss_growth = 0
+        self.recycles = 0
+
+    def add(self, usage: dict[str, Any] | None) -> None:
+        """Add the resource usage of one epoch"""
+        if not usage:
+            # Cached results don't carry resource usage.
+            return
+        self.epochs += 1
+        self.wall_time += usage["wall_time"]
+        self.cpu_time += usage["cpu_time"]
+        self.max_epoch_wall_time = max(self.max_epoch_wall_time, usage["wall_time"])
+        self.max_rss_seen = max(self.max_rss_seen, usage["rss"])
+
+        worker = self._workers.get(usage["pid"])
+        if worker is None:
+            # rss at the end of the first epoch is used as baseline.
+            self._workers[usage["pid"]] = WorkerStats(1, usage["rss"], usage["rss"])
+        else:
+            worker.epochs += 1
+            worker.max_rss = max(worker.max_rss, usage["rss"])
+            self.max_rss_growth = max(self.max_rss_growth, worker.max_rss - worker.first_rss)
+
+    def should_recycle(self) -> bool:
+        """
+        Check if any worker exceeded the configured epoch count or memory limit.
+        """
+        for pid, worker in self._workers.items():
+            if self.max_epochs_per_worker and worker.epochs >= self.max_epochs_per_worker:
+                logger.info(f"Worker {pid} evaluated {worker.epochs} epochs, recycling workers.")
+                return True
+            if self.max_rss and worker.max_rss >= self.max_rss:
+                logger.info(
+                    f"Worker {pid} is using {worker.max_rss / MB:.0f} MB, recycling workers."
+                )
+                return True
+        return False
+
+    def workers_recycled(self) -> None:
+        self.recycles += 1
+        self._workers = {}
+
+    def log_summary(self) -> None:
+        if self.epochs == 0:
+            return
+        logger.info(
+            f"Resource usage: {self.epochs} {plural(self.epochs, 'epoch')} measured, "
+            f"avg wall time {self.wall_time / self.epochs:.2f}s "
+            f"(max {self.max_epoch_wall_time:.2f}s), "
+            f"avg cpu time {self.cpu_time / self.epochs:.2f}s, "
+            f"max worker memory {self.max_rss_seen / MB:.0f} MB, "
+            f"max memory growth per worker {self.max_rss_growth / MB:.0f} MB, "
+            f"{self.recycles} worker {plural(self.recycles, 'recycle')}."
+        )
@@ -9,8 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_calmar
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 class CalmarHyperOptLoss(IHyperOptLoss):
@@ -26,6 +25,7 @@ class CalmarHyperOptLoss(IHyperOptLoss):
         min_date: datetime,
         max_date: datetime,
         starting_balance: float,
+        metrics: HyperoptLossMetrics | None = None,
         *args,
         **kwargs,
     ) -> float:
@@ -34,6 +34,8 @@ class CalmarHyperOptLoss(IHyperOptLoss):
 
         Uses Calmar Ratio calculation.
         """
-        calmar_ratio = calculate_calmar(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = HyperoptLossMetrics(results, min_date, max_date, starting_balance)
+        calmar_ratio = metrics.calmar
         # print(expected_returns_mean, max_drawdown, calmar_ratio)
         return -calmar_ratio
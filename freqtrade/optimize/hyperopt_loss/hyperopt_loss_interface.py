@@ -10,6 +10,7 @@ from typing import Any
 from pandas import DataFrame
 
 from freqtrade.constants import Config
+from freqtrade.optimize.hyperopt_loss.hyperopt_loss_metrics import HyperoptLossMetrics
 
 
 class IHyperOptLoss(ABC):
@@ -32,8 +33,10 @@ class IHyperOptLoss(ABC):
         processed: dict[str, DataFrame],
         backtest_stats: dict[str, Any],
         starting_balance: float,
+        metrics: HyperoptLossMetrics,
         **kwargs,
     ) -> float:
         """
         Objective function, returns smaller number for better results
+        `metrics` provides cached, vectorized metrics (sharpe, drawdown, ...) of `results`.
         """
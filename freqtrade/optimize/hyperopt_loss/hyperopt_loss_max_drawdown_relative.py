@@ -7,8 +7,7 @@ Hyperoptimization.
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_underwater
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
@@ -21,7 +20,11 @@ class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
 
     @staticmethod
     def hyperopt_loss_function(
-        results: DataFrame, starting_balance: float, *args, **kwargs
+        results: DataFrame,
+        starting_balance: float,
+        metrics: HyperoptLossMetrics | None = None,
+        *args,
+        **kwargs,
     ) -> float:
         """
         Objective function.
@@ -29,13 +32,14 @@ class MaxDrawDownRelativeHyperOptLoss(IHyperOptLoss):
         Uses profit ratio weighted max_drawdown when drawdown is available.
         Otherwise directly optimizes profit ratio.
         """
-        total_profit = results["profit_abs"].sum()
-        try:
-            drawdown_df = calculate_underwater(
-                results, value_col="profit_abs", starting_balance=starting_balance
+        if metrics is None:
+            metrics = HyperoptLossMetrics(
+                results, kwargs.get("min_date"), kwargs.get("max_date"), starting_balance
             )
-            max_drawdown = abs(min(drawdown_df["drawdown"]))
-            relative_drawdown = max(drawdown_df["drawdown_relative"])
+        total_profit = metrics.total_profit_abs
+        try:
+            max_drawdown = metrics.max_drawdown_abs
+            relative_drawdown = metrics.max_drawdown_relative
             if max_drawdown == 0:
                 return -total_profit
             return -total_profit / max_drawdown / relative_drawdown
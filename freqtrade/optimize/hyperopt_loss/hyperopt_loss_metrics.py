@@ -0,0 +1,218 @@
+"""
+HyperoptLossMetrics
+Lazily calculated metrics of one epoch's results, shared by hyperopt loss functions.
+"""
+
+import math
+from datetime import datetime
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+
+DAY_NS = 86_400 * 10**9
+
+
+def _to_naive_utc(date: datetime) -> pd.Timestamp:
+    ts = pd.Timestamp(date)
+    return ts.tz_convert(None) if ts.tzinfo is not None else ts
+
+
+class HyperoptLossMetrics:
+    """
+    Metrics of the trade results of one epoch.
+    Every metric is calculated once (on first access) using NumPy, and cached afterwards -
+    so loss functions don't need to recompute daily returns, equity or drawdown series
+    with multiple pandas passes.
+    Results are identical to the corresponding functions in `freqtrade.data.metrics`.
+    """
+
+    def __init__(
+        self,
+        results: pd.DataFrame,
+        min_date: datetime | None,
+        max_date: datetime | None,
+        starting_balance: float = 0.0,
+    ) -> None:
+        self.results = results
+        self.min_date = min_date
+        self.max_date = max_date
+        self.starting_balance = starting_balance
+        self.trade_count = len(results)
+        self._daily_profit_ratio: dict[float, np.ndarray] = {}
+
+    @cached_property
+    def days_period(self) -> int:
+        if self.min_date is None or self.max_date is None:
+            return 1
+        return max(1, (self.max_date - self.min_date).days)
+
+    @cached_property
+    def _valid_period(self) -> bool:
+        return (
+            self.trade_count > 0
+            and self.min_date is not None
+            and self.max_date is not None
+            and self.min_date != self.max_date
+        )
+
+    @cached_property
+    def profit_abs(self) -> np.ndarray:
+        """Absolute profit per trade, in results order"""
+        return self.results["profit_abs"].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def profit_ratio(self) -> np.ndarray:
+        """Profit ratio per trade, in results order"""
+        return self.results["profit_ratio"].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def close_dates_ns(self) -> np.ndarray:
+        """Close dates (UTC) as int64 nanoseconds, in results order"""
+        dates = pd.DatetimeIndex(self.results["close_date"])
+        if dates.tz is not None:
+            dates = dates.tz_convert(None)
+        return dates.as_unit("ns").asi8
+
+    @cached_property
+    def total_profit_abs(self) -> float:
+        return float(self.profit_abs.sum())
+
+    @cached_property
+    def _close_date_order(self) -> np.ndarray:
+        return self.results["close_date"].reset_index(drop=True).sort_values().index.to_numpy()
+
+    @cached_property
+    def equity(self) -> np.ndarray:
+        """Cumulative absolute profit, ordered by close date"""
+        return np.cumsum(self.profit_abs[self._close_date_order])
+
+    @cached_property
+    def high_value(self) -> np.ndarray:
+        return np.maximum(0, np.maximum.accumulate(self.equity))
+
+    @cached_property
+    def drawdown(self) -> np.ndarray:
+        """Absolute drawdown series (<= 0), ordered by close date"""
+        return self.equity - self.high_value
+
+    @cached_property
+    def drawdown_relative(self) -> np.ndarray:
+        """Relative account drawdown series, ordered by close date"""
+        if self.starting_balance:
+            max_balance = self.starting_balance + self.high_value
+            return (max_balance - (self.starting_balance + self.equity)) / max_balance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.high_value - self.equity) / self.high_value
+
+    @cached_property
+    def max_drawdown_abs(self) -> float:
+        if self.trade_count == 0:
+            return 0.0
+        return float(abs(self.drawdown.min()))
+
+    @cached_property
+    def relative_account_drawdown(self) -> float:
+        """
+        Relative account drawdown at the point of the maximum absolute drawdown.
+        Identical to `calculate_max_drawdown().relative_account_drawdown`.
+        """
+        if self.trade_count == 0:
+            return 0.0
+        return float(self.drawdown_relative[np.argmin(self.drawdown)])
+
+    @cached_property
+    def max_drawdown_relative(self) -> float:
+        """Maximum relative account drawdown"""
+        if self.trade_count == 0:
+            return 0.0
+        return float(np.nanmax(self.drawdown_relative))
+
+    def daily_profit_ratio(self, slippage_per_trade: float = 0.0) -> np.ndarray:
+        """
+        Sum of profit ratios per day, for every day between min_date and max_date.
+        :param slippage_per_trade: Slippage ratio to deduct from every trade.
+        """
+        if slippage_per_trade in self._daily_profit_ratio:
+            return self._daily_profit_ratio[slippage_per_trade]
+        if self.min_date is None or self.max_date is None:
+            raise ValueError("min_date and max_date are required for daily metrics.")
+        start = _to_naive_utc(self.min_date).normalize().value
+        end = _to_naive_utc(self.max_date).normalize().value
+        days = (end - start) // DAY_NS + 1
+        day_idx = (self.close_dates_ns - start) // DAY_NS
+        mask = (day_idx >= 0) & (day_idx < days)
+        daily = np.bincount(
+            day_idx[mask], weights=self.profit_ratio[mask] - slippage_per_trade, minlength=days
+        )
+        self._daily_profit_ratio[slippage_per_trade] = daily
+        return daily
+
+    @cached_property
+    def sharpe(self) -> float:
+        """Identical to `calculate_sharpe()`"""
+        if not self._valid_period:
+            return 0
+        total_profit = self.profit_abs / self.starting_balance
+        expected_returns_mean = total_profit.sum() / self.days_period
+        up_stdev = np.std(total_profit)
+        if up_stdev != 0:
+            return expected_returns_mean / up_stdev * np.sqrt(365)
+        # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
+        return -100
+
+    @cached_property
+    def sortino(self) -> float:
+        """Identical to `calculate_sortino()`"""
+        if not self._valid_period:
+            return 0
+        expected_returns_mean = self.total_profit_abs / self.starting_balance / self.days_period
+        losses = self.profit_abs[self.profit_abs < 0] / self.starting_balance
+        down_stdev = np.std(losses) if len(losses) > 0 else np.nan
+        if down_stdev != 0 and not np.isnan(down_stdev):
+            return expected_returns_mean / down_stdev * np.sqrt(365)
+        # Define high (negative) sortino ratio to be clear that this is NOT optimal.
+        return -100
+
+    @cached_property
+    def calmar(self) -> float:
+        """Identical to `calculate_calmar()`"""
+        if not self._valid_period:
+            return 0
+        expected_returns_mean = (
+            self.total_profit_abs / self.starting_balance / self.days_period * 100
+        )
+        if self.relative_account_drawdown != 0:
+            return expected_returns_mean / self.relative_account_drawdown * math.sqrt(365)
+        # Define high (negative) calmar ratio to be clear that this is NOT optimal.
+        return -100
+
+    @cached_property
+    def winning_profit_abs(self) -> float:
+        return float(self.profit_abs[self.profit_abs > 0].sum())
+
+    @cached_property
+    def losing_profit_abs(self) -> float:
+        return float(self.profit_abs[self.profit_abs < 0].sum())
+
+    @cached_property
+    def winrate(self) -> float:
+        if self.trade_count == 0:
+            return 0.0
+        return int((self.profit_abs > 0).sum()) / self.trade_count
+
+    @cached_property
+    def expectancy_ratio(self) -> float:
+        """Identical to `calculate_expectancy()[1]`"""
+        if self.trade_count == 0:
+            return 100.0
+        nb_win_trades = int((self.profit_abs > 0).sum())
+        nb_loss_trades = int((self.profit_abs < 0).sum())
+        average_win = (self.winning_profit_abs / nb_win_trades) if nb_win_trades > 0 else 0
+        loss_sum = abs(self.losing_profit_abs)
+        average_loss = (loss_sum / nb_loss_trades) if nb_loss_trades > 0 else 0
+        if average_loss > 0:
+            risk_reward_ratio = average_win / average_loss
+            return ((1 + risk_reward_ratio) * self.winrate) - 1
+        return 100.0
@@ -10,8 +10,7 @@ individual needs.
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_max_drawdown
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 # smaller numbers penalize drawdowns more severely
@@ -21,17 +20,18 @@ DRAWDOWN_MULT = 0.075
 class ProfitDrawDownHyperOptLoss(IHyperOptLoss):
     @staticmethod
     def hyperopt_loss_function(
-        results: DataFrame, starting_balance: float, *args, **kwargs
+        results: DataFrame,
+        starting_balance: float,
+        metrics: HyperoptLossMetrics | None = None,
+        *args,
+        **kwargs,
     ) -> float:
-        total_profit = results["profit_abs"].sum()
-
-        try:
-            drawdown = calculate_max_drawdown(
-                results, starting_balance=starting_balance, value_col="profit_abs"
+        if metrics is None:
+            metrics = HyperoptLossMetrics(
+                results, kwargs.get("min_date"), kwargs.get("max_date"), starting_balance
             )
-            relative_account_drawdown = drawdown.relative_account_drawdown
-        except ValueError:
-            relative_account_drawdown = 0
+        total_profit = metrics.total_profit_abs
+        relative_account_drawdown = metrics.relative_account_drawdown
 
         return -1 * (
             total_profit - (relative_account_drawdown * total_profit) * (1 - DRAWDOWN_MULT)
@@ -9,8 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sharpe
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 class SharpeHyperOptLoss(IHyperOptLoss):
@@ -26,6 +25,7 @@ class SharpeHyperOptLoss(IHyperOptLoss):
         min_date: datetime,
         max_date: datetime,
         starting_balance: float,
+        metrics: HyperoptLossMetrics | None = None,
         *args,
         **kwargs,
     ) -> float:
@@ -34,6 +34,8 @@ class SharpeHyperOptLoss(IHyperOptLoss):
 
         Uses Sharpe Ratio calculation.
         """
-        sharp_ratio = calculate_sharpe(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = HyperoptLossMetrics(results, min_date, max_date, starting_balance)
+        sharp_ratio = metrics.sharpe
         # print(expected_returns_mean, up_stdev, sharp_ratio)
         return -sharp_ratio
@@ -5,12 +5,12 @@ This module defines the alternative HyperOptLoss class which can be used for
 Hyperoptimization.
 """
 
-import math
 from datetime import datetime
 
-from pandas import DataFrame, date_range
+import numpy as np
+from pandas import DataFrame
 
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 class SharpeHyperOptLossDaily(IHyperOptLoss):
@@ -26,6 +26,7 @@ class SharpeHyperOptLossDaily(IHyperOptLoss):
         trade_count: int,
         min_date: datetime,
         max_date: datetime,
+        metrics: HyperoptLossMetrics | None = None,
         *args,
         **kwargs,
     ) -> float:
@@ -34,33 +35,23 @@ class SharpeHyperOptLossDaily(IHyperOptLoss):
 
         Uses Sharpe Ratio calculation.
         """
-        resample_freq = "1D"
         slippage_per_trade_ratio = 0.0005
         days_in_year = 365
         annual_risk_free_rate = 0.0
         risk_free_rate = annual_risk_free_rate / days_in_year
 
-        # apply slippage per trade to profit_ratio
-        results.loc[:, "profit_ratio_after_slippage"] = (
-            results["profit_ratio"] - slippage_per_trade_ratio
-        )
+        if metrics is None:
+            metrics = HyperoptLossMetrics(results, min_date, max_date)
 
-        # create the index within the min_date and end max_date
-        t_index = date_range(start=min_date, end=max_date, freq=resample_freq, normalize=True)
+        # sum of profit ratios (after slippage per trade) for every day within min_date and max_date
+        sum_daily = metrics.daily_profit_ratio(slippage_per_trade_ratio)
 
-        sum_daily = (
-            results.resample(resample_freq, on="close_date")
-            .agg({"profit_ratio_after_slippage": "sum"})
-            .reindex(t_index)
-            .fillna(0)
-        )
-
-        total_profit = sum_daily["profit_ratio_after_slippage"] - risk_free_rate
+        total_profit = sum_daily - risk_free_rate
         expected_returns_mean = total_profit.mean()
-        up_stdev = total_profit.std()
+        up_stdev = total_profit.std(ddof=1) if len(total_profit) > 1 else np.nan
 
         if up_stdev != 0:
-            sharp_ratio = expected_returns_mean / up_stdev * math.sqrt(days_in_year)
+            sharp_ratio = expected_returns_mean / up_stdev * np.sqrt(days_in_year)
         else:
             # Define high (negative) sharpe ratio to be clear that this is NOT optimal.
             sharp_ratio = -20.0
@@ -9,8 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sortino
-from freqtrade.optimize.hyperopt import IHyperOptLoss
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics, IHyperOptLoss
 
 
 class SortinoHyperOptLoss(IHyperOptLoss):
@@ -26,6 +25,7 @@ class SortinoHyperOptLoss(IHyperOptLoss):
         min_date: datetime,
         max_date: datetime,
         starting_balance: float,
+        metrics: HyperoptLossMetrics | None = None,
         *args,
         **kwargs,
     ) -> float:
@@ -34,6 +34,8 @@ class SortinoHyperOptLoss(IHyperOptLoss):
 
         Uses Sortino Ratio calculation.
         """
-        sortino_ratio = calculate_sortino(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = HyperoptLossMetrics(results, min_date, max_date, starting_balance)
+        sortino_ratio = metrics.sortino
         # print(expected_returns_mean, down_stdev, sortino_ratio)
         return -sortino_ratio
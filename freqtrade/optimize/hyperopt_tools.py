@@ -234,6 +234,20 @@ class HyperoptTools:
             HyperoptTools._params_pretty_print(
                 params, "max_open_trades", "Max Open Trades:", non_optimized
             )
+            HyperoptTools._resource_usage_pretty_print(results.get("resource_usage"))
+
+    @staticmethod
+    def _resource_usage_pretty_print(resource_usage: dict | None) -> None:
+        if not resource_usage:
+            return
+        print(
+            "\n# Resource usage:\n"
+            f"    wall_time = {resource_usage['wall_time']:.2f}s, "
+            f"cpu_time = {resource_usage['cpu_time']:.2f}s, "
+            f"rss = {resource_usage['rss'] / 1024 / 1024:.0f} MB "
+            f"(peak {resource_usage['peak_rss_delta'] / 1024 / 1024:+.1f} MB), "
+            f"trades = {resource_usage['trade_count']}"
+        )
 
     @staticmethod
     def _params_update_for_json(result_dict, params, non_optimized, space: str) -> None:
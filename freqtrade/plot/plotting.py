@@ -65,6 +65,7 @@ def init_plotscript(config, markets: list, startup_candles: int = 0):
         startup_candles=startup_candles,
         data_format=config["dataformat_ohlcv"],
         candle_type=config.get("candle_type_def", CandleType.SPOT),
+        workers=config.get("dataload_workers"),
     )
 
     if startup_candles and data:
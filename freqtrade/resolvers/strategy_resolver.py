@@ -65,6 +65,8 @@ class StrategyResolver(IResolver):
             ("trailing_only_offset_is_reached", None),
             ("use_custom_stoploss", None),
             ("process_only_new_candles", None),
+            ("incremental_lookback", 0),
+            ("incremental_validation_interval", 0),
             ("order_types", None),
             ("order_time_in_force", None),
             ("stake_currency", None),
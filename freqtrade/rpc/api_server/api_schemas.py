@@ -652,6 +652,20 @@ class Health(BaseModel):
     bot_startup_ts: int | None = None
 
 
+class LatencyStats(BaseModel):
+    count: int
+    sum: float
+    avg: float
+    max: float
+    last: float
+    buckets: dict[str, int]
+
+
+class LatencyMetricsResponse(BaseModel):
+    process: dict[str, LatencyStats]
+    exchange: dict[str, LatencyStats]
+
+
 class CustomDataEntry(BaseModel):
     key: str
     type: str
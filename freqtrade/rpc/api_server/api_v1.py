@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import PlainTextResponse
 
 from freqtrade import __version__
 from freqtrade.data.history import get_datahandler
@@ -29,6 +30,7 @@ from freqtrade.rpc.api_server.api_schemas import (
     FreqAIModelListResponse,
     Health,
     HyperoptLossListResponse,
+    LatencyMetricsResponse,
     ListCustomData,
     Locks,
     LocksPayload,
@@ -91,7 +93,8 @@ logger = logging.getLogger(__name__)
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
 # 2.43: Add /profit_all endpoint
-API_VERSION = 2.43
+# 2.44: Add /metrics endpoints
+API_VERSION = 2.44
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -573,3 +576,15 @@ def sysinfo():
 @router.get("/health", response_model=Health, tags=["info"])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc.health()
+
+
+@router.get("/metrics", response_model=LatencyMetricsResponse, tags=["info"])
+def metrics():
+    return RPC._rpc_latency_metrics()
+
+
+@router.get("/metrics/prometheus", response_class=PlainTextResponse, tags=["info"])
+def metrics_prometheus():
+    return PlainTextResponse(
+        RPC._rpc_latency_metrics_prometheus(), media_type="text/plain; version=0.0.4"
+    )
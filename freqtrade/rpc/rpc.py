@@ -47,6 +47,7 @@ from freqtrade.util import (
     dt_ts,
     dt_ts_def,
     format_date,
+    latency_registry,
     shorten_date,
 )
 from freqtrade.wallets import PositionWallet, Wallet
@@ -1378,6 +1379,18 @@ class RPC:
         }
         return res
 
+    @staticmethod
+    def _rpc_latency_metrics() -> dict[str, Any]:
+        """
+        Latency histograms of the bot loop phases and of the exchange requests
+        """
+        return {"process": {}, "exchange": {}} | latency_registry.snapshot()
+
+    @staticmethod
+    def _rpc_latency_metrics_prometheus() -> str:
+        """Latency histograms in the Prometheus text format"""
+        return latency_registry.to_prometheus()
+
     @staticmethod
     def _rpc_get_logs(limit: int | None) -> dict[str, Any]:
         """Returns the last X logs"""
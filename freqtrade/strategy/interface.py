@@ -5,10 +5,13 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 from pydantic import ValidationError
 
 from freqtrade.configuration import TimeRange
@@ -48,6 +51,26 @@ from freqtrade.wallets import Wallets
 logger = logging.getLogger(__name__)
 
 
+def _mismatched_columns(df: DataFrame, other: DataFrame) -> list[str]:
+    """
+    Columns of df which differ from other (missing in other, or with different values).
+    Numeric values are compared with a relative tolerance.
+    """
+    mismatch = []
+    for col in df.columns:
+        if col not in other.columns:
+            mismatch.append(str(col))
+            continue
+        left, right = df[col].to_numpy(), other[col].to_numpy()
+        if left.dtype.kind in "fiu" and right.dtype.kind in "fiu":
+            equal = np.isclose(left, right, equal_nan=True).all()
+        else:
+            equal = df[col].reset_index(drop=True).equals(other[col].reset_index(drop=True))
+        if not equal:
+            mismatch.append(str(col))
+    return mismatch
+
+
 class IStrategy(ABC, HyperStrategyMixin):
     """
     Interface for freqtrade strategies
@@ -108,6 +131,11 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # Number of candles indicators look back - enables incremental analysis of new candles
+    incremental_lookback: int = 0
+    # Compare every nth incremental analysis with a full analysis (0 to disable)
+    incremental_validation_interval: int = 0
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -153,6 +181,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self.__last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Incremental analyses per pair since the last full analysis
+        self.__incremental_runs_per_pair: dict[str, int] = {}
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -1198,13 +1228,73 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
-    def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame | None:
+        """
+        Analyze only the candles added since the last analysis - plus `incremental_lookback`
+        candles before them - and append them to the previously analyzed dataframe.
+        The last previously analyzed candle is analyzed again, as it may have changed.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe, or None if a full analysis is required.
+        """
+        if self.dp.runmode not in (RunMode.DRY_RUN, RunMode.LIVE):
+            return None
+        pair = str(metadata.get("pair"))
+        analyzed, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if analyzed.empty or "date" not in analyzed.columns:
+            return None
+        # Position of the last analyzed candle in dataframe
+        start = int(dataframe["date"].searchsorted(analyzed["date"].iloc[-1]))
+        kept = len(analyzed) - 1 - start
+        if (
+            start == 0
+            or start >= len(dataframe)
+            or kept < 0
+            or dataframe["date"].iloc[start] != analyzed["date"].iloc[-1]
+            or dataframe["date"].iloc[0] != analyzed["date"].iloc[kept]
+        ):
+            # Candles don't line up with the previous analysis
+            return None
+
+        window = dataframe.iloc[max(start - self.incremental_lookback, 0) :]
+        new_rows = self.analyze_ticker(window.reset_index(drop=True), metadata)
+        if len(new_rows) != len(window) or set(new_rows.columns) != set(analyzed.columns):
+            return None
+        new_rows = new_rows.iloc[start - len(dataframe) :]
+        result = concat(
+            [analyzed.iloc[kept : len(analyzed) - 1], new_rows[analyzed.columns]],
+            axis=0,
+            ignore_index=True,
+        )
+
+        runs = self.__incremental_runs_per_pair.get(pair, 0) + 1
+        self.__incremental_runs_per_pair[pair] = runs
+        if self.incremental_validation_interval > 0 and (
+            runs % self.incremental_validation_interval == 0
+        ):
+            full = self.analyze_ticker(dataframe, metadata)
+            mismatch = _mismatched_columns(result.iloc[start:], full.iloc[start:])
+            if mismatch:
+                logger.warning(
+                    f"Incremental analysis of {pair} differs from the full analysis in columns "
+                    f"{', '.join(mismatch)}. Consider increasing `incremental_lookback`."
+                )
+                return full
+        return result
+
+    def _analyze_ticker_internal(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        deferred_updates: list[Callable[[], None]] | None = None,
+    ) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
         add several TA indicators and buy signal to it
         WARNING: Used internally only, may skip analysis if `process_only_new_candles` is set.
         :param dataframe: Dataframe containing data from exchange
         :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :param deferred_updates: Collects DataProvider updates instead of applying them
         :return: DataFrame of candle (OHLCV) data with indicator data and signals added
         """
         pair = str(metadata.get("pair"))
@@ -1214,13 +1304,18 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = None
+            if self.process_only_new_candles and self.incremental_lookback > 0:
+                analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            if analyzed is None:
+                dataframe = self.analyze_ticker(dataframe, metadata)
+                self.__incremental_runs_per_pair.pop(pair, None)
+            else:
+                dataframe = analyzed
 
             self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._store_analyzed_df(pair, dataframe, new_candle, deferred_updates)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1230,12 +1325,16 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
-    def analyze_pair(self, pair: str) -> None:
+    def analyze_pair(
+        self, pair: str, deferred_updates: list[Callable[[], None]] | None = None
+    ) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
         Stores the dataframe into the dataprovider.
         The analyzed dataframe is then accessible via `dp.get_analyzed_dataframe()`.
         :param pair: Pair to analyze.
+        :param deferred_updates: Collects DataProvider updates instead of applying them
+            (used while pairs are analyzed in worker threads, see analyze()).
         """
         dataframe = self.dp.ohlcv(
             pair, self.timeframe, candle_type=self.config.get("candle_type_def", CandleType.SPOT)
@@ -1250,7 +1349,7 @@ class IStrategy(ABC, HyperStrategyMixin):
             )
 
             dataframe = strategy_safe_wrapper(self._analyze_ticker_internal, message="")(
-                dataframe, {"pair": pair}
+                dataframe, {"pair": pair}, deferred_updates
             )
 
             validator.assert_df(dataframe)
@@ -1262,13 +1361,60 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _store_analyzed_df(
+        self,
+        pair: str,
+        dataframe: DataFrame,
+        new_candle: bool,
+        deferred_updates: list[Callable[[], None]] | None = None,
+    ) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider, and emit it to consumers.
+        Appended to deferred_updates instead, if given.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+
+        def store() -> None:
+            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+        if deferred_updates is not None:
+            deferred_updates.append(store)
+        else:
+            store()
+
+    def _analyze_pair_deferred(self, pair: str) -> list[Callable[[], None]]:
+        """
+        Analyze a pair (in a worker thread).
+        :return: DataProvider updates of the analysis - to be applied by the caller.
+        """
+        updates: list[Callable[[], None]] = []
+        self.analyze_pair(pair, updates)
+        return updates
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `internals.analysis_workers` > 1, pairs are analyzed concurrently in a thread pool -
+        unless FreqAI is enabled, which trains and predicts using state shared between pairs.
+        Analyzed dataframes are stored in the dataprovider from the calling thread, in the order
+        of pairs - as soon as a pair and all pairs before it are analyzed.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        workers = self.config.get("internals", {}).get("analysis_workers", 1)
+        if self.config.get("freqai", {}).get("enabled", False):
+            workers = 1
+        if workers <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(pairs)), thread_name_prefix="ft-analyze"
+        ) as executor:
+            for updates in executor.map(self._analyze_pair_deferred, pairs):
+                for update in updates:
+                    update()
 
     def get_latest_candle(
         self,
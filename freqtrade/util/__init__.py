@@ -21,6 +21,7 @@ from freqtrade.util.formatters import (
     round_value,
 )
 from freqtrade.util.ft_precise import FtPrecise
+from freqtrade.util.latency_metrics import latency_registry
 from freqtrade.util.measure_time import MeasureTime
 from freqtrade.util.periodic_cache import PeriodicCache
 from freqtrade.util.progress_tracker import (  # noqa F401
@@ -54,6 +55,7 @@ __all__ = [
     "fmt_coin",
     "fmt_coin2",
     "MeasureTime",
+    "latency_registry",
     "print_rich_table",
     "print_df_rich_table",
     "CustomProgress",
@@ -0,0 +1,139 @@
+"""
+Latency histograms for the bot loop and exchange requests.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+# Upper bounds (in seconds) of the histogram buckets - an implicit +Inf bucket is added.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Histogram of observed durations (in seconds), using LATENCY_BUCKETS.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def observe(self, duration: float) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        self.max = max(self.max, duration)
+        self.last = duration
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """
+        :return: list of (upper bound, cumulative count) - ending with the +Inf bucket
+        """
+        result = []
+        total = 0
+        for bound, count in zip((*LATENCY_BUCKETS, math.inf), self.buckets, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "last": round(self.last, 6),
+            "buckets": {
+                "+Inf" if math.isinf(bound) else str(bound): count
+                for bound, count in self.cumulative_buckets()
+            },
+        }
+
+
+class LatencyMetrics:
+    """
+    Thread-safe registry of latency histograms, grouped by metric group
+    (e.g. "process" for the phases of the bot loop, "exchange" for exchange requests).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[str, LatencyHistogram]] = {}
+
+    def observe(self, group: str, name: str, duration: float) -> None:
+        with self._lock:
+            histogram = self._histograms.setdefault(group, {}).get(name)
+            if histogram is None:
+                histogram = self._histograms[group][name] = LatencyHistogram()
+            histogram.observe(duration)
+
+    @contextmanager
+    def measure(self, group: str, name: str) -> Iterator[None]:
+        """
+        Measure the duration of a block of code - also if the block raises an exception.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(group, name, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        :return: dict of group -> name -> histogram stats
+        """
+        with self._lock:
+            return {
+                group: {name: hist.to_dict() for name, hist in sorted(histograms.items())}
+                for group, histograms in sorted(self._histograms.items())
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render all histograms in the Prometheus text exposition format.
+        Each group becomes one metric (freqtrade_<group>_latency_seconds), labeled by name.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for group, histograms in sorted(self._histograms.items()):
+                metric = f"freqtrade_{group}_latency_seconds"
+                lines.append(f"# HELP {metric} Duration of {group} operations in seconds.")
+                lines.append(f"# TYPE {metric} histogram")
+                for name, hist in sorted(histograms.items()):
+                    label = name.replace("\\", "\\\\").replace('"', '\\"')
+                    for bound, count in hist.cumulative_buckets():
+                        le = "+Inf" if math.isinf(bound) else str(bound)
+                        lines.append(f'{metric}_bucket{{name="{label}",le="{le}"}} {count}')
+                    lines.append(f'{metric}_sum{{name="{label}"}} {hist.sum}')
+                    lines.append(f'{metric}_count{{name="{label}"}} {hist.count}')
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+latency_registry = LatencyMetrics()
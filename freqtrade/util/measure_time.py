@@ -33,10 +33,15 @@ class MeasureTime:
         self._start = time.time()
 
     def __exit__(self, *args):
-        end = time.time()
+        self.check(time.time() - self._start)
+
+    def check(self, duration: float) -> None:
+        """
+        Call the callback if duration exceeds the time limit.
+        Allows checking durations measured elsewhere - e.g. the sum of multiple blocks.
+        """
         if self.__cache.get("value"):
             return
-        duration = end - self._start
 
         if duration < self._time_limit:
             return
@@ -57,6 +57,7 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._candle_close_wakeup = internals_config.get("candle_close_wakeup", False)
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -165,6 +166,7 @@ class Worker:
         result = func(*args, **kwargs)
         time_passed = time.time() - last_throttle_start_time
         sleep_duration = throttle_secs - time_passed
+        next_tf = None
         if timeframe:
             next_tf = timeframe_to_next_date(timeframe)
             # Maximum throttling should be until new candle arrives
@@ -183,9 +185,36 @@ class Worker:
             f"last iteration took {time_passed:.2f} s."
             #  f"next: {next_iter}"
         )
-        self._sleep(sleep_duration)
+        if (
+            self._candle_close_wakeup
+            and timeframe
+            and next_tf
+            and time.time() < next_tf.timestamp() < time.time() + sleep_duration
+        ):
+            # Sleeping until the new candle - wake up as soon as it arrived
+            self._sleep_until_candle(timeframe, next_tf.timestamp(), sleep_duration)
+        else:
+            self._sleep(sleep_duration)
         return result
 
+    def _sleep_until_candle(
+        self, timeframe: str, candle_start: float, sleep_duration: float
+    ) -> None:
+        """
+        Sleep until the new candle starts - and continue as soon as the new candle
+        arrived via websocket for all pairs, instead of sleeping for the full duration.
+        :param candle_start: Open time of the new candle (timestamp in seconds)
+        :param sleep_duration: Maximum time to sleep in seconds
+        """
+        end = time.time() + sleep_duration
+        self._sleep(max(candle_start - time.time(), 0.0))
+        if self.freqtrade.exchange.wait_for_ws_candles(
+            timeframe, int(candle_start * 1000), timeout=end - time.time()
+        ):
+            logger.debug(f"New candle received after {time.time() - candle_start:.2f} s.")
+        else:
+            self._sleep(max(end - time.time(), 0.0))
+
     @staticmethod
     def _sleep(sleep_duration: float) -> None:
         """Local sleep method - to improve testability"""
@@ -510,3 +510,10 @@ class FtRestClient:
         :return: json object
         """
         return self._get("health")
+
+    def metrics(self):
+        """Latency histograms of the bot loop phases and of the exchange requests.
+
+        :return: json object
+        """
+        return self._get("metrics")
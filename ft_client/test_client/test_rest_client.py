@@ -134,6 +134,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("trades", [5, 5], {"order_by_id": True}),
         ("sysinfo", [], {}),
         ("health", [], {}),
+        ("metrics", [], {}),
     ],
 )
 def test_FtRestClient_call_explicit_methods(method, args, kwargs):
@@ -16,6 +16,8 @@ from xdist.scheduler.loadscope import LoadScopeScheduling
 from freqtrade import constants
 from freqtrade.commands import Arguments
 from freqtrade.data.converter import ohlcv_to_dataframe, trades_list_to_df
+from freqtrade.data.history.datahandlers import IDataHandler
+from freqtrade.data.history.history_cache import pair_history_cache
 from freqtrade.enums import CandleType, MarginMode, SignalDirection, TradingMode
 from freqtrade.exchange import Exchange, timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.freqtradebot import FreqtradeBot
@@ -535,6 +537,41 @@ def user_dir(mocker, tmp_path) -> Path:
     return user_dir
 
 
+@pytest.fixture(autouse=True)
+def testdata_metadata_dir(mocker, tmp_path) -> None:
+    """
+    Redirect datahandler metadata and resampled data of the testdata directory to tmp_path,
+    to keep the testdata directory clean.
+    """
+    testdata = (Path(__file__).parent / "testdata").resolve()
+    metadata_filename = IDataHandler._metadata_filename
+    resample_cache_dir = IDataHandler._resample_cache_dir
+
+    def _redirect(path: Path) -> Path:
+        path = path.resolve()
+        if path.is_relative_to(testdata):
+            return tmp_path / "testdata" / path.relative_to(testdata)
+        return path
+
+    def _metadata_filename(self, filename: Path) -> Path:
+        return _redirect(metadata_filename(self, filename))
+
+    def _resample_cache_dir(self) -> Path:
+        return _redirect(resample_cache_dir(self))
+
+    mocker.patch.object(IDataHandler, "_metadata_filename", _metadata_filename)
+    mocker.patch.object(IDataHandler, "_resample_cache_dir", _resample_cache_dir)
+
+
+@pytest.fixture(autouse=True)
+def reset_pair_history_cache():
+    """
+    Commands enable the process-wide pair history cache - don't leak it between tests.
+    """
+    yield
+    pair_history_cache.set_size(0)
+
+
 @pytest.fixture()
 def keep_log_config_loggers(mocker):
     # Mock the _handle_existing_loggers function to prevent it from disabling all loggers.
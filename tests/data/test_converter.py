@@ -13,12 +13,16 @@ from freqtrade.data.converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
     ohlcv_fill_up_missing_data,
+    ohlcv_resample,
     ohlcv_to_dataframe,
     order_book_to_dataframe,
     reduce_dataframe_footprint,
+    trades_df_merge,
+    trades_df_new_trades,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
+    trades_to_ohlcv_chunked,
     trim_dataframe,
 )
 from freqtrade.data.history import (
@@ -27,8 +31,8 @@ from freqtrade.data.history import (
     load_pair_history,
     validate_backtest_data,
 )
-from freqtrade.data.history.datahandlers import IDataHandler
-from freqtrade.enums import CandleType
+from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -110,6 +114,29 @@ def test_trades_to_ohlcv_multi(timeframe, rows, days, candles, start, end, weekd
         assert df.iloc[-1, :]["date"].day_name() == weekday
 
 
+@pytest.mark.parametrize("chunks", [1, 7, 60])
+def test_trades_to_ohlcv_chunked(chunks):
+    timeframes = ["1m", "5m", "1h", "1d"]
+    trades = generate_trades_history(n_rows=20_000, days=5)
+    trade_chunks = [
+        trades.iloc[i : i + len(trades) // chunks + 1]
+        for i in range(0, len(trades), len(trades) // chunks + 1)
+    ]
+
+    res = trades_to_ohlcv_chunked(iter(trade_chunks), timeframes)
+    assert list(res.keys()) == timeframes
+    for timeframe in timeframes:
+        expected = trades_to_ohlcv(trades, timeframe).reset_index(drop=True)
+        assert_frame_equal(res[timeframe], expected, check_freq=False)
+
+    # Chunks out of order
+    res = trades_to_ohlcv_chunked(reversed(trade_chunks), ["5m"])
+    assert_frame_equal(res["5m"], trades_to_ohlcv(trades, "5m").reset_index(drop=True))
+
+    assert trades_to_ohlcv_chunked([], timeframes) == {}
+    assert trades_to_ohlcv_chunked([trades.iloc[:0]], timeframes) == {}
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(
         datadir=testdatadir, timeframe="1m", pair="UNITTEST/BTC", fill_up_missing=False
@@ -131,6 +158,42 @@ def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     assert not validate_backtest_data(data2, "UNITTEST/BTC", min_date, max_date, 1)
 
 
+@pytest.mark.parametrize(
+    "base_timeframe,timeframe,size,expected",
+    [
+        # Last hour is incomplete
+        ("1m", "1h", 24 * 60 + 30, 24),
+        ("5m", "4h", 2 * 288, 12),
+        # 2020-07-05 is a sunday - the first and last weeks are incomplete
+        ("1d", "1w", 21, 2),
+        ("1h", "1M", 24 * 100, 2),
+    ],
+)
+def test_ohlcv_resample(base_timeframe, timeframe, size, expected):
+    data = generate_test_data(base_timeframe, size, start="2020-07-05")
+    res = ohlcv_resample(data, base_timeframe, timeframe)
+    assert len(res) == expected
+    assert res.columns.tolist() == ["date", "open", "high", "low", "close", "volume"]
+    # Every candle aggregates the base candles within its period
+    candle = res.iloc[0]
+    end = res.iloc[1]["date"]
+    base = data.loc[(data["date"] >= candle["date"]) & (data["date"] < end)]
+    assert candle["open"] == base["open"].iloc[0]
+    assert candle["high"] == base["high"].max()
+    assert candle["low"] == base["low"].min()
+    assert candle["close"] == base["close"].iloc[-1]
+    assert candle["volume"] == pytest.approx(base["volume"].sum())
+    if timeframe == "1w":
+        assert res.iloc[0]["date"] == pd.Timestamp("2020-07-06", tz="UTC")
+    if timeframe == "1M":
+        assert res.iloc[0]["date"] == pd.Timestamp("2020-08-01", tz="UTC")
+
+    # Gaps in the data don't produce candles
+    gapped = data.drop(data.index[size // 3 : size // 2])
+    assert len(ohlcv_resample(gapped, base_timeframe, timeframe)) <= expected
+    assert ohlcv_resample(data.iloc[:0], base_timeframe, timeframe).empty
+
+
 def test_ohlcv_fill_up_missing_data2(caplog):
     timeframe = "5m"
     ticks = [
@@ -408,6 +471,42 @@ def test_trades_df_remove_duplicates(trades_history_df):
     assert res.equals(trades_history_df)
 
 
+def test_trades_df_remove_duplicates_sorted(trades_history_df):
+    # Sorted trades with duplicates sharing their timestamp
+    trades = pd.concat([trades_history_df, trades_history_df.iloc[[1, 3, 4, 4]]])
+    trades = trades.sort_values("timestamp", kind="stable")
+    assert trades["timestamp"].is_monotonic_increasing
+    res = trades_df_remove_duplicates(trades)
+    assert_frame_equal(res, trades.drop_duplicates(subset=["timestamp", "id"]))
+    assert res["id"].tolist() == trades_history_df["id"].tolist()
+
+    assert len(trades_df_remove_duplicates(trades_history_df.iloc[:1])) == 1
+
+
+def test_trades_df_merge(trades_history_df):
+    trades = trades_history_df
+    # Overlapping trades, including a duplicate in the new trades
+    new_trades = pd.concat([trades.iloc[2:], trades.iloc[[5]]])
+    assert trades_df_new_trades(trades.iloc[:4], new_trades)["id"].tolist() == [
+        trades.iloc[4]["id"],
+        trades.iloc[5]["id"],
+    ]
+    assert trades_df_new_trades(trades.iloc[:0], new_trades)["id"].tolist() == (
+        trades.iloc[2:]["id"].tolist()
+    )
+    assert trades_df_new_trades(trades, new_trades).empty
+
+    res = trades_df_merge(trades.iloc[:4], new_trades)
+    assert_frame_equal(res, trades)
+
+    # New trades between stored trades are sorted into the seam
+    res = trades_df_merge(trades.iloc[[0, 1, 3, 5]], trades.iloc[[2, 4]])
+    assert_frame_equal(res, trades)
+
+    assert trades_df_merge(trades, trades.iloc[:2]) is trades
+    assert_frame_equal(trades_df_merge(trades.iloc[:0], trades), trades)
+
+
 def test_trades_dict_to_list(fetch_trades_result):
     res = trades_dict_to_list(fetch_trades_result)
     assert isinstance(res, list)
@@ -512,6 +611,36 @@ def test_convert_ohlcv_format(default_conf, testdatadir, tmp_path, file_base, ca
         assert not file.exists()
 
 
+def test_convert_ohlcv_format_partitioned(default_conf, testdatadir, tmp_path):
+    file_temp = tmp_path / "futures" / "XRP_USDT_USDT-1h-mark.feather"
+    IDataHandler.create_dir_if_needed(file_temp)
+    copyfile(testdatadir / "futures" / "XRP_USDT_USDT-1h-mark.feather", file_temp)
+    default_conf["datadir"] = tmp_path
+    default_conf["candle_types"] = [CandleType.MARK]
+    default_conf["pairs"] = ["XRP/USDT:USDT"]
+    default_conf["timeframes"] = ["1h"]
+    original = get_datahandler(tmp_path, "feather").ohlcv_load(
+        "XRP/USDT:USDT", "1h", CandleType.MARK
+    )
+
+    convert_ohlcv_format(
+        default_conf, convert_from="feather", convert_to="parquet_partitioned", erase=True
+    )
+    assert not file_temp.exists()
+    dh = get_datahandler(tmp_path, "parquet_partitioned")
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES) == [
+        ("XRP/USDT:USDT", "1h", CandleType.MARK)
+    ]
+    assert_frame_equal(dh.ohlcv_load("XRP/USDT:USDT", "1h", CandleType.MARK), original)
+
+    # Migrate back out of the partitioned layout
+    convert_ohlcv_format(
+        default_conf, convert_from="parquet_partitioned", convert_to="feather", erase=True
+    )
+    assert file_temp.exists()
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES) == []
+
+
 def test_reduce_dataframe_footprint():
     data = generate_test_data("15m", 40)
 
@@ -542,7 +671,7 @@ def test_reduce_dataframe_footprint():
     assert df2["close_copy"].dtype == np.float32
 
 
-def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
+def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog, mocker):
     pair = "XRP/ETH"
     file1 = tmp_path / "XRP_ETH-1m.feather"
     file5 = tmp_path / "XRP_ETH-5m.feather"
@@ -590,6 +719,32 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
     )
     assert log_has(msg, caplog)
 
+    # Reading trades fails partway through - existing candles are kept
+    trades = get_datahandler(tmp_path, "jsongz").trades_load(pair, TradingMode.SPOT)
+
+    def failing_chunks(*args, **kwargs):
+        yield trades.iloc[:100]
+        raise OSError("Corrupt file")
+
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.idatahandler.IDataHandler._trades_load_chunks",
+        side_effect=failing_chunks,
+    )
+    convert_trades_to_ohlcv(
+        [pair],
+        timeframes=["1m", "5m"],
+        data_format_trades="jsongz",
+        datadir=tmp_path,
+        timerange=tr,
+        erase=True,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+    )
+    assert log_has("Error loading trades for XRP/ETH, skipping conversion.", caplog)
+    assert_frame_equal(
+        load_pair_history(datadir=tmp_path, timeframe="1m", pair=pair), dfbak_1m, check_exact=True
+    )
+
 
 def test_order_book_to_dataframe():
     bids = [
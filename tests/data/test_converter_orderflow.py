@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -7,6 +8,7 @@ from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -568,6 +570,77 @@ def test_analyze_with_orderflow(
     assert isinstance(lastval_of2, dict)
 
 
+def test_populate_dataframe_with_trades_matches_per_candle():
+    rng = np.random.default_rng(42)
+    dates = pd.date_range("2024-01-01", periods=30, freq="5min", tz="UTC")
+    dataframe = pd.DataFrame({"date": dates, "close": 100.0})
+    timestamps = np.sort(
+        rng.integers(dates[0].value // 10**6 - 600_000, dates[-1].value // 10**6 + 300_000, 3000)
+    )
+    trades = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "id": [str(i) for i in range(len(timestamps))],
+            "type": "limit",
+            "side": rng.choice(["buy", "sell"], len(timestamps)),
+            "price": 100 + np.round(rng.normal(0, 0.3, len(timestamps)), 3),
+            "amount": rng.exponential(1.0, len(timestamps)),
+        }
+    )
+    trades["cost"] = trades["price"] * trades["amount"]
+    trades["date"] = pd.to_datetime(trades["timestamp"], unit="ms", utc=True)
+    config = {
+        "timeframe": "5m",
+        "orderflow": {
+            "cache_size": 10,
+            "max_candles": 25,
+            "scale": 0.1,
+            "imbalance_volume": 1,
+            "imbalance_ratio": 1.5,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    df, cached = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+
+    # Candles before max_candles are not populated
+    assert df["trades"].iloc[:5].isna().all()
+    assert len(cached) == 10
+    stacked_count = 0
+    for idx in range(5, len(df)):
+        candle_trades = trades.loc[
+            (trades["date"] >= dates[idx]) & (trades["date"] < dates[idx] + pd.Timedelta("5min"))
+        ]
+        assert df.at[idx, "trades"] == candle_trades.to_dict(orient="records")
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.1)
+        assert df.at[idx, "orderflow"] == orderflow.to_dict(orient="index")
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=1.5, imbalance_volume=1
+        )
+        assert df.at[idx, "imbalances"] == imbalances.to_dict(orient="index")
+        for label in ("bid", "ask"):
+            expected = stacked_imbalance(imbalances, label, stacked_imbalance_range=2)
+            assert df.at[idx, f"stacked_imbalances_{label}"] == expected
+            stacked_count += len(expected)
+
+        bid = candle_trades.loc[candle_trades["side"] == "sell", "amount"].to_numpy()
+        ask = candle_trades.loc[candle_trades["side"] == "buy", "amount"].to_numpy()
+        deltas = np.where(candle_trades["side"] == "buy", 1, -1) * candle_trades["amount"]
+        assert df.at[idx, "bid"] == pytest.approx(bid.sum())
+        assert df.at[idx, "ask"] == pytest.approx(ask.sum())
+        assert df.at[idx, "delta"] == pytest.approx(ask.sum() - bid.sum())
+        assert df.at[idx, "max_delta"] == pytest.approx(deltas.cumsum().max())
+        assert df.at[idx, "min_delta"] == pytest.approx(deltas.cumsum().min())
+        assert df.at[idx, "total_trades"] == len(candle_trades)
+    assert stacked_count > 0
+
+    # Cached candles are reused - even if trades changed
+    trades["amount"] = 1000.0
+    df2, _ = populate_dataframe_with_trades(cached, config, dataframe.copy(), trades.copy())
+    for col in ORDERFLOW_ADDED_COLUMNS:
+        assert df2.loc[20:, col].tolist() == df.loc[20:, col].tolist()
+    assert df2.at[19, "bid"] != df.at[19, "bid"]
+
+
 def test_stacked_imbalances_multiple_prices():
     """Test that stacked imbalances correctly returns multiple price levels when present"""
     # Test with empty result
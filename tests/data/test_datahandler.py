@@ -1,16 +1,20 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import math
 import re
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.data.converter import ohlcv_resample
+from freqtrade.data.history.datahandlers.arrowdatahandler import ArrowDataHandler
+from freqtrade.data.history.datahandlers.arrowfilters import load_ohlcv_filtered
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -19,9 +23,12 @@ from freqtrade.data.history.datahandlers.idatahandler import (
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.datahandlers.parquetpartitioneddatahandler import (
+    ParquetPartitionedDataHandler,
+)
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -290,8 +297,8 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
-def test_datahandler_ohlcv_append(
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
+def test_datahandler_ohlcv_append_not_supported(
     datahandler,
     testdatadir,
 ):
@@ -302,11 +309,101 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
-def test_datahandler_trades_append(datahandler, testdatadir):
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
+def test_datahandler_trades_append_not_supported(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
-        dh.trades_append("UNITTEST/ETH", DataFrame())
+        dh.trades_append("UNITTEST/ETH", DataFrame(), TradingMode.SPOT)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "arrow", "parquet"])
+@pytest.mark.parametrize("candle_type", [CandleType.SPOT, CandleType.MARK])
+def test_datahandler_ohlcv_append(datahandler, testdatadir, tmp_path, candle_type):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", candle_type)
+    # Appending without existing data creates the file
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[:1000], candle_type)
+    assert filename.is_file()
+    assert dh._fragment_files(filename) == []
+
+    # Overlapping candles are replaced by the appended candles
+    updated = ohlcv.iloc[999:2000].copy()
+    updated.loc[updated.index[0], "volume"] = 12345.0
+    dh.ohlcv_append("UNITTEST/NEW", "5m", updated, candle_type)
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[2000:], candle_type)
+    assert len(dh._fragment_files(filename)) == 2
+
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type)
+    assert len(loaded) == len(ohlcv)
+    assert loaded.iloc[999]["volume"] == 12345.0
+    assert loaded["date"].is_monotonic_increasing
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", candle_type)[2] == len(ohlcv)
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    assert_frame_equal(
+        dh.ohlcv_load("UNITTEST/NEW", "5m", candle_type, timerange=timerange),
+        get_datahandler(testdatadir, "feather").ohlcv_load(
+            "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange
+        ),
+    )
+
+    dh.ohlcv_compact("UNITTEST/NEW", "5m", candle_type)
+    assert dh._fragment_files(filename) == []
+    assert not dh._fragment_dir(filename).exists()
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type), loaded)
+
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-10:], candle_type)
+    assert dh.ohlcv_purge("UNITTEST/NEW", "5m", candle_type)
+    assert not filename.exists()
+    assert not dh._fragment_dir(filename).exists()
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "arrow", "parquet"])
+def test_datahandler_ohlcv_append_compaction(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    mocker.patch.object(dh, "_append_compaction_threshold", 3)
+    compact_mock = mocker.spy(dh, "ohlcv_compact")
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", CandleType.SPOT)
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv.iloc[:100], CandleType.SPOT)
+    for start in range(100, 400, 100):
+        dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[start : start + 100], CandleType.SPOT)
+    assert compact_mock.call_count == 1
+    assert dh._fragment_files(filename) == []
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "5m", None, CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv.iloc[:400].reset_index(drop=True))
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "arrow", "parquet"])
+def test_datahandler_trades_append(datahandler, testdatadir, tmp_path):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = dh._pair_trades_filename(tmp_path, "XRP/ETH", TradingMode.SPOT)
+    dh.trades_append("XRP/ETH", trades.iloc[:5000], TradingMode.SPOT)
+    assert filename.is_file()
+    dh.trades_append("XRP/ETH", trades.iloc[5000:], TradingMode.SPOT)
+    assert len(dh._fragment_files(filename)) == 1
+
+    loaded = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    assert_frame_equal(loaded, trades.reset_index(drop=True))
+    mid = int(trades.iloc[6000]["timestamp"])
+    tr = TimeRange("date", "date", startts=mid, stopts=int(trades.iloc[-1]["timestamp"]))
+    assert len(dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=tr)) == len(
+        trades[trades["timestamp"] >= mid]
+    )
+
+    dh.trades_compact("XRP/ETH", TradingMode.SPOT)
+    assert dh._fragment_files(filename) == []
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), loaded)
+
+    dh.trades_append("XRP/ETH", trades.iloc[-10:], TradingMode.SPOT)
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert not dh._fragment_dir(filename).exists()
 
 
 @pytest.mark.parametrize(
@@ -323,6 +420,177 @@ def test_datahandler_trades_get_pairs(testdatadir, datahandler, expected):
     assert set(pairs) == expected
 
 
+@pytest.mark.parametrize("candle_type", [CandleType.SPOT, CandleType.MARK])
+def test_parquetpartitioned_ohlcv_store_load(testdatadir, tmp_path, candle_type):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, "parquet_partitioned")
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv, candle_type)
+
+    root = dh._pair_data_filename(tmp_path, "UNITTEST/NEW", "5m", candle_type)
+    prefix = tmp_path if candle_type == CandleType.SPOT else tmp_path / "futures"
+    assert root == prefix.joinpath(
+        "ohlcv", "pair=UNITTEST_NEW", "timeframe=5m", f"candle_type={candle_type.value}"
+    )
+    # Test data spans 2018-01-10 - 2018-01-30 - a single month
+    assert [f.relative_to(root).as_posix() for f in dh._partition_files(root)] == [
+        "year=2018/month=01/data.parquet"
+    ]
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type), ohlcv)
+
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == (
+        [("UNITTEST/NEW", "5m", CandleType.SPOT)] if candle_type == CandleType.SPOT else []
+    )
+    if candle_type == CandleType.MARK:
+        assert dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES) == [
+            ("UNITTEST/NEW", "5m", CandleType.MARK)
+        ]
+    assert dh.ohlcv_get_pairs(tmp_path, "5m", candle_type) == ["UNITTEST/NEW"]
+    assert dh.ohlcv_get_pairs(tmp_path, "1h", candle_type) == []
+
+    assert dh.ohlcv_purge("UNITTEST/NEW", "5m", candle_type)
+    assert not root.exists()
+    assert not dh.ohlcv_purge("UNITTEST/NEW", "5m", candle_type)
+    assert dh._ohlcv_load("UNITTEST/NEW", "5m", None, candle_type).empty
+
+
+def test_parquetpartitioned_ohlcv_partitions(tmp_path, mocker):
+    # 1h candles from 2021-12-01 to 2022-02-28
+    ohlcv = generate_test_data("1h", 24 * 90, "2021-12-01")
+    dh = get_datahandler(tmp_path, "parquet_partitioned")
+    dh.ohlcv_store("UNITTEST/BTC", "1h", ohlcv, CandleType.SPOT)
+    root = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "1h", CandleType.SPOT)
+    assert [f.relative_to(root).as_posix() for f in dh._partition_files(root)] == [
+        "year=2021/month=12/data.parquet",
+        "year=2022/month=01/data.parquet",
+        "year=2022/month=02/data.parquet",
+    ]
+
+    # Only partitions overlapping the timerange are read
+    load_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.parquetpartitioneddatahandler.load_ohlcv_filtered",
+        wraps=load_ohlcv_filtered,
+    )
+    timerange = TimeRange.parse_timerange("20220110-20220201")
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "1h", timerange, CandleType.SPOT)
+    assert [f.relative_to(root).as_posix() for f in load_mock.call_args[0][0]] == [
+        "year=2022/month=01/data.parquet",
+        # Candle after the end of the timerange
+        "year=2022/month=02/data.parquet",
+    ]
+    assert loaded.iloc[0]["date"] == Timestamp("2022-01-10", tz="UTC")
+    assert loaded.iloc[-1]["date"] == Timestamp("2022-02-01 01:00", tz="UTC")
+    assert_frame_equal(
+        dh.ohlcv_load("UNITTEST/BTC", "1h", CandleType.SPOT, timerange=timerange),
+        ohlcv.loc[(ohlcv["date"] >= "2022-01-10") & (ohlcv["date"] <= "2022-02-01")].reset_index(
+            drop=True
+        ),
+    )
+
+    # Appending only rewrites the touched partition
+    dec_file, jan_file, _ = dh._partition_files(root)
+    mtimes = {f: f.stat().st_mtime_ns for f in (dec_file, jan_file)}
+    new = generate_test_data("1h", 48, "2022-02-28")
+    new.loc[0, "close"] = 1.5
+    dh.ohlcv_append("UNITTEST/BTC", "1h", new, CandleType.SPOT)
+    assert {f: f.stat().st_mtime_ns for f in (dec_file, jan_file)} == mtimes
+    assert [f.relative_to(root).as_posix() for f in dh._partition_files(root)][-1] == (
+        "year=2022/month=03/data.parquet"
+    )
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "1h", None, CandleType.SPOT)
+    assert len(loaded) == len(ohlcv) + 24
+    assert loaded["date"].is_unique
+    assert loaded["date"].is_monotonic_increasing
+    assert loaded.loc[loaded["date"] == "2022-02-28", "close"].iloc[0] == 1.5
+
+
+def test_parquetpartitioned_purge_timerange(testdatadir, tmp_path):
+    ohlcv = generate_test_data("1h", 24 * 90, "2021-12-01")
+    dh = get_datahandler(tmp_path, "parquet_partitioned")
+    dh.ohlcv_store("UNITTEST/BTC", "1h", ohlcv, CandleType.SPOT)
+    root = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "1h", CandleType.SPOT)
+    feb_file = dh._partition_files(root)[-1]
+    feb_mtime = feb_file.stat().st_mtime_ns
+
+    # Outside of the stored data
+    timerange = TimeRange.parse_timerange("20230101-20230201")
+    assert not dh.ohlcv_purge("UNITTEST/BTC", "1h", CandleType.SPOT, timerange=timerange)
+
+    timerange = TimeRange.parse_timerange("20211215-20220201")
+    assert dh.ohlcv_purge("UNITTEST/BTC", "1h", CandleType.SPOT, timerange=timerange)
+    # January is dropped completely, december and february are rewritten
+    assert [f.relative_to(root).as_posix() for f in dh._partition_files(root)] == [
+        "year=2021/month=12/data.parquet",
+        "year=2022/month=02/data.parquet",
+    ]
+    assert feb_file.stat().st_mtime_ns != feb_mtime
+    expected = ohlcv.loc[
+        (ohlcv["date"] < "2021-12-15") | (ohlcv["date"] > "2022-02-01")
+    ].reset_index(drop=True)
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/BTC", "1h", None, CandleType.SPOT), expected)
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "1h", CandleType.SPOT)[2] == len(expected)
+
+    # Purge everything from a start date on
+    timerange = TimeRange.parse_timerange("20211201-")
+    assert dh.ohlcv_purge("UNITTEST/BTC", "1h", CandleType.SPOT, timerange=timerange)
+    assert not root.exists()
+
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh.trades_store("XRP/ETH", trades, TradingMode.SPOT)
+    root = dh._pair_trades_filename(tmp_path, "XRP/ETH", TradingMode.SPOT)
+    timerange = TimeRange(
+        "date",
+        "date",
+        startts=int(trades.iloc[200]["timestamp"]),
+        stopts=int(trades.iloc[1200]["timestamp"]),
+    )
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT, timerange=timerange)
+    assert len(dh._partition_files(root)) == 1
+    assert_frame_equal(
+        dh.trades_load("XRP/ETH", TradingMode.SPOT),
+        trades.loc[
+            (trades["timestamp"] < timerange.startts) | (trades["timestamp"] > timerange.stopts)
+        ].reset_index(drop=True),
+    )
+
+
+def test_parquetpartitioned_trades(testdatadir, tmp_path):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, "parquet_partitioned")
+    dh.trades_store("XRP/ETH", trades.iloc[:1000], TradingMode.SPOT)
+    root = dh._pair_trades_filename(tmp_path, "XRP/ETH", TradingMode.SPOT)
+    assert root == tmp_path / "trades" / "pair=XRP_ETH"
+    assert len(dh._partition_files(root)) == 1
+
+    dh.trades_append("XRP/ETH", trades.iloc[1000:], TradingMode.SPOT)
+    assert len(dh._partition_files(root)) == 2
+    assert dh.trades_get_pairs(tmp_path) == ["XRP/ETH"]
+    assert dh.trades_get_available_data(tmp_path, TradingMode.SPOT) == ["XRP/ETH"]
+    assert dh.trades_get_available_data(tmp_path, TradingMode.FUTURES) == []
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades)
+
+    timerange = TimeRange(
+        "date",
+        "date",
+        startts=int(trades.iloc[200]["timestamp"]),
+        stopts=int(trades.iloc[1200]["timestamp"]),
+    )
+    loaded = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange)
+    assert loaded["timestamp"].min() >= timerange.startts
+    assert loaded["timestamp"].max() <= timerange.stopts
+    assert len(loaded) >= 1001
+
+    dh.trades_compact("XRP/ETH", TradingMode.SPOT)
+    assert len(dh._partition_files(root)) == 1
+    assert_frame_equal(dh.trades_load("XRP/ETH", TradingMode.SPOT), trades)
+
+    assert dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert not root.exists()
+    assert not dh.trades_purge("XRP/ETH", TradingMode.SPOT)
+    assert dh.trades_load("XRP/ETH", TradingMode.SPOT).empty
+
+
 def test_hdf5datahandler_deprecated(testdatadir):
     with pytest.raises(
         OperationalException, match=r"DEPRECATED: The hdf5 dataformat is deprecated and has.*"
@@ -339,7 +607,7 @@ def test_hdf5datahandler_deprecated(testdatadir):
         ("UNITTEST/USDT:USDT", "1h", "mark", "-mark", "2021-11-16", "2021-11-18"),
     ],
 )
-@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+@pytest.mark.parametrize("datahandler", ["feather", "arrow", "parquet"])
 def test_generic_datahandler_ohlcv_load_and_resave(
     datahandler,
     mocker,
@@ -398,11 +666,163 @@ def test_generic_datahandler_ohlcv_load_and_resave(
         "freqtrade.data.history.datahandlers.parquetdatahandler.read_parquet",
         side_effect=Exception("Test"),
     )
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.arrowdatahandler.feather.read_table",
+        side_effect=Exception("Test"),
+    )
     ohlcv_e = dh1.ohlcv_load("UNITTEST/NEW", timeframe, candle_type=candle_type)
     assert ohlcv_e.empty
     assert log_has_re("Error loading data from", caplog)
 
 
+def test_arrowdatahandler_ohlcv_load(testdatadir, tmp_path):
+    import pyarrow as pa
+
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, "arrow")
+    assert isinstance(dh, ArrowDataHandler)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+    filename = tmp_path / "UNITTEST_BTC-5m.arrow"
+    with pa.memory_map(str(filename)) as source:
+        reader = pa.ipc.open_file(source)
+        # Uncompressed, single record batch
+        assert reader.num_record_batches == 1
+        assert reader.schema.field("date").type == pa.timestamp("ns", tz="UTC")
+    assert FeatherDataHandler.ohlcv_get_pairs(tmp_path, "5m", CandleType.SPOT) == []
+    assert dh.ohlcv_get_pairs(tmp_path, "5m", CandleType.SPOT) == ["UNITTEST/BTC"]
+
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv)
+    # Columns are views on the memory mapped file
+    assert not loaded["close"].to_numpy().flags.writeable
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)
+    assert not loaded["close"].to_numpy().flags.writeable
+    assert_frame_equal(
+        loaded,
+        get_datahandler(testdatadir, "feather")._ohlcv_load(
+            "UNITTEST/BTC", "5m", timerange, candle_type=CandleType.SPOT
+        ),
+    )
+    # ohlcv_load() keeps the views for clean data
+    loaded = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange)
+    assert not loaded["close"].to_numpy().flags.writeable
+    assert_frame_equal(
+        loaded,
+        get_datahandler(testdatadir, "feather").ohlcv_load(
+            "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange, drop_incomplete=True
+        ),
+    )
+    loaded = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, drop_incomplete=True)
+    assert not loaded["close"].to_numpy().flags.writeable
+    assert len(loaded) == len(ohlcv) - 1
+
+    # Data with missing candles is cleaned - into a new dataframe
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv.drop(index=[5, 6]), CandleType.SPOT)
+    loaded = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT)
+    assert len(loaded) == len(ohlcv)
+    loaded.loc[0, "close"] = 1.0
+
+
+def test_arrowdatahandler_write_replaces_file(testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, "arrow")
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+    filename = tmp_path / "UNITTEST_BTC-5m.arrow"
+    inode = filename.stat().st_ino
+    mapped = dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT)
+
+    # Rewriting the file doesn't touch the memory-mapped file
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv.iloc[:10], CandleType.SPOT)
+    assert filename.stat().st_ino != inode
+    assert_frame_equal(mapped, ohlcv)
+    assert len(dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT)) == 10
+    # No temporary files are left behind
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_timerange_pushdown(testdatadir, tmp_path, datahandler, mocker):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, candle_type=CandleType.SPOT)
+    read_mock = mocker.patch(
+        f"{dh.__module__}.read_{datahandler}", wraps=getattr(pd, f"read_{datahandler}")
+    )
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    df = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, candle_type=CandleType.SPOT)
+    assert read_mock.call_count == 0
+    assert df["date"].min() == timerange.startdt
+    # One candle after the end of the timerange is loaded
+    assert df["date"].max() == Timestamp("2018-01-19 00:05:00", tz="UTC")
+    expected = ohlcv[(ohlcv["date"] >= df["date"].min()) & (ohlcv["date"] <= df["date"].max())]
+    assert_frame_equal(df, expected.reset_index(drop=True))
+
+    # Open end
+    timerange = TimeRange.parse_timerange("20180115-")
+    df = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, candle_type=CandleType.SPOT)
+    assert df["date"].min() == timerange.startdt
+    assert df["date"].max() == ohlcv["date"].max()
+
+    # No timerange - reads the full file
+    df = dh._ohlcv_load("UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT)
+    assert read_mock.call_count == 1
+    assert len(df) == len(ohlcv)
+
+
+def test_parquetdatahandler_row_groups(testdatadir, tmp_path, mocker):
+    import pyarrow.parquet as pq
+
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "1m", None, candle_type=CandleType.SPOT
+    )
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.parquetdatahandler.PARQUET_ROW_GROUP_SIZE", 1000
+    )
+    dh = ParquetDataHandler(tmp_path)
+    dh.ohlcv_store("UNITTEST/BTC", "1m", ohlcv, candle_type=CandleType.SPOT)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "1m", CandleType.SPOT)
+    metadata = pq.ParquetFile(filename).metadata
+    assert metadata.num_row_groups == math.ceil(len(ohlcv) / 1000)
+    assert metadata.row_group(0).column(0).statistics.has_min_max
+
+
+def test_datahandler_ohlcv_load_timerange_int_dates(testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = FeatherDataHandler(tmp_path)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "5m", CandleType.SPOT)
+    # Legacy files with integer dates can't be filtered, but still load.
+    legacy = ohlcv.copy()
+    legacy["date"] = legacy["date"].astype("int64") // 10**6
+    legacy.to_feather(filename)
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    df = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, candle_type=CandleType.SPOT)
+    assert len(df) == len(ohlcv)
+    assert df["date"].equals(ohlcv["date"])
+
+
+def test_parquetdatahandler_trades_load_timerange(testdatadir):
+    dh = ParquetDataHandler(testdatadir)
+    trades_full = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    start_ts = int(trades_full["timestamp"].iloc[len(trades_full) // 3])
+    stop_ts = int(trades_full["timestamp"].iloc[(2 * len(trades_full)) // 3])
+    tr = TimeRange("date", "date", startts=start_ts, stopts=stop_ts)
+    filtered = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=tr)
+    assert 0 < len(filtered) < len(trades_full)
+    assert filtered["timestamp"].min() >= start_ts
+    assert filtered["timestamp"].max() <= stop_ts
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -417,7 +837,7 @@ def test_datahandler_trades_load(testdatadir, datahandler):
     assert trades1.empty
 
 
-@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "arrow", "parquet"])
 def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
     trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
@@ -433,6 +853,32 @@ def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     assert len(trades_new) == len(trades)
 
 
+@pytest.mark.parametrize(
+    "datahandler", ["jsongz", "feather", "arrow", "parquet", "parquet_partitioned"]
+)
+def test_datahandler_trades_load_chunks(testdatadir, tmp_path, datahandler):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    assert list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT)) == []
+
+    dh.trades_store("XRP/ETH", trades.iloc[:600], TradingMode.SPOT)
+    if datahandler != "jsongz":
+        # Appended trades overlap with the stored trades
+        dh.trades_append("XRP/ETH", trades.iloc[550:], TradingMode.SPOT)
+    else:
+        dh.trades_store("XRP/ETH", concat([trades.iloc[:600], trades.iloc[550:]]), TradingMode.SPOT)
+
+    chunks = list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, chunk_size=100))
+    if datahandler == "jsongz":
+        # Loaded at once
+        assert len(chunks) == 1
+    else:
+        assert len(chunks) > 100
+        assert max(len(chunk) for chunk in chunks) <= 100
+    # Duplicates across chunks are removed
+    assert_frame_equal(concat(chunks, ignore_index=True), trades, check_exact=True)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
@@ -477,6 +923,162 @@ def test_datahandler_trades_data_min_max(testdatadir):
     assert min_max[1] == datetime(2019, 10, 13, 11, 19, 28, 844000, tzinfo=UTC)
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet", "parquet_partitioned"])
+def test_datahandler_ohlcv_metadata(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    expected = (ohlcv.iloc[0]["date"], ohlcv.iloc[-1]["date"], len(ohlcv))
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "5m", CandleType.SPOT)
+    metadata_file = dh._metadata_filename(filename)
+    assert metadata_file.is_file()
+    assert metadata_file.is_relative_to(tmp_path / ".metadata")
+
+    load_mock = mocker.spy(dh, "_ohlcv_load")
+    # Stored metadata is used
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == expected
+    assert load_mock.call_count == 0
+
+    # Missing metadata is rebuilt - from file statistics where available
+    metadata_file.unlink()
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == expected
+    assert load_mock.call_count == (1 if datahandler == "jsongz" else 0)
+    assert metadata_file.is_file()
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == expected
+    assert load_mock.call_count == (1 if datahandler == "jsongz" else 0)
+
+    # Metadata is invalidated if the data changes without updating the metadata
+    shortened = ohlcv.iloc[:100]
+    write_mock = mocker.patch.object(dh, "_write_metadata")
+    dh.ohlcv_store("UNITTEST/BTC", "5m", shortened, CandleType.SPOT)
+    mocker.stop(write_mock)
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == (
+        shortened.iloc[0]["date"],
+        shortened.iloc[-1]["date"],
+        100,
+    )
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "arrow", "parquet", "parquet_partitioned"])
+def test_datahandler_ohlcv_metadata_append(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv.iloc[:1000], CandleType.SPOT)
+    # Appended candles overlap by one candle (the previously incomplete candle)
+    dh.ohlcv_append("UNITTEST/BTC", "5m", ohlcv.iloc[999:2000], CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/BTC", "5m", ohlcv.iloc[2000:], CandleType.SPOT)
+
+    load_mock = mocker.spy(dh, "_ohlcv_load")
+    expected = (ohlcv.iloc[0]["date"], ohlcv.iloc[-1]["date"], len(ohlcv))
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == expected
+    assert load_mock.call_count == 0
+
+    # Appending candles within the stored range invalidates the metadata
+    dh.ohlcv_append("UNITTEST/BTC", "5m", ohlcv.iloc[10:20], CandleType.SPOT)
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == expected
+    # Appended fragments may replace candles - so data is loaded.
+    assert load_mock.call_count == (0 if datahandler == "parquet_partitioned" else 1)
+
+
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet", "parquet_partitioned"])
+def test_datahandler_trades_metadata(datahandler, testdatadir, tmp_path, mocker):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    expected = get_datahandler(testdatadir, "feather").trades_data_min_max(
+        "XRP/ETH", TradingMode.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.trades_store("XRP/ETH", trades.iloc[:1000], TradingMode.SPOT)
+    if datahandler != "jsongz":
+        dh.trades_append("XRP/ETH", trades.iloc[1000:], TradingMode.SPOT)
+    else:
+        dh.trades_store("XRP/ETH", trades, TradingMode.SPOT)
+
+    load_mock = mocker.spy(dh, "_trades_load")
+    assert dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT) == expected
+    assert load_mock.call_count == 0
+
+    filename = dh._pair_trades_filename(tmp_path, "XRP/ETH", TradingMode.SPOT)
+    dh._metadata_filename(filename).unlink()
+    assert dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT) == expected
+    assert load_mock.call_count == (1 if datahandler == "jsongz" else 0)
+
+
+def test_datahandler_metadata_invalid(testdatadir, tmp_path, caplog):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "5m", CandleType.SPOT)
+    dh._metadata_filename(filename).write_text("{invalid")
+
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT)[2] == len(ohlcv)
+    assert log_has_re(r"Invalid metadata for .*UNITTEST_BTC-5m\.feather.*", caplog)
+    # Metadata was rebuilt
+    assert dh._read_metadata(filename)["count"] == len(ohlcv)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet", "parquet_partitioned"])
+def test_datahandler_ohlcv_load_resample(datahandler, tmp_path, mocker, caplog):
+    dh = get_datahandler(tmp_path, datahandler)
+    data_1m = generate_test_data("1m", 3000, "2022-01-01")
+    data_5m = generate_test_data("5m", 1000, "2022-01-01")
+    dh.ohlcv_store("UNITTEST/USDT", "1m", data_1m, CandleType.SPOT)
+    dh.ohlcv_store("UNITTEST/USDT", "5m", data_5m, CandleType.SPOT)
+    resample_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.idatahandler.ohlcv_resample",
+        wraps=ohlcv_resample,
+    )
+
+    assert dh.resample_base_timeframe("UNITTEST/USDT", "1h", CandleType.SPOT) == "5m"
+    assert dh.resample_base_timeframe("UNITTEST/USDT", "3m", CandleType.SPOT) == "1m"
+    assert dh.resample_base_timeframe("UNITTEST/USDT", "1h", CandleType.MARK) is None
+    assert dh.resample_base_timeframe("NOPAIR/USDT", "1h", CandleType.SPOT) is None
+
+    assert dh.ohlcv_load("UNITTEST/USDT", "1h", CandleType.SPOT).empty
+    res = dh.ohlcv_load("UNITTEST/USDT", "1h", CandleType.SPOT, resample=True)
+    assert log_has("Resampling UNITTEST/USDT, spot data from 5m to 1h.", caplog)
+    assert_frame_equal(res, ohlcv_resample(data_5m, "5m", "1h"), check_dtype=False)
+    assert resample_mock.call_count == 1
+    # Resampled data is not listed as available data
+    assert "1h" not in [tf for _, tf, _ in dh.ohlcv_get_available_data(tmp_path, "spot")]
+
+    # Cached on disk
+    timerange = TimeRange("date", None, int(res["date"].iloc[10].timestamp()), 0)
+    res1 = dh.ohlcv_load("UNITTEST/USDT", "1h", CandleType.SPOT, timerange=timerange, resample=True)
+    assert resample_mock.call_count == 1
+    assert_frame_equal(res1, res.iloc[10:].reset_index(drop=True), check_dtype=False)
+
+    # Changed base data is resampled again
+    dh.ohlcv_store("UNITTEST/USDT", "5m", data_5m.iloc[:500], CandleType.SPOT)
+    res2 = dh.ohlcv_load("UNITTEST/USDT", "1h", CandleType.SPOT, resample=True)
+    assert resample_mock.call_count == 2
+    assert len(res2) < len(res)
+
+    # Available data is never resampled
+    dh.ohlcv_load("UNITTEST/USDT", "5m", CandleType.SPOT, resample=True)
+    assert resample_mock.call_count == 2
+
+
+def test_datahandler_resample_cache_size(tmp_path, mocker):
+    dh = get_datahandler(tmp_path, "feather")
+    dh.ohlcv_store("UNITTEST/USDT", "5m", generate_test_data("5m", 1000), CandleType.SPOT)
+    dh.ohlcv_load("UNITTEST/USDT", "1h", CandleType.SPOT, resample=True)
+    cache_1h = dh._resample_cache_filename("UNITTEST/USDT", "1h", CandleType.SPOT)
+    assert cache_1h.is_file()
+    assert cache_1h.is_relative_to(tmp_path / ".resampled")
+
+    mocker.patch.object(dh, "_resample_cache_size", cache_1h.stat().st_size + 1)
+    dh.ohlcv_load("UNITTEST/USDT", "4h", CandleType.SPOT, resample=True)
+    # Least recently used file is removed
+    assert not cache_1h.is_file()
+    assert dh._resample_cache_filename("UNITTEST/USDT", "4h", CandleType.SPOT).is_file()
+
+
 def test_gethandlerclass():
     cl = get_datahandlerclass("json")
     assert cl == JsonDataHandler
@@ -491,10 +1093,18 @@ def test_gethandlerclass():
     assert cl == FeatherDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("arrow")
+    assert cl == ArrowDataHandler
+    assert issubclass(cl, FeatherDataHandler)
+
     cl = get_datahandlerclass("parquet")
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("parquet_partitioned")
+    assert cl == ParquetPartitionedDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
@@ -61,6 +61,12 @@ def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     assert isinstance(data, DataFrame)
     assert historymock.call_count == 1
     assert historymock.call_args_list[0][1]["timeframe"] == "5m"
+    assert historymock.call_args_list[0][1]["resample"] is False
+
+    default_conf["dataload_resample"] = True
+    dp = DataProvider(default_conf, None)
+    dp.historic_ohlcv("UNITTEST/BTC", "1h")
+    assert historymock.call_args_list[1][1]["resample"] is True
 
 
 def test_historic_trades(mocker, default_conf, trades_history_df):
@@ -0,0 +1,136 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import logging
+from unittest.mock import PropertyMock
+
+import ccxt
+import pytest
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history import get_datahandler
+from freqtrade.data.history.download_scheduler import DownloadScheduler
+from freqtrade.data.history.history_utils import refresh_backtest_ohlcv_data
+from freqtrade.enums import CandleType
+from freqtrade.exchange import timeframe_to_msecs
+from freqtrade.util import dt_ts, dt_utc
+from tests.conftest import EXMS, get_patched_exchange, log_has, log_has_re
+
+
+START = dt_ts(dt_utc(2023, 1, 1))
+STOP = dt_ts(dt_utc(2023, 5, 1))
+
+
+class FakeCcxtExchange:
+    """
+    Serves candles for all pairs, starting at the pair's listing date.
+    """
+
+    def __init__(self, listings: dict[str, int]) -> None:
+        self.listings = listings
+        self.calls: list[tuple[str, str, int]] = []
+        self.fail_after: int | None = None
+
+    async def fetch_ohlcv(self, pair, timeframe, since=None, limit=None, params=None):
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise ccxt.BaseError("Connection lost")
+        self.calls.append((pair, timeframe, since))
+        tf_ms = timeframe_to_msecs(timeframe)
+        start = max(since or 0, self.listings[pair])
+        start = -(-start // tf_ms) * tf_ms
+        return [
+            [ts, 1.0, 2.0, 0.5, ts / 1e12, 10.0]
+            for ts in range(start, min(start + limit * tf_ms, STOP + 10 * tf_ms), tf_ms)
+        ]
+
+
+@pytest.fixture
+def fake_exchange(mocker, default_conf, markets):
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    exchange = get_patched_exchange(mocker, default_conf)
+    fake = FakeCcxtExchange({"ETH/BTC": 0, "XRP/BTC": dt_ts(dt_utc(2023, 3, 1))})
+    exchange._api_async.fetch_ohlcv = fake.fetch_ohlcv
+    # Small segments, to store data multiple times per job
+    mocker.patch.object(DownloadScheduler, "segment_calls", 1)
+    return exchange, fake
+
+
+def test_refresh_backtest_ohlcv_data_concurrent(fake_exchange, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    exchange, _ = fake_exchange
+    pairs_not_available = refresh_backtest_ohlcv_data(
+        exchange,
+        pairs=["ETH/BTC", "XRP/BTC", "NOPE/BTC"],
+        timeframes=["1h", "4h"],
+        datadir=tmp_path,
+        trading_mode="spot",
+        timerange=TimeRange("date", "date", START // 1000, STOP // 1000),
+        workers=3,
+    )
+    assert pairs_not_available == ["NOPE/BTC: Pair not available on exchange."]
+
+    dh = get_datahandler(tmp_path, "feather")
+    for pair, first in (("ETH/BTC", START), ("XRP/BTC", dt_ts(dt_utc(2023, 3, 1)))):
+        for timeframe in ("1h", "4h"):
+            data = dh.ohlcv_load(pair, timeframe, candle_type=CandleType.SPOT)
+            tf_ms = timeframe_to_msecs(timeframe)
+            assert dt_ts(data.iloc[0]["date"]) == first
+            assert dt_ts(data.iloc[-1]["date"]) >= STOP
+            # No gaps between segments
+            assert (data["date"].diff().dropna().dt.total_seconds() * 1000 == tf_ms).all()
+
+    # Listing date of new pairs is detected
+    assert log_has_re(r"Candle-data for XRP/BTC available starting with 2023-03-01.*", caplog)
+    # Data is stored in segments
+    assert (
+        len(dh._fragment_files(dh._pair_data_filename(tmp_path, "ETH/BTC", "1h", CandleType.SPOT)))
+        >= 2
+    )
+    assert not (tmp_path / ".metadata" / "download-checkpoints.json").exists()
+    assert log_has_re(r"Downloaded \d+ candles with \d+ requests .* candles/s, .*", caplog)
+
+
+def test_download_scheduler_resume(fake_exchange, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    exchange, fake = fake_exchange
+    dh = get_datahandler(tmp_path, "feather")
+    timerange = TimeRange("date", "date", START // 1000, STOP // 1000)
+
+    scheduler = DownloadScheduler(exchange, dh, timerange=timerange, erase=True, workers=1)
+    scheduler.add_job("ETH/BTC", "1h", CandleType.SPOT)
+    scheduler.add_job("ETH/BTC", "1h", CandleType.SPOT)
+    scheduler.add_job("XRP/BTC", "1h", CandleType.SPOT)
+    assert len(scheduler.jobs) == 2
+    # Fail while downloading the 2nd segment of the first job
+    fake.fail_after = 2
+    scheduler.run()
+    assert scheduler.failed_jobs == scheduler.jobs
+    checkpoints = scheduler._load_checkpoints()
+    assert list(checkpoints) == ["ETH/BTC|1h|spot"]
+    next_ms = checkpoints["ETH/BTC|1h|spot"]["next_ms"]
+    partial = dh.ohlcv_load("ETH/BTC", "1h", candle_type=CandleType.SPOT)
+    assert len(partial) == (next_ms - START) // 3_600_000
+    assert scheduler.candles == len(partial)
+
+    fake.fail_after = None
+    fake.calls.clear()
+    scheduler = DownloadScheduler(exchange, dh, timerange=timerange, erase=True, workers=2)
+    scheduler.add_job("ETH/BTC", "1h", CandleType.SPOT)
+    scheduler.add_job("XRP/BTC", "1h", CandleType.SPOT)
+    scheduler.run()
+    assert scheduler.failed_jobs == []
+    assert log_has("Resuming download of ETH/BTC, 1h, spot from 2023-01-21T19:00:00.", caplog)
+    # Already downloaded data was neither erased nor downloaded again
+    assert all(since >= next_ms for pair, _, since in fake.calls if pair == "ETH/BTC")
+    data = dh.ohlcv_load("ETH/BTC", "1h", candle_type=CandleType.SPOT)
+    assert dt_ts(data.iloc[-1]["date"]) >= STOP
+    assert (data["date"].diff().dropna().dt.total_seconds() == 3600).all()
+    assert not scheduler.checkpoint_file.exists()
+
+    # Checkpoints of a download with different parameters are ignored
+    scheduler._save_checkpoint(scheduler.jobs[0], {"params": {}, "next_ms": 0, "until_ms": 0})
+    scheduler = DownloadScheduler(exchange, dh, timerange=timerange, erase=True, workers=2)
+    scheduler.add_job("ETH/BTC", "1h", CandleType.SPOT)
+    caplog.clear()
+    scheduler.run()
+    assert log_has("Deleting existing data for pair ETH/BTC, 1h, spot.", caplog)
+    assert not scheduler.checkpoint_file.exists()
@@ -15,13 +15,16 @@ from pandas.testing import assert_frame_equal
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
-from freqtrade.data.history import get_datahandler
+from freqtrade.data.history import get_datahandler, history_utils
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
+from freqtrade.data.history.history_cache import PairHistoryCache, pair_history_cache
 from freqtrade.data.history.history_utils import (
     _download_all_pairs_history_parallel,
     _download_pair_history,
     _download_trades_history,
     _load_cached_data_for_updating,
+    dataload_workers,
     get_timerange,
     load_data,
     load_pair_history,
@@ -358,6 +361,11 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
+    invalidate_mock = mocker.patch.object(pair_history_cache, "invalidate")
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -381,7 +389,12 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing data is appended to, new data is stored
+    assert json_dump_mock.call_count + append_mock.call_count == 3
+    assert append_mock.call_count == 1
+    # Cached data of downloaded pairs is invalidated
+    assert invalidate_mock.call_count == 3
+    invalidate_mock.assert_called_with(testdatadir.resolve(), "UNITTEST/USDT", "1h", "mark")
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -437,6 +450,141 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
     )
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_load_data_workers(testdatadir, mocker, caplog, workers) -> None:
+    caplog.set_level(logging.DEBUG)
+    pairs = ["UNITTEST/BTC", "NOPAIR/XXX", "ETH/BTC", "XLM/BTC", "TRX/BTC"]
+    executor_mock = mocker.patch(
+        "freqtrade.data.history.history_utils.ThreadPoolExecutor",
+        wraps=history_utils.ThreadPoolExecutor,
+    )
+    data = load_data(datadir=testdatadir, timeframe="5m", pairs=pairs, workers=workers)
+    # Order of pairs is kept, pairs without data are skipped
+    assert list(data.keys()) == ["UNITTEST/BTC", "ETH/BTC", "XLM/BTC", "TRX/BTC"]
+    assert_frame_equal(
+        data["ETH/BTC"], load_pair_history(pair="ETH/BTC", timeframe="5m", datadir=testdatadir)
+    )
+    if workers == 1:
+        assert executor_mock.call_count == 0
+    else:
+        executor_mock.assert_called_once_with(max_workers=4)
+        assert log_has("Loading 5 pairs using 4 workers.", caplog)
+
+
+def test_dataload_workers(mocker) -> None:
+    mocker.patch("freqtrade.data.history.history_utils.os.cpu_count", return_value=16)
+    assert dataload_workers(None, 100) == 8
+    assert dataload_workers(None, 3) == 3
+    assert dataload_workers(12, 100) == 12
+    assert dataload_workers(4, 0) == 1
+    mocker.patch("freqtrade.data.history.history_utils.os.cpu_count", return_value=None)
+    assert dataload_workers(None, 100) == 1
+
+
+def test_load_pair_history_cache(testdatadir, tmp_path, mocker) -> None:
+    copyfile(testdatadir / "UNITTEST_BTC-1m.feather", tmp_path / "UNITTEST_BTC-1m.feather")
+    load_mock = mocker.spy(FeatherDataHandler, "ohlcv_load")
+    kwargs = {"pair": "UNITTEST/BTC", "timeframe": "1m", "datadir": tmp_path}
+
+    # Disabled by default
+    load_pair_history(**kwargs)
+    load_pair_history(**kwargs)
+    assert load_mock.call_count == 2
+    assert len(pair_history_cache) == 0
+
+    pair_history_cache.configure({"dataload_cache_size": 100})
+    df = load_pair_history(**kwargs)
+    assert load_mock.call_count == 3
+    assert len(pair_history_cache) == 1
+    # Returned dataframes are copies
+    df.loc[:, "close"] = 0
+    df1 = load_pair_history(**kwargs)
+    assert load_mock.call_count == 3
+    assert df1["close"].iloc[0] != 0
+
+    # Different load parameters are cached separately
+    timerange = TimeRange.parse_timerange("20171114-")
+    df2 = load_pair_history(**kwargs, timerange=timerange)
+    assert load_mock.call_count == 4
+    assert len(df2) < len(df1)
+    assert_frame_equal(load_pair_history(**kwargs, timerange=timerange), df2)
+    assert load_mock.call_count == 4
+    assert len(pair_history_cache) == 2
+
+    # Modified data files are reloaded
+    get_datahandler(tmp_path, "feather").ohlcv_store(
+        "UNITTEST/BTC", "1m", df1.iloc[:10], CandleType.SPOT
+    )
+    assert len(load_pair_history(**kwargs)) == 10
+    assert load_mock.call_count == 5
+
+    # Pairs without data are not cached
+    load_pair_history(pair="NOPAIR/XXX", timeframe="1m", datadir=tmp_path)
+    load_pair_history(pair="NOPAIR/XXX", timeframe="1m", datadir=tmp_path)
+    assert load_mock.call_count == 7
+
+    pair_history_cache.invalidate(tmp_path.resolve(), "UNITTEST/BTC")
+    assert len(pair_history_cache) == 0
+
+
+def test_load_data_resample(testdatadir, tmp_path, mocker) -> None:
+    copyfile(testdatadir / "UNITTEST_BTC-5m.feather", tmp_path / "UNITTEST_BTC-5m.feather")
+    assert load_data(datadir=tmp_path, timeframe="1h", pairs=["UNITTEST/BTC"]) == {}
+    data = load_data(datadir=tmp_path, timeframe="1h", pairs=["UNITTEST/BTC"], resample=True)
+    assert len(data["UNITTEST/BTC"]) > 0
+    assert data["UNITTEST/BTC"]["date"].diff().min() == timedelta(hours=1)
+
+    # Cached in memory as long as the base data doesn't change
+    pair_history_cache.configure({"dataload_cache_size": 100})
+    resample_mock = mocker.spy(FeatherDataHandler, "_ohlcv_load_resampled")
+    kwargs = {"pair": "UNITTEST/BTC", "timeframe": "1h", "datadir": tmp_path, "resample": True}
+    assert_frame_equal(load_pair_history(**kwargs), data["UNITTEST/BTC"])
+    load_pair_history(**kwargs)
+    assert resample_mock.call_count == 1
+    (tmp_path / "UNITTEST_BTC-5m.feather").touch()
+    load_pair_history(**kwargs)
+    assert resample_mock.call_count == 2
+
+
+def test_pair_history_cache_size(mocker) -> None:
+    cache = PairHistoryCache(1)
+    assert cache.enabled
+    df = DataFrame({"a": range(50_000)})
+    size = df.memory_usage(index=True).sum()
+    loader = MagicMock(return_value=df)
+    signature = [["a.feather", 1, 1]]
+
+    cache.get_or_load(("dir", "A/B", "5m", "spot"), signature, loader)
+    cache.get_or_load(("dir", "C/D", "5m", "spot"), signature, loader)
+    assert len(cache) == 2
+    assert cache.currsize == 2 * size
+    # Least recently used entry is evicted
+    cache.get_or_load(("dir", "A/B", "5m", "spot"), signature, loader)
+    cache.get_or_load(("dir", "E/F", "5m", "spot"), signature, loader)
+    assert loader.call_count == 3
+    assert len(cache) == 2
+    cache.get_or_load(("dir", "A/B", "5m", "spot"), signature, loader)
+    assert loader.call_count == 3
+    cache.get_or_load(("dir", "C/D", "5m", "spot"), signature, loader)
+    assert loader.call_count == 4
+
+    # Dataframes larger than the cache are not cached
+    loader.return_value = DataFrame({"a": range(200_000)})
+    cache.get_or_load(("dir", "G/H", "5m", "spot"), signature, loader)
+    cache.get_or_load(("dir", "G/H", "5m", "spot"), signature, loader)
+    assert loader.call_count == 6
+
+    cache.invalidate(timeframe="1h")
+    assert len(cache) == 2
+    cache.invalidate(pair="C/D")
+    assert len(cache) == 1
+
+    cache.set_size(0)
+    assert not cache.enabled
+    assert len(cache) == 0
+    assert cache.currsize == 0
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(datadir=Path(), pairs=[], timeframe=default_conf["timeframe"])
 
@@ -712,6 +860,31 @@ def test_download_trades_history(
     _clean_test_file(file2)
 
 
+def test_download_trades_history_append(trades_history, mocker, default_conf, tmp_path) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    data_handler = get_datahandler(tmp_path, data_format="feather")
+    mocker.patch(f"{EXMS}.get_historic_trades", return_value=("ETH/BTC", trades_history[:4]))
+    assert _download_trades_history(
+        data_handler=data_handler, exchange=exchange, pair="ETH/BTC", trading_mode=TradingMode.SPOT
+    )
+    append_mock = mocker.spy(data_handler, "trades_append")
+    load_mock = mocker.spy(data_handler, "trades_load")
+    # Downloads overlap with already stored trades
+    mocker.patch(f"{EXMS}.get_historic_trades", return_value=("ETH/BTC", trades_history[2:]))
+    assert _download_trades_history(
+        data_handler=data_handler, exchange=exchange, pair="ETH/BTC", trading_mode=TradingMode.SPOT
+    )
+    assert append_mock.call_count == 1
+    assert len(append_mock.call_args[0][1]) == 2
+    # Only the last stored trades were loaded
+    assert load_mock.call_count == 1
+    assert load_mock.call_args[1]["timerange"].startts == trades_history[3][0] - 5000
+
+    trades = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert len(trades) == 6
+    assert trades["id"].tolist() == [t[1] for t in trades_history]
+
+
 def test_download_all_pairs_history_parallel(mocker, default_conf_usdt):
     pairs = ["PAIR1/BTC", "PAIR2/USDT"]
     timeframe = "5m"
@@ -830,6 +1003,8 @@ def test_download_pair_history_with_pair_candles(mocker, default_conf, tmp_path,
     data_handler_mock = MagicMock()
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
+    # Data format without append support - data is merged and stored
+    data_handler_mock.ohlcv_append.side_effect = NotImplementedError()
     mocker.patch(
         "freqtrade.data.history.history_utils.get_datahandler", return_value=data_handler_mock
     )
@@ -958,8 +1133,56 @@ def test_download_pair_history_with_pair_candles_no_overlap(
     # Verify the log message indicating parallel method was used (line 315-316)
     assert not log_has_re(r"Downloaded .* Parallel Method.", caplog)
 
-    # Verify data was stored
-    assert data_handler_mock.ohlcv_store.call_count == 1
-    stored_data = data_handler_mock.ohlcv_store.call_args_list[0][1]["data"]
-    assert stored_data.equals(existing_data)
-    assert len(stored_data) == 2
+    # Nothing new was downloaded - nothing is stored
+    assert data_handler_mock.ohlcv_store.call_count == 0
+    assert data_handler_mock.ohlcv_append.call_count == 0
+
+
+def test_download_pair_history_append(mocker, default_conf, tmp_path) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "feather")
+    existing_data = DataFrame(
+        {
+            "date": [dt_utc(2018, 1, 10, 10, 0), dt_utc(2018, 1, 10, 10, 5)],
+            "open": [1.0, 1.1],
+            "high": [1.1, 1.2],
+            "low": [0.9, 1.0],
+            "close": [1.05, 1.15],
+            "volume": [100.0, 150.0],
+        }
+    )
+    dh.ohlcv_store("TEST/BTC", "5m", existing_data, CandleType.SPOT)
+    # The last candle was incomplete and is downloaded again.
+    new_data = DataFrame(
+        {
+            "date": [dt_utc(2018, 1, 10, 10, 5), dt_utc(2018, 1, 10, 10, 10)],
+            "open": [1.1, 1.2],
+            "high": [1.25, 1.3],
+            "low": [1.0, 1.15],
+            "close": [1.2, 1.25],
+            "volume": [200.0, 250.0],
+        }
+    )
+    mocker.patch.object(exchange, "get_historic_ohlcv", return_value=new_data)
+    store_mock = mocker.spy(dh, "ohlcv_store")
+    append_mock = mocker.spy(dh, "ohlcv_append")
+
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        pair="TEST/BTC",
+        timeframe="5m",
+        candle_type=CandleType.SPOT,
+        data_handler=dh,
+    )
+    assert store_mock.call_count == 0
+    assert append_mock.call_count == 1
+    assert append_mock.call_args[1]["data"].equals(new_data)
+    filename = dh._pair_data_filename(tmp_path, "TEST/BTC", "5m", CandleType.SPOT)
+    assert len(dh._fragment_files(filename)) == 1
+
+    data = dh.ohlcv_load("TEST/BTC", "5m", CandleType.SPOT)
+    assert len(data) == 3
+    # Updated candle replaces the stored one
+    assert data.iloc[1]["volume"] == 200.0
+    assert data.iloc[-1]["date"] == dt_utc(2018, 1, 10, 10, 10)
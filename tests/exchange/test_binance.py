@@ -1,7 +1,7 @@
 from copy import deepcopy
 from datetime import datetime, timedelta
 from random import randint
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import ccxt
 import pandas as pd
@@ -773,6 +773,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         until_ms,
         markets=None,
         stop_on_404=False,
+        cache_dir=None,
     ):
         since = dt_from_ts(since_ms)
         until = dt_from_ts(until_ms) if until_ms else archive_end + timedelta(seconds=1)
@@ -928,9 +929,11 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         ),
     ],
 )
+@pytest.mark.parametrize("use_async", [False, True])
 def test_get_historic_ohlcv_binance(
     mocker,
     default_conf,
+    use_async,
     timeframe,
     is_new_pair,
     since,
@@ -956,7 +959,21 @@ def test_get_historic_ohlcv_binance(
     since_ms = dt_ts(since)
     until_ms = dt_ts(until)
 
-    df = exchange.get_historic_ohlcv(pair, timeframe, since_ms, candle_type, is_new_pair, until_ms)
+    if use_async:
+        # Used by the DownloadScheduler - downloads the remainder via the async REST method
+        mocker.patch(
+            f"{EXMS}._async_get_historic_ohlcv_df",
+            AsyncMock(side_effect=lambda **kwargs: api_mock(**kwargs)),
+        )
+        df = exchange.loop.run_until_complete(
+            exchange._async_get_historic_ohlcv_df(
+                pair, timeframe, since_ms, candle_type, is_new_pair, until_ms
+            )
+        )
+    else:
+        df = exchange.get_historic_ohlcv(
+            pair, timeframe, since_ms, candle_type, is_new_pair, until_ms
+        )
 
     if df.empty:
         assert first_date is None
@@ -1,25 +1,34 @@
 import asyncio
 import datetime
+import hashlib
 import io
 import re
 import sys
 import zipfile
+from concurrent.futures.process import BrokenProcessPool
 from datetime import timedelta
+from unittest.mock import MagicMock
 
 import aiohttp
 import pandas as pd
 import pytest
 
 from freqtrade.enums import CandleType
+from freqtrade.exchange import binance_public_data
 from freqtrade.exchange.binance_public_data import (
+    ArchiveCache,
+    BadChecksum,
     BadHttpStatus,
     Http404,
+    binance_vision_ohlcv_zip_url,
     binance_vision_trades_zip_url,
     binance_vision_zip_name,
     download_archive_ohlcv,
     download_archive_trades,
     get_daily_ohlcv,
     get_daily_trades,
+    parse_archive,
+    parse_ohlcv_zip,
 )
 from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from ft_client.test_client.test_rest_client import log_has_re
@@ -494,3 +503,165 @@ async def test_get_daily_trades(mocker, testdatadir):
         with pytest.raises(zipfile.BadZipFile):
             await get_daily_trades(symbol, CandleType.SPOT, date, session)
         assert get.call_count == 4  # 1 + 3 default retries
+
+
+def test_archive_cache(tmp_path, caplog):
+    cache = ArchiveCache(tmp_path)
+    url = "https://data.binance.vision/data/spot/daily/klines/BTCUSDT/1h/BTCUSDT-1h-2024-10-28.zip"
+    url2 = url.replace("2024-10-28", "2024-10-29")
+    assert cache.get(url) is None
+
+    cache.put(url, b"content")
+    cache.put(url2, b"content")
+    assert cache.get(url) == b"content"
+    assert cache.get(url2) == b"content"
+    # Identical content is stored once
+    assert len(list((tmp_path / "objects").rglob("*.zip"))) == 1
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    # Corrupted archives are removed
+    next((tmp_path / "objects").rglob("*.zip")).write_bytes(b"corrupted")
+    assert cache.get(url) is None
+    assert log_has_re(r"Removing corrupted archive .*2024-10-28\.zip", caplog)
+    assert not list((tmp_path / "objects").rglob("*.zip"))
+    assert cache.get(url2) is None
+
+    cache.put(url, b"content")
+    cache.put(url2, b"content")
+    cache.remove(url)
+    assert cache.get(url) is None
+    # Removing a url keeps the archive for other urls referencing it
+    assert cache.get(url2) == b"content"
+
+
+async def test_get_daily_ohlcv_cache_parse_errors(mocker, testdatadir, tmp_path, caplog):
+    symbol = "BTCUSDT"
+    date = dt_utc(2024, 10, 28).date()
+    url = binance_vision_ohlcv_zip_url(symbol, "1h", CandleType.SPOT, date)
+    cache = ArchiveCache(tmp_path)
+    cache.put(
+        url,
+        (
+            testdatadir / "binance/binance_public_data/spot-klines-BTCUSDT-1h-2024-10-28.zip"
+        ).read_bytes(),
+    )
+    session = MagicMock()
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.download_archive_zip",
+        side_effect=Http404("404", date, url),
+    )
+
+    # Failing workers don't make cached archives unusable
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.parse_archive", side_effect=BrokenProcessPool()
+    )
+    with pytest.raises(BrokenProcessPool):
+        await get_daily_ohlcv(symbol, "1h", CandleType.SPOT, date, session, cache=cache)
+    assert cache.get(url) is not None
+
+    # Unreadable archives are removed
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.parse_archive",
+        side_effect=zipfile.BadZipFile("File is not a zip file"),
+    )
+    with pytest.raises(Http404):
+        await get_daily_ohlcv(symbol, "1h", CandleType.SPOT, date, session, cache=cache)
+    assert log_has_re(r"Removing unreadable archive .*2024-10-28\.zip", caplog)
+    assert cache.get(url) is None
+
+
+async def test_parse_archive_broken_pool(mocker, testdatadir):
+    content = (
+        testdatadir / "binance/binance_public_data/spot-klines-BTCUSDT-1h-2024-10-28.zip"
+    ).read_bytes()
+    broken = binance_public_data.get_parse_executor()
+    mocker.patch.object(
+        asyncio.get_running_loop(),
+        "run_in_executor",
+        side_effect=[BrokenProcessPool(), asyncio.sleep(0, "parsed")],
+    )
+    assert await parse_archive(parse_ohlcv_zip, content, broken) == "parsed"
+    # The broken pool was replaced
+    assert binance_public_data._parse_executor is not broken
+    assert binance_public_data._parse_executor is not None
+
+    binance_public_data.shutdown_parse_executor()
+    assert binance_public_data._parse_executor is None
+
+
+async def test_get_daily_ohlcv_cache(mocker, testdatadir, tmp_path):
+    symbol = "BTCUSDT"
+    date = dt_utc(2024, 10, 28).date()
+    content = (
+        testdatadir / "binance/binance_public_data/spot-klines-BTCUSDT-1h-2024-10-28.zip"
+    ).read_bytes()
+    checksum = hashlib.sha256(content).hexdigest()
+
+    def make_response(url):
+        if url.endswith(".CHECKSUM"):
+            return MockResponse(f"{checksum}  BTCUSDT-1h-2024-10-28.zip\n".encode(), 200)
+        return MockResponse(content, 200)
+
+    cache = ArchiveCache(tmp_path)
+    async with aiohttp.ClientSession() as session:
+        get = mocker.patch(
+            "freqtrade.exchange.binance_public_data.aiohttp.ClientSession.get",
+            side_effect=make_response,
+        )
+        df = await get_daily_ohlcv(symbol, "1h", CandleType.SPOT, date, session, cache=cache)
+        # Archive and checksum
+        assert get.call_count == 2
+        assert len(df) == 24
+
+        # Served from the cache
+        get.reset_mock()
+        df1 = await get_daily_ohlcv(symbol, "1h", CandleType.SPOT, date, session, cache=cache)
+        assert get.call_count == 0
+        pd.testing.assert_frame_equal(df, df1)
+
+        # Larger timeframes are resampled from cached archives
+        df4h = await get_daily_ohlcv(symbol, "4h", CandleType.SPOT, date, session, cache=cache)
+        assert get.call_count == 0
+        assert len(df4h) == 6
+        assert df4h["date"].iloc[-1] == dt_utc(2024, 10, 28, 20)
+        assert df4h["volume"].sum() == pytest.approx(df["volume"].sum())
+        assert df4h["high"].iloc[0] == df["high"].iloc[:4].max()
+
+        # Archives not matching the published checksum are neither used nor cached
+        checksum = "0" * 64
+        mocker.patch("asyncio.sleep")
+        with pytest.raises(BadChecksum):
+            await get_daily_ohlcv(symbol, "1h", CandleType.FUTURES, date, session, cache=cache)
+        assert get.call_count == 8  # (1 + 3 default retries) * 2
+        url = binance_vision_ohlcv_zip_url(symbol, "1h", CandleType.FUTURES, date)
+        assert cache.get(url) is None
+
+
+async def test_download_archive_ohlcv_cache(mocker, tmp_path):
+    mocker.patch("freqtrade.exchange.binance_public_data.PROCESS_POOL_MIN_DAYS", 2)
+    get = mocker.patch(
+        "freqtrade.exchange.binance_public_data.aiohttp.ClientSession.get",
+        side_effect=make_response_from_url(dt_utc(2020, 1, 1).date(), dt_utc(2020, 1, 4).date()),
+    )
+    markets = {"BTC/USDT": {"id": "BTCUSDT"}}
+    kwargs = {
+        "since_ms": dt_ts(dt_utc(2020, 1, 1)),
+        "until_ms": dt_ts(dt_utc(2020, 1, 4)),
+        "markets": markets,
+        "cache_dir": tmp_path,
+    }
+
+    df = await download_archive_ohlcv(CandleType.SPOT, "BTC/USDT", "1h", **kwargs)
+    assert len(df) == 72
+    assert get.call_count > 0
+    # Archives were parsed in the process pool
+    assert binance_public_data._parse_executor is not None
+
+    # Downloaded archives are read from disk
+    get.reset_mock()
+    get.side_effect = RuntimeError
+    df1 = await download_archive_ohlcv(CandleType.SPOT, "BTC/USDT", "1h", **kwargs)
+    pd.testing.assert_frame_equal(df, df1)
+    df2 = await download_archive_ohlcv(CandleType.SPOT, "BTC/USDT", "2h", **kwargs)
+    assert len(df2) == 36
+    assert get.call_count == 0
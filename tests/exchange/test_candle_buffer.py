@@ -0,0 +1,180 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import numpy as np
+import pytest
+from pandas import DataFrame, concat, date_range
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.exchange.candle_buffer import (
+    CandleBuffer,
+    CandleCache,
+    CandleCacheView,
+    ticks_to_arrays,
+)
+
+
+def generate_candles(start, count: int, timeframe: str, rng) -> DataFrame:
+    close = rng.uniform(90, 110, count)
+    return DataFrame(
+        {
+            "date": date_range(start, periods=count, freq=timeframe.replace("m", "min"), tz="UTC"),
+            "open": rng.uniform(90, 110, count),
+            "high": rng.uniform(110, 120, count),
+            "low": rng.uniform(80, 90, count),
+            "close": close,
+            "volume": rng.uniform(0, 1000, count),
+        }
+    )
+
+
+def to_ticks(df: DataFrame) -> list[list]:
+    dates = (df["date"].astype("int64") // 1_000_000).tolist()
+    return [[d, *row] for d, row in zip(dates, df.iloc[:, 1:].values.tolist(), strict=True)]
+
+
+def to_arrays(df: DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    return ticks_to_arrays(to_ticks(df), drop_incomplete=False)
+
+
+def legacy_merge(old: DataFrame, new: DataFrame, timeframe: str, capacity: int) -> DataFrame:
+    """Replicates the concat-based merge of Exchange._process_ohlcv_df"""
+    df = clean_ohlcv_dataframe(
+        concat([old, new], axis=0),
+        timeframe,
+        "UNITTEST/USDT",
+        fill_missing=True,
+        drop_incomplete=False,
+    )
+    return df.tail(capacity).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h"])
+def test_candle_cache_upsert_matches_merge(timeframe):
+    rng = np.random.default_rng(42)
+    capacity = 50
+    key = ("UNITTEST/USDT", timeframe, "spot")
+    cache = CandleCache()
+    expected = generate_candles("2024-01-01", 30, timeframe, rng)
+    cache[key] = expected
+    tf_delta = expected["date"].iloc[1] - expected["date"].iloc[0]
+
+    for _ in range(200):
+        last = expected["date"].iloc[-1]
+        # Start within the buffered candles (updating existing candles), or after the
+        # last candle (possibly leaving a gap)
+        start = last + tf_delta * int(rng.integers(-5, 4))
+        new = generate_candles(start, int(rng.integers(1, 8)), timeframe, rng)
+        if rng.random() < 0.3 and len(new) > 2:
+            # Candles missing from the refreshed candles
+            new = new.drop(index=new.index[1]).reset_index(drop=True)
+
+        assert cache.upsert(key, to_ticks(new), timeframe, capacity)
+        expected = legacy_merge(expected, new, timeframe, capacity)
+        assert_frame_equal(cache[key], expected, check_dtype=False)
+
+    assert len(cache[key]) == capacity
+
+
+def test_candle_buffer_upsert_rejects():
+    rng = np.random.default_rng(1)
+    candles = generate_candles("2024-01-01", 20, "5m", rng)
+    buffer = CandleBuffer.from_dataframe(candles.iloc[5:], "5m", 30)
+    assert len(buffer) == 15
+    # Prepending to a buffer below capacity
+    assert not buffer.upsert(*to_arrays(candles.iloc[:6]))
+    # Candles not aligned to the buffered candles
+    shifted = candles.iloc[-2:].assign(date=candles["date"].iloc[-2:] + np.timedelta64(1, "m"))
+    assert not buffer.upsert(*to_arrays(shifted))
+    assert_frame_equal(buffer.to_dataframe(), candles.iloc[5:].reset_index(drop=True))
+
+    # Candles before the first candle of a full buffer are dropped
+    buffer = CandleBuffer.from_dataframe(candles, "5m", 10)
+    assert len(buffer) == 10
+    assert buffer.upsert(*to_arrays(candles.iloc[:12]))
+    assert_frame_equal(buffer.to_dataframe(), candles.iloc[10:].reset_index(drop=True))
+
+    # Data with gaps can't be buffered
+    assert CandleBuffer.from_dataframe(candles.drop(index=3), "5m", 30) is None
+    assert not CandleBuffer.supports("1w")
+    assert CandleBuffer.supports("1d")
+
+
+def test_candle_cache_mapping():
+    rng = np.random.default_rng(3)
+    candles = generate_candles("2024-01-01", 20, "1h", rng)
+    key = ("UNITTEST/USDT", "1h", "spot")
+    cache = CandleCache()
+    assert not cache
+    assert not cache.upsert(key, to_ticks(candles), "1w", 10)
+    assert key not in cache
+
+    assert cache.upsert(key, to_ticks(candles), "1h", 10)
+    assert list(cache.keys()) == [key]
+    df = cache[key]
+    assert len(df) == 10
+    # The materialized dataframe is reused until the next update
+    assert cache[key] is df
+    assert cache.upsert(key, to_ticks(generate_candles("2024-01-01 20:00", 1, "1h", rng)), "1h", 10)
+    assert cache[key] is not df
+    assert len(cache[key]) == 10
+
+    # Assigned dataframes are returned as is
+    cache[key] = candles
+    assert cache[key] is candles
+    assert cache.get(key) is candles
+    # Gaps in assigned data - the update can't be buffered, and the cache entry is unchanged
+    cache[key] = candles.drop(index=15)
+    assert not cache.upsert(key, to_ticks(candles.iloc[-1:]), "1h", 10)
+    assert len(cache[key]) == 19
+
+    del cache[key]
+    assert key not in cache
+    assert len(cache) == 0
+
+
+def test_candle_buffer_frames_are_copies():
+    rng = np.random.default_rng(5)
+    candles = generate_candles("2024-01-01", 20, "5m", rng)
+    buffer = CandleBuffer.from_dataframe(candles.iloc[:8], "5m", 8)
+    df = buffer.to_dataframe()
+    expected = df.copy()
+    # Updates of existing candles, appends and compactions all write to the buffer arrays
+    for i in range(8, 20):
+        assert buffer.upsert(*to_arrays(candles.iloc[i - 1 : i + 1]))
+    assert_frame_equal(df, expected)
+    assert_frame_equal(buffer.to_dataframe(), candles.iloc[12:].reset_index(drop=True))
+
+
+def test_ticks_to_arrays():
+    ticks = [
+        [1704067500000, 2.0, 5.0, 1.0, 3.0, 10.0],
+        [1704067200000, 1.0, 4.0, 0.5, 2.0, 20.0],
+        [1704067500000, 9.0, 6.0, 1.5, 4.0, 5.0],
+        [1704067800000, 4.0, 4.0, 4.0, 4.0, 1.0],
+    ]
+    dates, values = ticks_to_arrays(ticks, drop_incomplete=False)
+    assert dates.tolist() == [1704067200000000000, 1704067500000000000, 1704067800000000000]
+    assert values.tolist() == [
+        [1.0, 4.0, 0.5, 2.0, 20.0],
+        [2.0, 6.0, 1.0, 4.0, 10.0],
+        [4.0, 4.0, 4.0, 4.0, 1.0],
+    ]
+    dates, values = ticks_to_arrays(ticks, drop_incomplete=True)
+    assert len(dates) == len(values) == 2
+    dates, values = ticks_to_arrays([], drop_incomplete=False)
+    assert len(dates) == len(values) == 0
+
+
+def test_candle_cache_view():
+    rng = np.random.default_rng(7)
+    key = ("UNITTEST/USDT", "1h", "spot")
+    key2 = ("UNITTEST/BTC", "1h", "spot")
+    cache = CandleCache()
+    assert cache.upsert(key, to_ticks(generate_candles("2024-01-01", 5, "1h", rng)), "1h", 10)
+    view = CandleCacheView(cache, [key, key2, key])
+    assert list(view) == [key]
+    assert len(view) == 1
+    assert view[key] is cache[key]
+    with pytest.raises(KeyError):
+        view[key2]
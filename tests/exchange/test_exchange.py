@@ -1,9 +1,11 @@
 import copy
 import logging
+from collections.abc import Mapping
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from random import randint
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from threading import Event
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import ccxt
 import pytest
@@ -11,6 +13,7 @@ from numpy import nan
 from pandas import DataFrame, to_datetime
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.history import get_datahandler
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import (
     ConfigurationError,
@@ -39,6 +42,7 @@ from freqtrade.exchange.common import (
 )
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
+from freqtrade.util.latency_metrics import LatencyMetrics
 from tests.conftest import (
     EXMS,
     generate_test_data_raw,
@@ -2500,6 +2504,32 @@ def test_refresh_latest_trades(
     caplog.clear()
 
 
+def test__store_cached_trades(mocker, default_conf, tmp_path, trades_history_df) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "feather")
+    store_mock = mocker.spy(dh, "trades_store")
+    append_mock = mocker.spy(dh, "trades_append")
+    trades = trades_history_df
+
+    exchange._store_cached_trades(dh, "ETH/BTC", TradingMode.SPOT, trades.iloc[:3])
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 0
+
+    # Only trades after the stored trades are appended
+    exchange._store_cached_trades(dh, "ETH/BTC", TradingMode.SPOT, trades.iloc[1:])
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 1
+    assert append_mock.call_args[0][1]["id"].tolist() == trades.iloc[2:]["id"].tolist()
+    stored = dh.trades_load("ETH/BTC-cached", TradingMode.SPOT)
+    assert stored["id"].tolist() == trades["id"].tolist()
+
+    # Rewritten once the stored trades are mostly aged out
+    exchange._store_cached_trades(dh, "ETH/BTC", TradingMode.SPOT, trades.iloc[-2:])
+    assert store_mock.call_count == 2
+    stored = dh.trades_load("ETH/BTC-cached", TradingMode.SPOT)
+    assert stored["id"].tolist() == trades.iloc[-2:]["id"].tolist()
+
+
 @pytest.mark.parametrize("candle_type", [CandleType.FUTURES, CandleType.MARK, CandleType.SPOT])
 def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=UTC)
@@ -2819,13 +2849,45 @@ def test_refresh_latest_ohlcv_inv_result(default_conf, mocker, caplog):
     assert exchange._klines
     assert exchange._api_async.fetch_ohlcv.call_count == 2
 
-    assert isinstance(res, dict)
+    assert isinstance(res, Mapping)
     assert len(res) == 1
     # Test that each is in list at least once as order is not guaranteed
     assert log_has("Error loading ETH/BTC. Result was [[]].", caplog)
     assert log_has("Async code raised an exception: TypeError()", caplog)
 
 
+def test_refresh_latest_ohlcv_on_batch(default_conf, mocker):
+    ohlcv = [[dt_ts(dt_now() - timedelta(minutes=5)), 1, 2, 3, 4, 5], [dt_ts(), 3, 1, 4, 6, 5]]
+    exchange = get_patched_exchange(mocker, default_conf)
+    pairs = [(f"PAIR{i}/BTC", "5m", CandleType.SPOT) for i in range(250)]
+    second_batch_started = Event()
+
+    async def fetch_ohlcv(pair, *args, **kwargs):
+        if pair == "PAIR100/BTC":
+            second_batch_started.set()
+        return ohlcv
+
+    exchange._api_async.fetch_ohlcv = MagicMock(side_effect=fetch_ohlcv)
+    batches = []
+
+    def on_batch(refreshed):
+        if refreshed == pairs[:100]:
+            # The next batch is downloaded while the first batch is processed
+            assert second_batch_started.wait(10)
+        batches.append(refreshed)
+
+    res = exchange.refresh_latest_ohlcv(pairs, on_batch=on_batch)
+    assert len(res) == 250
+    # Batches are refreshed in order of the pairlist
+    assert batches == [pairs[:100], pairs[100:200], pairs[200:]]
+
+    # Cached pairs are passed to the callback right away
+    batches.clear()
+    res = exchange.refresh_latest_ohlcv(pairs[:5], on_batch=on_batch)
+    assert len(res) == 5
+    assert batches == [pairs[:5]]
+
+
 def test_get_next_limit_in_list():
     limit_range = [5, 10, 20, 50, 100, 500, 1000]
     assert Exchange.get_next_limit_in_list(1, limit_range) == 5
@@ -3884,6 +3946,88 @@ def test_fetch_order_emulated(default_conf, mocker, exchange_name, caplog):
     )
 
 
+def test_refresh_order_snapshot(default_conf, mocker, caplog):
+    default_conf["dry_run"] = False
+    default_conf["exchange"]["bulk_order_polling"] = True
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    api_mock = MagicMock()
+    open_orders = [
+        {"id": "1", "symbol": "ETH/BTC", "status": "open", "amount": 2},
+        {"id": "2", "symbol": "LTC/BTC", "status": "open", "amount": 3},
+        {"id": "99", "symbol": "XRP/BTC", "status": "open", "amount": 4},
+    ]
+    api_mock.fetch_open_orders = MagicMock(
+        side_effect=lambda pair: [o for o in open_orders if pair in (None, o["symbol"])]
+    )
+    api_mock.fetch_order = MagicMock(return_value={"id": "3", "status": "closed"})
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="gate")
+    assert exchange._ft_has["fetch_open_orders_all_pairs"] is True
+    orders = [("1", "ETH/BTC"), ("2", "LTC/BTC"), ("3", "LTC/BTC")]
+
+    exchange.refresh_order_snapshot(orders)
+    # One request for all pairs
+    api_mock.fetch_open_orders.assert_called_once_with(None)
+    assert exchange.fetch_order("1", "ETH/BTC")["amount"] == 2
+    assert exchange.fetch_order("2", "LTC/BTC")["amount"] == 3
+    assert api_mock.fetch_order.call_count == 0
+    # Orders not open anymore are fetched individually
+    assert exchange.fetch_order("3", "LTC/BTC")["status"] == "closed"
+    assert api_mock.fetch_order.call_count == 1
+    # Snapshot entries are served once
+    exchange.fetch_order("1", "ETH/BTC")
+    assert api_mock.fetch_order.call_count == 2
+
+    # Cancelled orders are not served from the snapshot
+    exchange.refresh_order_snapshot(orders)
+    exchange.cancel_order("1", "ETH/BTC")
+    exchange.fetch_order("1", "ETH/BTC")
+    assert api_mock.fetch_order.call_count == 3
+
+    # Exchanges requiring a pair fall back to one request per pair - and stay there
+    def fetch_open_orders(pair):
+        if pair is None:
+            raise ccxt.ArgumentsRequired("symbol required")
+        return [o for o in open_orders if o["symbol"] == pair]
+
+    api_mock.fetch_open_orders = MagicMock(side_effect=fetch_open_orders)
+    exchange.refresh_order_snapshot(orders)
+    assert log_has_re(r"Fetching open orders of all pairs at once is not supported.*", caplog)
+    assert set(exchange._order_snapshot) == {"2"}
+    assert api_mock.fetch_open_orders.call_args_list == [call(None), call("LTC/BTC")]
+    api_mock.fetch_open_orders.reset_mock()
+    exchange.refresh_order_snapshot(orders)
+    assert api_mock.fetch_open_orders.call_args_list == [call("LTC/BTC")]
+    assert exchange._bulk_order_polling
+    exchange.clear_order_snapshot()
+    assert exchange._order_snapshot == {}
+
+    # One request per pair with multiple open orders
+    api_mock.fetch_open_orders.reset_mock()
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="binance")
+    exchange.refresh_order_snapshot(orders)
+    api_mock.fetch_open_orders.assert_called_once_with("LTC/BTC")
+    assert set(exchange._order_snapshot) == {"2"}
+
+    # Single orders are fetched individually
+    api_mock.fetch_open_orders.reset_mock()
+    exchange.refresh_order_snapshot(orders[:1])
+    assert api_mock.fetch_open_orders.call_count == 0
+    assert exchange._order_snapshot == {}
+
+    api_mock.fetch_open_orders = MagicMock(side_effect=ccxt.NetworkError("timeout"))
+    exchange.refresh_order_snapshot(orders)
+    assert exchange._order_snapshot == {}
+    assert log_has_re(r"Could not fetch open orders in bulk.*", caplog)
+    assert exchange._bulk_order_polling
+
+    api_mock.fetch_open_orders = MagicMock(side_effect=ccxt.NotSupported("not supported"))
+    exchange.refresh_order_snapshot(orders)
+    assert log_has_re(r"Fetching open orders in bulk is not supported.*", caplog)
+    assert not exchange._bulk_order_polling
+    exchange.refresh_order_snapshot(orders)
+    assert api_mock.fetch_open_orders.call_count == 1
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_stoploss_order(default_conf, mocker, exchange_name):
@@ -4785,6 +4929,25 @@ def test_calculate_backoff(retrycount, max_retries, expected):
     assert calculate_backoff(retrycount, max_retries) == expected
 
 
+async def test_retrier_latency_metrics(default_conf, mocker):
+    metrics = LatencyMetrics()
+    mocker.patch("freqtrade.exchange.common.latency_registry", metrics)
+    mocker.patch("freqtrade.exchange.common.time.sleep")
+    default_conf["dry_run"] = False
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    api_mock = MagicMock()
+    api_mock.fetch_order = MagicMock(side_effect=[ccxt.NetworkError("timeout"), {"id": "123"}])
+    api_mock.fetch_ohlcv = get_mock_coro([])
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+
+    assert exchange.fetch_order("123", "ETH/BTC") == {"id": "123"}
+    await exchange._async_get_candle_history("ETH/BTC", "5m", CandleType.SPOT)
+    endpoints = metrics.snapshot()["exchange"]
+    # Each attempt is recorded
+    assert endpoints["fetch_order"]["count"] == 2
+    assert endpoints["_async_get_candle_history"]["count"] == 1
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_get_funding_fees(default_conf_usdt, mocker, exchange_name, caplog):
     now = datetime.now(UTC)
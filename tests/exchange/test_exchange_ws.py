@@ -32,6 +32,36 @@ def test_exchangews_init(mocker):
     exchange_ws.cleanup()
 
 
+def test_exchangews_wait_for_candles(mocker):
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+    exchange_ws = ExchangeWS(MagicMock(), MagicMock())
+    try:
+        eth = ("ETH/BTC", "5m", CandleType.SPOT)
+        xrp = ("XRP/BTC", "5m", CandleType.SPOT)
+        # Nothing watched
+        assert exchange_ws.wait_for_candles("5m", 2000, timeout=0.01) is False
+
+        exchange_ws._klines_watching.update({eth, xrp, ("ETH/BTC", "1h", CandleType.SPOT)})
+        exchange_ws.klines_last_candle[eth] = 2000
+        exchange_ws.klines_last_candle[xrp] = 1000
+        assert exchange_ws.wait_for_candles("5m", 2000, timeout=0.01) is False
+        assert exchange_ws.wait_for_candles("5m", 1000, timeout=0.01) is True
+
+        def receive_candle():
+            sleep(0.1)
+            with exchange_ws._klines_received:
+                exchange_ws.klines_last_candle[xrp] = 2000
+                exchange_ws._klines_received.notify_all()
+
+        threading.Thread(target=receive_candle).start()
+        assert exchange_ws.wait_for_candles("5m", 2000, timeout=5) is True
+
+        exchange_ws._pop_history(xrp)
+        assert xrp not in exchange_ws.klines_last_candle
+    finally:
+        exchange_ws.cleanup()
+
+
 def test_exchangews_cleanup_error(mocker, caplog):
     config = MagicMock()
     ccxt_object = MagicMock()
@@ -121,6 +151,7 @@ async def test_exchangews_ohlcv(mocker, time_machine, caplog):
         # Wait for the expected number of watch calls
         await wait_for_condition(lambda: ccxt_object.watch_ohlcv.call_count >= 6, timeout_=3.0)
         assert ccxt_object.watch_ohlcv.call_count >= 6
+        assert set(exchange_ws.klines_last_candle) == exchange_ws._klines_watching
         ccxt_object.watch_ohlcv.reset_mock()
 
         time_machine.shift(timedelta(minutes=5))
@@ -34,6 +34,7 @@ from freqtrade.freqtradebot import FreqtradeBot
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.plugins.protections.iprotection import ProtectionReturn
 from freqtrade.util.datetime_helpers import dt_now, dt_utc
+from freqtrade.util.latency_metrics import LatencyMetrics
 from freqtrade.worker import Worker
 from tests.conftest import (
     EXMS,
@@ -635,6 +636,49 @@ def test_process_trade_creation(
     assert pytest.approx(trade.amount) == limit_order[entry_side(is_short)]["filled"]
 
 
+def test_process_latency_metrics(
+    default_conf_usdt, ticker_usdt, limit_order_open, fee, mocker
+) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        EXMS,
+        fetch_ticker=ticker_usdt,
+        create_order=MagicMock(return_value=limit_order_open["buy"]),
+        get_fee=fee,
+    )
+    metrics = LatencyMetrics()
+    mocker.patch("freqtrade.freqtradebot.latency_registry", metrics)
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    patch_get_signal(freqtrade)
+
+    freqtrade.process()
+    phases = metrics.snapshot()["process"]
+    assert set(phases) == {
+        "reload_markets",
+        "update_fees",
+        "refresh_whitelist",
+        "refresh_candles",
+        "analyze",
+        "manage_orders",
+        "exit_positions",
+        "enter_positions",
+        "commit",
+        "total",
+    }
+    assert all(phase["count"] == 1 for phase in phases.values())
+    assert phases["total"]["sum"] >= phases["analyze"]["sum"]
+
+    # No free slots - entries are skipped
+    freqtrade.config["max_open_trades"] = 1
+    freqtrade.strategy.position_adjustment_enable = True
+    freqtrade.process()
+    phases = metrics.snapshot()["process"]
+    assert phases["enter_positions"]["count"] == 1
+    assert phases["adjust_positions"]["count"] == 1
+    assert phases["total"]["count"] == 2
+
+
 def test_process_exchange_failures(default_conf_usdt, ticker_usdt, mocker) -> None:
     # TODO: Move this test to test_worker
     patch_RPCManager(mocker)
@@ -786,6 +830,63 @@ def test_process_informative_pairs_added(default_conf_usdt, ticker_usdt, mocker)
     ][0]
 
 
+def test_process_pipelined_analysis(default_conf_usdt, ticker_usdt, mocker, caplog) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    default_conf_usdt["internals"] = {"pipelined_analysis": True}
+    tf = default_conf_usdt["timeframe"]
+    inf_pair = ("BTC/USDT", "1h", CandleType.SPOT)
+    calls = []
+
+    def refresh_latest_ohlcv(pair_list, on_batch):
+        calls.append(("refresh", list(pair_list)))
+        # Informative pairs are refreshed first
+        assert pair_list.index(inf_pair) < pair_list.index(("ETH/USDT", tf, CandleType.SPOT))
+        on_batch([("ETH/USDT", tf, CandleType.SPOT)])
+        # Waiting for informative pairs
+        on_batch([inf_pair, ("XRP/USDT", tf, CandleType.SPOT)])
+        on_batch([("NEO/USDT", tf, CandleType.SPOT)])
+
+    mocker.patch.multiple(
+        EXMS,
+        fetch_ticker=ticker_usdt,
+        create_order=MagicMock(side_effect=TemporaryError),
+        refresh_latest_ohlcv=MagicMock(side_effect=refresh_latest_ohlcv),
+    )
+    mocker.patch("time.sleep", return_value=None)
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    whitelist = ["ETH/USDT", "XRP/USDT", "NEO/USDT", "TKN/USDT"]
+    mocker.patch.object(freqtrade, "_refresh_active_whitelist", return_value=whitelist)
+    freqtrade.strategy.informative_pairs = MagicMock(return_value=[inf_pair])
+    mocker.patch.object(
+        freqtrade.strategy, "analyze", side_effect=lambda pairs: calls.append(("analyze", pairs))
+    )
+
+    measure_execution = MagicMock()
+    freqtrade._measure_execution = measure_execution
+
+    freqtrade.process()
+    assert calls[0][0] == "refresh"
+    assert calls[1:] == [
+        ("analyze", ["ETH/USDT", "XRP/USDT"]),
+        ("analyze", ["NEO/USDT"]),
+        # Pairs which were not refreshed
+        ("analyze", ["TKN/USDT"]),
+    ]
+    # Only the analysis is checked against the time limit - not the refresh
+    assert measure_execution.__enter__.call_count == 0
+    assert measure_execution.check.call_count == 1
+
+    # Informative pairs which are not refreshed hold back analysis until the end
+    calls.clear()
+    freqtrade.strategy.informative_pairs = MagicMock(
+        return_value=[inf_pair, ("BTC/USDT", "4h", CandleType.SPOT)]
+    )
+    freqtrade.process()
+    assert calls[1:] == [("analyze", whitelist)]
+    assert log_has_re(r"Informative pairs .*4h.* were not refreshed.*", caplog)
+
+
 @pytest.mark.parametrize(
     "is_short,trading_mode,exchange_name,margin_mode,liq_buffer,liq_price",
     [
@@ -1843,6 +1944,36 @@ def test_manage_open_orders_entry_usercustom(
     assert freqtrade.strategy.check_entry_timeout.call_count == 1
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_manage_open_orders_order_snapshot(default_conf_usdt, fee, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    refresh_mock = mocker.patch(f"{EXMS}.refresh_order_snapshot")
+    clear_mock = mocker.patch(f"{EXMS}.clear_order_snapshot")
+    fetch_order_mock = mocker.patch(f"{EXMS}.fetch_order", side_effect=ExchangeError)
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    create_mock_trades_usdt(fee)
+    open_orders = [
+        (order.order_id, trade.pair)
+        for trade in Trade.get_open_trades()
+        for order in trade.open_orders
+    ]
+    assert len(open_orders) > 1
+
+    freqtrade.manage_open_orders()
+    # Open orders are fetched in bulk before they are fetched one by one
+    refresh_mock.assert_called_once_with(open_orders)
+    assert fetch_order_mock.call_count == len(open_orders)
+    assert clear_mock.call_count == 1
+
+    # Unused snapshot entries are dropped, also if managing orders fails
+    fetch_order_mock.side_effect = None
+    mocker.patch.object(freqtrade, "update_trade_state", side_effect=ValueError("failed"))
+    with pytest.raises(ValueError, match="failed"):
+        freqtrade.manage_open_orders()
+    assert clear_mock.call_count == 2
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_manage_open_orders_entry(
     default_conf_usdt,
@@ -200,6 +200,36 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+def test_throttle_candle_close_wakeup(mocker, default_conf) -> None:
+    default_conf["internals"] = {"candle_close_wakeup": True}
+    worker = get_patched_worker(mocker, default_conf)
+    sleep_mock = mocker.patch("freqtrade.worker.Worker._sleep")
+    wait_mock = mocker.patch(f"{EXMS}.wait_for_ws_candles", return_value=True)
+    candle_ts = 1662008700000  # 2022-09-01 05:05:00
+    with time_machine.travel("2022-09-01 05:04:58 +00:00", tick=False):
+        assert worker._throttle(lambda: 42, throttle_secs=10, timeframe="5m") == 42
+        # Sleep until the candle starts, then wait for the candles to arrive
+        assert sleep_mock.call_count == 1
+        assert sleep_mock.call_args[0][0] == pytest.approx(2)
+        assert wait_mock.call_count == 1
+        assert wait_mock.call_args[0][:2] == ("5m", candle_ts)
+        assert wait_mock.call_args[1]["timeout"] == pytest.approx(3)
+
+        # Candles didn't arrive in time - sleep for the remaining time
+        sleep_mock.reset_mock()
+        wait_mock.return_value = False
+        assert worker._throttle(lambda: 42, throttle_secs=10, timeframe="5m") == 42
+        assert sleep_mock.call_count == 2
+
+    # Not sleeping until the next candle
+    sleep_mock.reset_mock()
+    wait_mock.reset_mock()
+    with time_machine.travel("2022-09-01 05:02:00 +00:00", tick=False):
+        assert worker._throttle(lambda: 42, throttle_secs=10, timeframe="5m") == 42
+    assert sleep_mock.call_count == 1
+    assert wait_mock.call_count == 0
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
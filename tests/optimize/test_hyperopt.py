@@ -7,13 +7,19 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib import dump as joblib_dump
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt import Hyperopt, hyperopt_optimizer
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_cache import (
+    get_data_fingerprint,
+    get_hyperopt_cache_fingerprint,
+)
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
@@ -583,7 +589,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load",
+        return_value={"XRP/BTC": pd.DataFrame()},
     )
 
     optimizer_param = {
@@ -641,6 +648,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         "params_not_optimized": {"buy": {}, "protection": {}, "sell": {}},
         "results_metrics": ANY,
         "total_profit": 3.1e-08,
+        "resource_usage": ANY,
     }
 
     hyperopt = Hyperopt(hyperopt_conf)
@@ -649,6 +657,31 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     hyperopt.hyperopter.init_spaces()
     generate_optimizer_value = hyperopt.hyperopter.generate_optimizer(optimizer_param)
     assert generate_optimizer_value == response_expected
+    assert generate_optimizer_value["resource_usage"]["trade_count"] == 4
+    assert generate_optimizer_value["resource_usage"]["wall_time"] >= 0
+
+
+def test_load_processed_data(mocker, hyperopt, tmp_path, testdatadir) -> None:
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"], fill_up_missing=True)
+    opt = hyperopt.hyperopter
+    opt.data_pickle_file = tmp_path / "hyperopt_tickerdata.pkl"
+    joblib_dump(data, opt.data_pickle_file)
+    load_mock = mocker.spy(hyperopt_optimizer, "load")
+
+    processed = opt.load_processed_data()
+    assert load_mock.call_count == 1
+    pd.testing.assert_frame_equal(processed["UNITTEST/BTC"], data["UNITTEST/BTC"])
+    # Columns added in one epoch must not leak into the next epoch
+    processed["UNITTEST/BTC"]["enter_long"] = 1
+
+    processed = opt.load_processed_data()
+    assert load_mock.call_count == 1
+    assert "enter_long" not in processed["UNITTEST/BTC"].columns
+
+    # New data generation reloads the data
+    opt.data_generation = "new_generation"
+    opt.load_processed_data()
+    assert load_mock.call_count == 2
 
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
@@ -1131,6 +1164,144 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
         opt.get_optimizer(42)
 
 
+def test_in_strategy_auto_hyperopt_result_cache(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 3,
+            "hyperopt_cache": True,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    gen_spy = mocker.spy(hyperopt.hyperopter, "generate_optimizer")
+    hyperopt.start()
+    assert gen_spy.call_count == 3
+    assert hyperopt.result_cache is not None
+    assert len(hyperopt.result_cache) == 3
+    assert hyperopt.result_cache.hits == 0
+    cache_files = list((tmp_path / "hyperopt_results" / "hyperopt_cache").glob("*.jsonl"))
+    assert len(cache_files) == 1
+
+    # Identical setup - all points are served from the cache
+    hyperopt_conf["epochs"] = 3
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    gen_spy = mocker.spy(hyperopt.hyperopter, "generate_optimizer")
+    hyperopt.start()
+    assert gen_spy.call_count == 0
+    assert hyperopt.result_cache.hits == 3
+    assert hyperopt.num_epochs_saved == 3
+    assert hyperopt.current_best_epoch is not None
+    assert len(hyperopt.opt.get_trials(states=[TrialState.COMPLETE])) == 3
+
+
+def test_hyperopt_cache_fingerprint(tmp_path) -> None:
+    strategy_file = tmp_path / "strategy.py"
+    strategy_file.write_text("class MyStrategy: ...")
+    loss_file = tmp_path / "loss.py"
+    loss_file.write_text("class MyLoss: ...")
+    strategy = MagicMock(config={"timeframe": "5m"}, _ft_params_from_file={})
+    strategy.__file__ = str(strategy_file)
+    loss = MagicMock()
+    loss.__file__ = str(loss_file)
+
+    fingerprint = get_hyperopt_cache_fingerprint(strategy, loss, "data")
+    assert get_hyperopt_cache_fingerprint(strategy, loss, "data") == fingerprint
+    # Changes to the hyperopt loss invalidate cached results
+    loss_file.write_text("class MyLoss: pass")
+    assert get_hyperopt_cache_fingerprint(strategy, loss, "data") != fingerprint
+
+    candles = pd.DataFrame({"date": [1, 2, 3], "close": [1.0, 2.0, 3.0]})
+    data_fingerprint = get_data_fingerprint({"ETH/BTC": candles})
+    assert get_data_fingerprint({"ETH/BTC": candles.copy()}) == data_fingerprint
+    # Same candles in a different order
+    reordered = candles.iloc[[1, 0, 2]].reset_index(drop=True)
+    assert get_data_fingerprint({"ETH/BTC": reordered}) != data_fingerprint
+
+
+def test_in_strategy_auto_hyperopt_resume(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 3,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.start()
+    results_file = hyperopt.results_file
+    best_loss = hyperopt.current_best_loss
+
+    hyperopt_conf.update(
+        {"epochs": 2, "hyperopt_random_state": 43, "hyperopt_resume": results_file.name}
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.results_file == results_file
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.start()
+    assert hyperopt.resumed_epochs == 3
+    assert hyperopt.num_epochs_saved == 2
+    assert hyperopt.current_best_loss <= best_loss
+    assert len(hyperopt.opt.get_trials(states=[TrialState.COMPLETE])) == 5
+    epochs, total = HyperoptTools.load_filtered_results(results_file, hyperopt_conf)
+    assert total == 5
+    assert [e["current_epoch"] for e in epochs] == [1, 2, 3, 4, 5]
+
+    # Different spaces can't be resumed
+    hyperopt_conf.update({"spaces": ["sell"]})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    with pytest.raises(OperationalException, match=r"was created with different spaces\."):
+        hyperopt.start()
+
+    hyperopt_conf.update({"hyperopt_resume": "nonexisting.fthypt"})
+    with pytest.raises(OperationalException, match=r"to resume not found\."):
+        Hyperopt(hyperopt_conf)
+
+
+def test_check_recycle_workers(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    executor = MagicMock()
+    get_executor = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt.get_reusable_executor", return_value=executor
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    should_recycle = mocker.patch.object(
+        hyperopt.resource_monitor, "should_recycle", return_value=False
+    )
+    parallel = MagicMock()
+
+    hyperopt.check_recycle_workers(parallel, 2)
+    assert executor.shutdown.call_count == 0
+
+    should_recycle.return_value = True
+    # Epochs run in the main process
+    hyperopt.check_recycle_workers(parallel, 1)
+    assert executor.shutdown.call_count == 0
+
+    hyperopt.check_recycle_workers(parallel, 2)
+    get_executor.assert_called_once_with(reuse=True)
+    executor.shutdown.assert_called_once_with(wait=True)
+    parallel.__exit__.assert_called_once_with(None, None, None)
+    parallel.__enter__.assert_called_once()
+    assert hyperopt.resource_monitor.recycles == 1
+
+
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
 def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path, fee) -> None:
     mocker.patch(f"{EXMS}.validate_config", MagicMock())
@@ -1177,6 +1348,39 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     hyperopt.start()
 
 
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_in_strategy_auto_hyperopt_worker_recycling(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 4,
+            "hyperopt_jobs": 2,
+            "hyperopt_worker_max_epochs": 1,
+            "fee": fee.return_value,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+
+    hyperopt.start()
+    assert hyperopt.resource_monitor.epochs == 4
+    # Workers are recycled after each batch
+    assert hyperopt.resource_monitor.recycles >= 1
+
+
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
     mocker.patch(f"{EXMS}.get_fee", fee)
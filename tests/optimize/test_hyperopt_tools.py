@@ -8,6 +8,13 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt.hyperopt_resources import (
+    MB,
+    HyperoptResourceMonitor,
+    ResourceSnapshot,
+    get_peak_rss,
+    get_resource_usage,
+)
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -292,6 +299,15 @@ def test_show_epoch_details(capsys):
         "total_profit": 0,
         "current_epoch": 2,  # This starts from 1 (in a human-friendly manner)
         "is_best": True,
+        "resource_usage": {
+            "pid": 1234,
+            "wall_time": 1.5,
+            "cpu_time": 1.25,
+            "rss": 200 * 1024 * 1024,
+            "peak_rss": 210 * 1024 * 1024,
+            "peak_rss_delta": 12 * 1024 * 1024,
+            "trade_count": 15,
+        },
     }
 
     HyperoptTools.show_epoch_details(test_result, 5, False, no_header=True)
@@ -307,6 +323,12 @@ def test_show_epoch_details(capsys):
     assert re.search(r"^\s+minimal_roi = \{$", captured.out, re.MULTILINE)
     assert re.search(r"^\s+\"90\"\:\s0.14,\s*$", captured.out, re.MULTILINE)
 
+    assert "# Resource usage:" in captured.out
+    assert (
+        "wall_time = 1.50s, cpu_time = 1.25s, rss = 200 MB (peak +12.0 MB), trades = 15"
+        in captured.out
+    )
+
 
 def test__pprint_dict():
     params = {"buy_std": 1.2, "buy_rsi": 31, "buy_enable": True, "buy_what": "asdf"}
@@ -470,3 +492,48 @@ def test_hyperopt_serializer():
     assert isinstance(hyperopt_serializer(np.int_(5)), int)
     assert isinstance(hyperopt_serializer(np.bool_(True)), bool)
     assert isinstance(hyperopt_serializer(np.bool_(False)), bool)
+
+
+def test_get_resource_usage(mocker):
+    start = ResourceSnapshot(wall_time=1.0, cpu_time=0.5, rss=50 * MB, peak_rss=80 * MB)
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_resources.get_resource_snapshot",
+        return_value=ResourceSnapshot(wall_time=3.0, cpu_time=1.5, rss=60 * MB, peak_rss=90 * MB),
+    )
+    usage = get_resource_usage(start, 5)
+    assert usage["wall_time"] == 2.0
+    assert usage["cpu_time"] == 1.0
+    assert usage["rss"] == 60 * MB
+    # Memory used (and released) during the epoch is included
+    assert usage["peak_rss_delta"] == 40 * MB
+    assert usage["trade_count"] == 5
+
+    assert get_peak_rss() > 0
+
+
+def test_hyperopt_resource_monitor(caplog):
+    monitor = HyperoptResourceMonitor({"hyperopt_worker_max_rss": 100})
+    usage = {"pid": 1, "wall_time": 2.0, "cpu_time": 1.0, "rss": 50 * MB, "trade_count": 5}
+    monitor.add(usage)
+    # Cached results don't have resource usage
+    monitor.add(None)
+    assert monitor.epochs == 1
+    assert not monitor.should_recycle()
+
+    monitor.add({**usage, "rss": 120 * MB})
+    assert monitor.epochs == 2
+    assert monitor.max_rss_growth == 70 * MB
+    assert monitor.should_recycle()
+    assert log_has("Worker 1 is using 120 MB, recycling workers.", caplog)
+    monitor.workers_recycled()
+    assert not monitor.should_recycle()
+
+    monitor.log_summary()
+    assert log_has_re(r"Resource usage: 2 epochs measured, avg wall time 2\.00s.*", caplog)
+    assert log_has_re(r".*max memory growth per worker 70 MB, 1 worker recycle\.", caplog)
+
+    monitor = HyperoptResourceMonitor({"hyperopt_worker_max_epochs": 2})
+    monitor.add(usage)
+    assert not monitor.should_recycle()
+    monitor.add(usage)
+    assert monitor.should_recycle()
@@ -1,9 +1,19 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from freqtrade.data.metrics import (
+    calculate_calmar,
+    calculate_expectancy,
+    calculate_max_drawdown,
+    calculate_sharpe,
+    calculate_sortino,
+)
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt import HyperoptLossMetrics
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_short_trade_dur import ShortTradeDurHyperOptLoss
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 
@@ -238,3 +248,100 @@ def test_loss_functions_better_profits(default_conf, hyperopt_results, lossfunct
     )
     assert over < correct
     assert under > correct
+
+
+def test_hyperopt_loss_metrics(testdatadir) -> None:
+    from freqtrade.data.btanalysis import load_backtest_data
+
+    results = load_backtest_data(testdatadir / "backtest_results/backtest-result.json")
+    # Shuffle to make sure ordering by close_date is applied where necessary
+    results = results.sample(frac=1, random_state=42)
+    min_date = results["open_date"].min()
+    max_date = results["close_date"].max()
+    starting_balance = 1000
+
+    metrics = HyperoptLossMetrics(results, min_date, max_date, starting_balance)
+    assert metrics.trade_count == len(results)
+    assert pytest.approx(metrics.sharpe) == calculate_sharpe(
+        results, min_date, max_date, starting_balance
+    )
+    assert pytest.approx(metrics.sortino) == calculate_sortino(
+        results, min_date, max_date, starting_balance
+    )
+    assert pytest.approx(metrics.calmar) == calculate_calmar(
+        results, min_date, max_date, starting_balance
+    )
+    assert pytest.approx(metrics.expectancy_ratio) == calculate_expectancy(results)[1]
+    drawdown = calculate_max_drawdown(
+        results, starting_balance=starting_balance, value_col="profit_abs"
+    )
+    assert pytest.approx(metrics.max_drawdown_abs) == drawdown.drawdown_abs
+    assert pytest.approx(metrics.relative_account_drawdown) == drawdown.relative_account_drawdown
+    drawdown_rel = calculate_max_drawdown(
+        results, starting_balance=starting_balance, value_col="profit_abs", relative=True
+    )
+    assert pytest.approx(metrics.max_drawdown_relative) == drawdown_rel.relative_account_drawdown
+
+    daily = metrics.daily_profit_ratio(0.0005)
+    t_index = pd.date_range(start=min_date, end=max_date, freq="1D", normalize=True)
+    expected = (
+        results.assign(profit_ratio_after_slippage=results["profit_ratio"] - 0.0005)
+        .resample("1D", on="close_date")
+        .agg({"profit_ratio_after_slippage": "sum"})
+        .reindex(t_index)
+        .fillna(0)
+    )
+    assert np.allclose(daily, expected["profit_ratio_after_slippage"].to_numpy())
+    # Cached per slippage value
+    assert metrics.daily_profit_ratio(0.0005) is daily
+
+
+def test_hyperopt_loss_metrics_empty() -> None:
+    results = pd.DataFrame(columns=["profit_abs", "profit_ratio", "close_date"])
+    metrics = HyperoptLossMetrics(
+        results, datetime(2019, 1, 1, tzinfo=UTC), datetime(2019, 5, 1, tzinfo=UTC), 1000
+    )
+    assert metrics.sharpe == 0
+    assert metrics.sortino == 0
+    assert metrics.calmar == 0
+    assert metrics.relative_account_drawdown == 0
+    assert metrics.max_drawdown_abs == 0
+    assert metrics.winrate == 0
+    assert metrics.expectancy_ratio == 100
+    assert len(metrics.daily_profit_ratio()) == 121
+    assert metrics.daily_profit_ratio().sum() == 0
+
+
+@pytest.mark.parametrize(
+    "lossfunction",
+    [
+        "SortinoHyperOptLoss",
+        "SortinoHyperOptLossDaily",
+        "SharpeHyperOptLoss",
+        "SharpeHyperOptLossDaily",
+        "MaxDrawDownRelativeHyperOptLoss",
+        "CalmarHyperOptLoss",
+        "ProfitDrawDownHyperOptLoss",
+        "MultiMetricHyperOptLoss",
+    ],
+)
+def test_loss_functions_metrics(default_conf, hyperopt_results, lossfunction) -> None:
+    default_conf.update({"hyperopt_loss": lossfunction})
+    hl = HyperOptLossResolver.load_hyperoptloss(default_conf)
+    kwargs = {
+        "results": hyperopt_results,
+        "trade_count": len(hyperopt_results),
+        "min_date": datetime(2019, 1, 1),
+        "max_date": datetime(2019, 5, 1),
+        "config": default_conf,
+        "processed": None,
+        "backtest_stats": {"profit_total": hyperopt_results["profit_abs"].sum()},
+        "starting_balance": default_conf["dry_run_wallet"],
+    }
+    metrics = HyperoptLossMetrics(
+        hyperopt_results, kwargs["min_date"], kwargs["max_date"], kwargs["starting_balance"]
+    )
+    # Results are identical with and without a shared metrics object
+    assert pytest.approx(hl.hyperopt_loss_function(**kwargs)) == hl.hyperopt_loss_function(
+        **kwargs, metrics=metrics
+    )
@@ -31,6 +31,7 @@ from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.util.datetime_helpers import format_date
+from freqtrade.util.latency_metrics import LatencyMetrics
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
@@ -3117,6 +3118,31 @@ def test_health(botclient):
     assert ret["last_process"] is None
 
 
+def test_api_metrics(botclient, mocker):
+    _ftbot, client = botclient
+    metrics = LatencyMetrics()
+    mocker.patch("freqtrade.rpc.rpc.latency_registry", metrics)
+
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert_response(rc)
+    assert rc.json() == {"process": {}, "exchange": {}}
+
+    metrics.observe("process", "analyze", 0.2)
+    metrics.observe("exchange", "fetch_order", 0.05)
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert_response(rc)
+    ret = rc.json()
+    assert ret["process"]["analyze"]["count"] == 1
+    assert ret["process"]["analyze"]["buckets"]["0.25"] == 1
+    assert ret["exchange"]["fetch_order"]["sum"] == 0.05
+
+    rc = client_get(client, f"{BASE_URI}/metrics/prometheus")
+    assert rc.status_code == 200
+    assert rc.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'freqtrade_process_latency_seconds_count{name="analyze"} 1' in rc.text
+    assert 'freqtrade_exchange_latency_seconds_sum{name="fetch_order"} 0.05' in rc.text
+
+
 def test_api_ws_subscribe(botclient, mocker):
     _ftbot, client = botclient
     ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
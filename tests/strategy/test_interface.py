@@ -1,18 +1,23 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import pickle
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pandas import DataFrame, concat
+from pandas.testing import assert_series_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitCheckTuple, ExitType, SignalDirection
+from freqtrade.enums import CandleType, ExitCheckTuple, ExitType, RunMode, SignalDirection
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
@@ -855,6 +860,112 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(mocker, testdatadir, caplog) -> None:
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC"])["UNITTEST/BTC"].iloc[:300]
+    analyzed_lengths = []
+
+    def populate_indicators(dataframe, metadata):
+        analyzed_lengths.append(len(dataframe))
+        dataframe["sma"] = dataframe["close"].rolling(10).mean()
+        dataframe["ema"] = dataframe["close"].ewm(span=50).mean()
+        return dataframe
+
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({"runmode": RunMode.DRY_RUN}, None, None)
+    strategy.incremental_lookback = 20
+    mocker.patch.object(strategy, "populate_indicators", side_effect=populate_indicators)
+    mocker.patch.object(strategy, "populate_entry_trend", side_effect=lambda df, _: df)
+    mocker.patch.object(strategy, "populate_exit_trend", side_effect=lambda df, _: df)
+
+    def analyze(end: int) -> DataFrame:
+        # Candles are aged out - as they are in live mode
+        ohlcv = data.iloc[end - 200 : end].reset_index(drop=True)
+        result = strategy._analyze_ticker_internal(ohlcv, {"pair": "UNITTEST/BTC"})
+        strategy.dp._set_cached_df("UNITTEST/BTC", "5m", result, CandleType.SPOT)
+        return result
+
+    analyze(250)
+    # 3 new candles - analyzed together with the last analyzed candle and the lookback
+    result = analyze(253)
+    assert analyzed_lengths == [200, 24]
+    assert len(result) == 200
+    assert result["date"].equals(data["date"].iloc[53:253].reset_index(drop=True))
+    full = strategy.analyze_ticker(data.iloc[53:253].reset_index(drop=True), {"pair": "a"})
+    # Candles before the startup period of the full analysis were aged out
+    assert_series_equal(result["sma"].iloc[10:], full["sma"].iloc[10:])
+    assert not np.allclose(result["ema"].iloc[10:], full["ema"].iloc[10:])
+    analyzed_lengths.clear()
+
+    # Candles not matching the previous analysis require a full analysis
+    analyze(240)
+    assert analyzed_lengths == [200]
+
+    # Validation against the full analysis
+    strategy.incremental_validation_interval = 2
+    analyzed_lengths.clear()
+    analyze(241)
+    assert analyzed_lengths == [22]
+    assert not log_has_re(r"Incremental analysis of UNITTEST/BTC differs .*", caplog)
+    result = analyze(242)
+    assert analyzed_lengths == [22, 22, 200]
+    assert log_has_re(r"Incremental analysis of UNITTEST/BTC differs .* columns ema\.", caplog)
+    full = strategy.analyze_ticker(data.iloc[42:242].reset_index(drop=True), {"pair": "a"})
+    assert_series_equal(result["ema"], full["ema"])
+
+    # Only used in dry-run / live mode
+    strategy.dp = DataProvider({"runmode": RunMode.BACKTEST}, None, None)
+    analyzed_lengths.clear()
+    analyze(243)
+    assert analyzed_lengths == [200]
+
+
+@pytest.mark.parametrize(
+    "workers,freqai,concurrent", [(1, False, False), (4, False, True), (4, True, False)]
+)
+def test_analyze_concurrent(mocker, ohlcv_history, workers, freqai, concurrent) -> None:
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC"]
+    threads = set()
+
+    def populate_indicators(dataframe, metadata):
+        threads.add(threading.current_thread().name)
+        # Later pairs finish first
+        time.sleep(0.01 * (len(pairs) - pairs.index(metadata["pair"])))
+        dataframe["pair_idx"] = pairs.index(metadata["pair"])
+        return dataframe
+
+    strategy = StrategyTestV3(
+        {"internals": {"analysis_workers": workers}, "freqai": {"enabled": freqai}}
+    )
+    strategy.dp = DataProvider({"runmode": RunMode.DRY_RUN}, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", side_effect=lambda *_, **__: ohlcv_history.copy())
+    set_cached_mock = mocker.spy(strategy.dp, "_set_cached_df")
+    mocker.patch.object(strategy, "populate_indicators", side_effect=populate_indicators)
+    mocker.patch.object(strategy, "populate_entry_trend", side_effect=lambda df, _: df)
+    mocker.patch.object(strategy, "populate_exit_trend", side_effect=lambda df, _: df)
+
+    strategy.analyze(pairs)
+    # Analyzed dataframes are stored in order of the pairs, from the calling thread
+    assert [c.args[0] for c in set_cached_mock.call_args_list] == pairs
+    for idx, pair in enumerate(pairs):
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert (df["pair_idx"] == idx).all()
+    if not concurrent:
+        # FreqAI state is shared between pairs - analysis stays sequential
+        assert threads == {threading.current_thread().name}
+    else:
+        assert len(threads) > 1
+        assert all(name.startswith("ft-analyze") for name in threads)
+
+
+def test_analyze_concurrent_pickle(default_conf) -> None:
+    # Strategies are pickled to hyperopt workers
+    default_conf["internals"] = {"analysis_workers": 4}
+    strategy = StrategyTestV3(default_conf)
+    strategy = pickle.loads(pickle.dumps(strategy))  # noqa: S301
+    assert isinstance(strategy, StrategyTestV3)
+    assert strategy.config["internals"]["analysis_workers"] == 4
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
@@ -0,0 +1,48 @@
+import pytest
+
+import freqtrade.util.latency_metrics as latency_module
+from freqtrade.util import latency_registry
+from freqtrade.util.latency_metrics import LatencyMetrics
+
+
+def test_latency_metrics():
+    metrics = LatencyMetrics()
+    assert metrics.snapshot() == {}
+    assert metrics.to_prometheus() == ""
+
+    metrics.observe("process", "analyze", 0.003)
+    metrics.observe("process", "analyze", 0.7)
+    metrics.observe("process", "analyze", 120)
+    with pytest.raises(ValueError, match="failed"), metrics.measure("exchange", "fetch_order"):
+        raise ValueError("failed")
+
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ["exchange", "process"]
+    assert snapshot["exchange"]["fetch_order"]["count"] == 1
+    analyze = snapshot["process"]["analyze"]
+    assert analyze["count"] == 3
+    assert analyze["sum"] == 120.703
+    assert analyze["max"] == 120
+    assert analyze["last"] == 120
+    assert analyze["avg"] == pytest.approx(40.234333)
+    assert analyze["buckets"]["0.005"] == 1
+    assert analyze["buckets"]["0.5"] == 1
+    assert analyze["buckets"]["1.0"] == 2
+    assert analyze["buckets"]["60.0"] == 2
+    assert analyze["buckets"]["+Inf"] == 3
+
+    text = metrics.to_prometheus()
+    assert "# TYPE freqtrade_process_latency_seconds histogram\n" in text
+    assert 'freqtrade_process_latency_seconds_bucket{name="analyze",le="1.0"} 2\n' in text
+    assert 'freqtrade_process_latency_seconds_bucket{name="analyze",le="+Inf"} 3\n' in text
+    assert 'freqtrade_process_latency_seconds_count{name="analyze"} 3\n' in text
+    assert 'freqtrade_exchange_latency_seconds_count{name="fetch_order"} 1\n' in text
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_latency_registry():
+    # The registry doesn't shadow its module
+    assert isinstance(latency_registry, LatencyMetrics)
+    assert latency_module.latency_registry is latency_registry
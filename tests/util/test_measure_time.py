@@ -30,3 +30,15 @@ def test_measure_time():
         with measure:
             t.shift(10)
         assert callback.call_count == 1
+
+
+def test_measure_time_check():
+    callback = MagicMock()
+    measure = MeasureTime(callback, 5, ttl=60)
+    measure.check(4.0)
+    assert callback.call_count == 0
+    measure.check(6.0)
+    callback.assert_called_once_with(6.0, 5)
+    # Not called again within the ttl
+    measure.check(6.0)
+    assert callback.call_count == 1